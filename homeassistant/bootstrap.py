@@ -28,6 +28,7 @@ from homeassistant.setup import (
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
+from homeassistant.util.import_profiler import ImportProfiler
 from homeassistant.util.logging import async_activate_log_queue_handler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
 from homeassistant.util.yaml import clear_secret_cache
@@ -38,6 +39,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+IMPORT_PROFILE_FILENAME = "import-profile.txt"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -101,6 +103,11 @@ async def async_setup_hass(
 
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
+    profiler = None
+    if runtime_config.profile_imports:
+        profiler = ImportProfiler()
+        profiler.start()
+
     config_dict = None
     basic_setup_success = False
     safe_mode = runtime_config.safe_mode
@@ -165,6 +172,12 @@ async def async_setup_hass(
             hass,
         )
 
+    if profiler is not None:
+        profiler.stop()
+        report_path = hass.config.path(IMPORT_PROFILE_FILENAME)
+        await hass.async_add_executor_job(profiler.write_report, report_path)
+        _LOGGER.info("Wrote the import profile to %s", report_path)
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
@@ -440,17 +453,10 @@ async def _async_set_up_integrations(
         old_to_resolve = to_resolve
         to_resolve = set()
 
-        integrations_to_process = [
-            int_or_exc
-            for int_or_exc in await asyncio.gather(
-                *(
-                    loader.async_get_integration(hass, domain)
-                    for domain in old_to_resolve
-                ),
-                return_exceptions=True,
-            )
-            if isinstance(int_or_exc, loader.Integration)
-        ]
+        # The dependencies are resolved together, from the manifest index
+        integrations_to_process = list(
+            (await loader.async_get_integrations(hass, old_to_resolve)).values()
+        )
         resolve_dependencies_tasks = [
             itg.resolve_dependencies()
             for itg in integrations_to_process
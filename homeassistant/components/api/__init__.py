@@ -118,7 +118,11 @@ class APIEventStream(HomeAssistantView):
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
                 data = stop_obj
             else:
-                data = json.dumps(event, cls=JSONEncoder)
+                try:
+                    data = event.as_json()
+                except ValueError:
+                    # The stream allows NaN, which the shared JSON doesn't
+                    data = json.dumps(event, cls=JSONEncoder)
 
             await to_write.put(data)
 
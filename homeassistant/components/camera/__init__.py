@@ -40,7 +40,7 @@ from homeassistant.const import (
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
 )
-from homeassistant.core import callback
+from homeassistant.core import POOL_IO, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import (  # noqa: F401
@@ -384,7 +384,7 @@ class Camera(Entity):
 
     async def async_camera_image(self):
         """Return bytes of camera image."""
-        return await self.hass.async_add_executor_job(self.camera_image)
+        return await self.hass.async_add_executor_job(self.camera_image, pool=POOL_IO)
 
     async def handle_async_still_stream(self, request, interval):
         """Generate an HTTP MJPEG stream from camera images."""
@@ -668,7 +668,9 @@ async def async_handle_snapshot_service(camera, service):
             img_file.write(image_data)
 
     try:
-        await hass.async_add_executor_job(_write_image, snapshot_file, image)
+        await hass.async_add_executor_job(
+            _write_image, snapshot_file, image, pool=POOL_IO
+        )
     except OSError as err:
         _LOGGER.error("Can't write image to file: %s", err)
 
@@ -1,4 +1,5 @@
 """Provide pre-made queries on top of the recorder component."""
+import asyncio
 from collections import defaultdict
 from datetime import timedelta
 from itertools import groupby
@@ -8,6 +9,7 @@ import time
 from typing import Optional, cast
 
 from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
 from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 import voluptuous as vol
@@ -15,20 +17,29 @@ import voluptuous as vol
 from homeassistant.components import recorder
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
+from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
+    STATISTICS_PERIODS,
+    statistics_during_period,
+)
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.const import (
     CONF_DOMAINS,
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
     HTTP_BAD_REQUEST,
 )
 from homeassistant.core import Context, State, split_entity_id
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -81,13 +92,30 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    # States recorded before the state_attributes table
+    # existed store their attributes in the states table
+    func.coalesce(StateAttributes.shared_attrs, States.attributes).label("attributes"),
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "history_bakery"
 
+# Streamed responses are written in chunks of this size
+STREAM_CHUNK_SIZE = 65536
+# Number of rows fetched from the cursor at a time when streaming
+STREAM_YIELD_PER = 1000
+
+# Longer ranges are served from hourly statistics
+STATISTICS_SHORT_TERM_MAX_RANGE = timedelta(days=2)
+
+
+def _query_states(session):
+    """Return a query for states joined with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
 
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
@@ -115,10 +143,40 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_json(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
     )
 
+
+def _significant_states_query(
+    hass, session, start_time, end_time, entity_ids, filters, significant_changes_only
+):
+    """Return the query of significant states sorted by entity_id and last_updated."""
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
+
     if significant_changes_only:
         baked_query += lambda q: q.filter(
             (
@@ -138,34 +196,15 @@ def _get_significant_states(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
-    )
-
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
-
-    return _sorted_states_to_json(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -178,7 +217,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -199,13 +240,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -266,7 +307,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -310,9 +351,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -416,6 +455,99 @@ def _sorted_states_to_json(
     return {key: val for key, val in result.items() if val}
 
 
+def _iter_sorted_states(
+    hass,
+    session,
+    states,
+    start_time,
+    entity_ids,
+    filters=None,
+    include_start_time_state=True,
+    minimal_response=False,
+):
+    """Iterate over the JSON friendly states of each entity.
+
+    This is the streaming counterpart of _sorted_states_to_json, it yields
+    an iterator over the states of each entity instead of building the
+    lists, so only the states at the start time are kept in memory. The
+    iterator of an entity must be consumed before advancing to the next.
+
+    States must be sorted by entity_id and last_updated
+    """
+    start_time_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            start_time_states[state.entity_id] = state
+
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        yield _iter_entity_states(
+            ent_id, start_time_states.pop(ent_id, None), group, minimal_response
+        )
+
+    # Entities without changes during the period
+    for state in start_time_states.values():
+        yield iter((state,))
+
+
+def _iter_entity_states(ent_id, start_time_state, group, minimal_response):
+    """Iterate over the JSON friendly states of a single entity."""
+    if start_time_state is not None:
+        yield start_time_state
+
+    if not minimal_response or split_entity_id(ent_id)[0] in NEED_ATTRIBUTE_DOMAINS:
+        for db_state in group:
+            yield LazyState(db_state)
+        return
+
+    # With minimal response only the first and last states are native
+    # states, the states in-between only provide the "state" and the
+    # "last_changed". The last state is held back until it is known
+    # which one it is.
+    prev_state = start_time_state
+    if prev_state is None:
+        prev_state = LazyState(next(group))
+        yield prev_state
+
+    last_db_state = None
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        if last_db_state is not None:
+            yield {
+                STATE_KEY: last_db_state.state,
+                LAST_CHANGED_KEY: process_timestamp_to_utc_isoformat(
+                    last_db_state.last_changed
+                ),
+            }
+        last_db_state = prev_state = db_state
+
+    if last_db_state is not None:
+        yield LazyState(last_db_state)
+
+
+def get_statistics(hass, start_time, end_time, entity_ids, period=None):
+    """Return the statistics of numeric entities during a period.
+
+    If no period is given, 5-minute statistics are used for short ranges
+    and hourly statistics for longer ranges.
+    """
+    if period is None:
+        if end_time - start_time > STATISTICS_SHORT_TERM_MAX_RANGE:
+            period = PERIOD_HOUR
+        else:
+            period = PERIOD_5MINUTE
+
+    return statistics_during_period(hass, start_time, end_time, entity_ids, period)
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -433,6 +565,7 @@ async def async_setup(hass, config):
     use_include_order = conf.get(CONF_ORDER)
 
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
+    hass.http.register_view(HistoryStatisticsView())
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
     )
@@ -495,6 +628,19 @@ class HistoryPeriodView(HomeAssistantView):
 
         hass = request.app["hass"]
 
+        # Reordering by the include order needs the complete result
+        if "stream" in request.query and not self.use_include_order:
+            return await self._async_stream_significant_states_json(
+                request,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            )
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -555,6 +701,148 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    async def _async_stream_significant_states_json(
+        self, request, hass, *args
+    ) -> web.StreamResponse:
+        """Stream significant states from the database as json."""
+        response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+        response.enable_compression()
+        await response.prepare(request)
+
+        def write(data: bytes) -> None:
+            """Write data to the response from the executor."""
+            asyncio.run_coroutine_threadsafe(response.write(data), hass.loop).result()
+
+        await hass.async_add_executor_job(
+            self._stream_significant_states_json, hass, write, *args
+        )
+        await response.write_eof()
+        return response
+
+    def _stream_significant_states_json(
+        self,
+        hass,
+        write,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+    ):
+        """Write significant states as json while they are read from the database."""
+        timer_start = time.perf_counter()
+
+        chunk = []
+        chunk_size = 0
+        state_count = 0
+
+        def append(fragment: str) -> None:
+            """Append a fragment to the chunk, write the chunk when full."""
+            nonlocal chunk_size
+            chunk.append(fragment)
+            chunk_size += len(fragment)
+            if chunk_size >= STREAM_CHUNK_SIZE:
+                write("".join(chunk).encode("UTF-8"))
+                chunk.clear()
+                chunk_size = 0
+
+        def dumps(value) -> str:
+            """Serialize a value to JSON."""
+            return json.dumps(value, cls=JSONEncoder, allow_nan=False)
+
+        separator = "["
+        with session_scope(hass=hass) as session:
+            states = _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                significant_changes_only,
+            ).with_post_criteria(lambda q: q.yield_per(STREAM_YIELD_PER))
+
+            for entity_states in _iter_sorted_states(
+                hass,
+                session,
+                states,
+                start_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+                minimal_response,
+            ):
+                append(separator)
+                separator = ","
+                state_separator = "["
+                for state in entity_states:
+                    append(state_separator)
+                    state_separator = ","
+                    append(dumps(state))
+                    state_count += 1
+                append("]")
+
+        append("[]" if separator == "[" else "]")
+        write("".join(chunk).encode("UTF-8"))
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d states in %fs", state_count, elapsed)
+
+
+class HistoryStatisticsView(HomeAssistantView):
+    """Handle requests for the statistics of numeric entities."""
+
+    url = "/api/history/statistics"
+    name = "api:history:view-statistics"
+    extra_urls = ["/api/history/statistics/{datetime}"]
+
+    async def get(
+        self, request: web.Request, datetime: Optional[str] = None
+    ) -> web.Response:
+        """Return the statistics of entities over a period of time.
+
+        The statistics are returned by entity id, entities without
+        statistics are left out.
+        """
+        now = dt_util.utcnow()
+        if datetime:
+            start_time = dt_util.parse_datetime(datetime)
+            if start_time is None:
+                return self.json_message("Invalid datetime", HTTP_BAD_REQUEST)
+            start_time = dt_util.as_utc(start_time)
+        else:
+            start_time = now - timedelta(days=1)
+
+        end_time = request.query.get("end_time")
+        if end_time:
+            end_time = dt_util.parse_datetime(end_time)
+            if end_time is None:
+                return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
+            end_time = dt_util.as_utc(end_time)
+        else:
+            end_time = start_time + timedelta(days=1)
+
+        entity_ids = request.query.get("filter_entity_id")
+        if not entity_ids:
+            return self.json_message("Missing filter_entity_id", HTTP_BAD_REQUEST)
+
+        period = request.query.get("period")
+        if period is not None and period not in STATISTICS_PERIODS:
+            return self.json_message("Invalid period", HTTP_BAD_REQUEST)
+
+        hass = request.app["hass"]
+        statistics = await hass.async_add_executor_job(
+            get_statistics,
+            hass,
+            start_time,
+            end_time,
+            entity_ids.lower().split(","),
+            period,
+        )
+        return self.json(statistics)
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
@@ -1,6 +1,5 @@
 """Support for views."""
 import asyncio
-import json
 import logging
 from typing import Any, Callable, List, Optional
 
@@ -15,8 +14,8 @@ import voluptuous as vol
 
 from homeassistant import exceptions
 from homeassistant.const import CONTENT_TYPE_JSON, HTTP_OK, HTTP_SERVICE_UNAVAILABLE
-from homeassistant.core import Context, is_callback
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.core import Context, State, is_callback
+from homeassistant.helpers.json import json_dumps, json_fragments_list
 
 from .const import KEY_AUTHENTICATED, KEY_HASS
 
@@ -47,9 +46,12 @@ class HomeAssistantView:
         status_code: int = HTTP_OK,
         headers: Optional[LooseHeaders] = None,
     ) -> web.Response:
-        """Return a JSON response."""
+        """Return a JSON response.
+
+        States and lists of states reuse their already serialized JSON.
+        """
         try:
-            msg = json.dumps(result, cls=JSONEncoder, allow_nan=False).encode("UTF-8")
+            msg = _json_dumps(result).encode("UTF-8")
         except (ValueError, TypeError) as err:
             _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, result)
             raise HTTPInternalServerError from err
@@ -99,6 +101,19 @@ class HomeAssistantView:
             app["allow_cors"](route)
 
 
+def _json_dumps(result: Any) -> str:
+    """Serialize a result to JSON, using the JSON of states."""
+    if isinstance(result, State):
+        return result.as_json()
+    if (
+        isinstance(result, list)
+        and result
+        and all(isinstance(item, State) for item in result)
+    ):
+        return json_fragments_list(item.as_json() for item in result)
+    return json_dumps(result)
+
+
 def request_handler_factory(view: HomeAssistantView, handler: Callable) -> Callable:
     """Wrap the handler classes."""
     assert asyncio.iscoroutinefunction(handler) or is_callback(
@@ -5,6 +5,7 @@ import json
 import logging
 import re
 
+from aiohttp.hdrs import LINK
 import sqlalchemy
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
@@ -14,8 +15,10 @@ from homeassistant.components import sun
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import SQLITE_MAX_BIND_VARS
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -91,11 +94,6 @@ ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED = [
     *HOMEASSISTANT_EVENTS,
 ]
 
-ALL_EVENT_TYPES = [
-    EVENT_STATE_CHANGED,
-    *ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED,
-]
-
 EVENT_COLUMNS = [
     Events.event_type,
     Events.event_data,
@@ -104,6 +102,12 @@ EVENT_COLUMNS = [
     Events.context_user_id,
 ]
 
+# States recorded before the state_attributes table
+# existed store their attributes in the states table
+STATE_ATTRIBUTES_COLUMN = sqlalchemy.func.coalesce(
+    StateAttributes.shared_attrs, States.attributes
+)
+
 SCRIPT_AUTOMATION_EVENTS = [EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED]
 
 LOG_MESSAGE_SCHEMA = vol.Schema(
@@ -238,23 +242,43 @@ class LogbookView(HomeAssistantView):
             if end_day is None:
                 return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
 
+        limit = request.query.get("limit")
+        if limit is not None:
+            if not limit.isdigit() or int(limit) < 1:
+                return self.json_message("Invalid limit", HTTP_BAD_REQUEST)
+            limit = int(limit)
+
+        after = request.query.get("after")
+        if after is not None:
+            after = dt_util.parse_datetime(after)
+            if after is None:
+                return self.json_message("Invalid after", HTTP_BAD_REQUEST)
+            after = dt_util.as_utc(after)
+
         hass = request.app["hass"]
 
         entity_matches_only = "entity_matches_only" in request.query
 
         def json_events():
             """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
-                    hass,
-                    start_day,
-                    end_day,
-                    entity_ids,
-                    self.filters,
-                    self.entities_filter,
-                    entity_matches_only,
-                )
+            entries, next_after = _get_events_page(
+                hass,
+                start_day,
+                end_day,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                limit,
+                after,
             )
+            headers = None
+            if next_after is not None:
+                # Keyset pagination, the next page continues at the time
+                # of the first event that did not fit on this page
+                next_url = request.rel_url.update_query(after=next_after.isoformat())
+                headers = {LINK: f'<{next_url}>; rel="next"'}
+            return self.json(entries, headers=headers)
 
         return await hass.async_add_executor_job(json_events)
 
@@ -433,33 +457,69 @@ def _get_events(
     entity_matches_only=False,
 ):
     """Get events for a period of time."""
+    return _get_events_page(
+        hass,
+        start_day,
+        end_day,
+        entity_ids,
+        filters,
+        entities_filter,
+        entity_matches_only,
+    )[0]
+
+
+def _get_events_page(
+    hass,
+    start_day,
+    end_day,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    limit=None,
+    after=None,
+):
+    """Get a page of events for a period of time.
+
+    Events fired at or after the after time are returned if it is given,
+    instead of those fired after start_day. A page ends at the first
+    GROUP_BY_MINUTES boundary after limit events, so sensor updates are
+    grouped the same as without paging.
 
+    Returns the entries and the time to continue the next page from,
+    which is None for the last page.
+    """
     entity_attr_cache = EntityAttributeCache(hass)
     context_lookup = {None: None}
 
-    def yield_events(query):
-        """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
-            event = LazyEventPartialState(row)
-            context_lookup.setdefault(event.context_id, event)
-            if event.event_type == EVENT_CALL_SERVICE:
-                continue
-            if event.event_type == EVENT_STATE_CHANGED or _keep_event(
-                hass, event, entities_filter
-            ):
-                yield event
-
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
+    if after is None:
+        time_matcher = _time_matcher(start_day, end_day)
+        before_page_matcher = Events.time_fired <= start_day
+    else:
+        time_matcher = _time_matcher(after, end_day, True)
+        before_page_matcher = Events.time_fired < after
+
+    # Home Assistant start and stop are filtered away in SQL when
+    # the filter does not include them
+    event_types_except_state_changed = ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+    if entities_filter is not None and not entities_filter(HA_DOMAIN_ENTITY_ID):
+        event_types_except_state_changed = [
+            event_type
+            for event_type in ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+            if event_type not in HOMEASSISTANT_EVENTS
+        ]
+
     with session_scope(hass=hass) as session:
         old_state = aliased(States, name="old_state")
 
         if entity_ids is not None:
             query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
+            query = query.filter(time_matcher(Events.time_fired))
             query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+                hass, query, event_types_except_state_changed
             )
             if entity_matches_only:
                 # When entity_matches_only is provided, contexts and events that do not
@@ -467,15 +527,16 @@ def _get_events(
                 query = _apply_event_entity_id_matchers(query, entity_ids)
 
             query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
-                )
+                _generate_states_query(session, time_matcher, old_state, entity_ids)
             )
         else:
             query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
+            query = query.filter(time_matcher(Events.time_fired))
             query = _apply_events_types_and_states_filter(
-                hass, query, old_state
+                hass,
+                query,
+                old_state,
+                [EVENT_STATE_CHANGED, *event_types_except_state_changed],
             ).filter(
                 (States.last_updated == States.last_changed)
                 | (Events.event_type != EVENT_STATE_CHANGED)
@@ -487,18 +548,74 @@ def _get_events(
 
         query = query.order_by(Events.time_fired)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        events = []
+        next_after = None
+        last_group = None
+        for row in query.yield_per(1000):
+            event = LazyEventPartialState(row)
+            context_lookup.setdefault(event.context_id, event)
+            if event.event_type == EVENT_CALL_SERVICE:
+                continue
+            if event.event_type != EVENT_STATE_CHANGED and not _keep_event(
+                hass, event, entities_filter
+            ):
+                continue
+
+            group = event.time_fired_minute // GROUP_BY_MINUTES
+            if limit is not None and len(events) >= limit and group != last_group:
+                next_after = event.time_fired
+                break
+            events.append(event)
+            last_group = group
+
+        # Contexts that started before the page, such as on a previous page,
+        # are resolved in a batch instead of loading all earlier events
+        context_lookup.update(
+            _get_context_origins(
+                session,
+                {event.context_id for event in events if event.context_id},
+                before_page_matcher,
+            )
+        )
+
+        return (
+            list(humanify(hass, events, entity_attr_cache, context_lookup)),
+            next_after,
         )
 
 
+def _get_context_origins(session, context_ids, before_page_matcher):
+    """Return the first event of each context that was fired before the page."""
+    context_ids = list(context_ids)
+    origins = {}
+    for offset in range(0, len(context_ids), SQLITE_MAX_BIND_VARS):
+        query = (
+            _generate_events_query(session)
+            .outerjoin(States, (Events.event_id == States.event_id))
+            .outerjoin(
+                StateAttributes,
+                (States.attributes_id == StateAttributes.attributes_id),
+            )
+            .filter(
+                Events.context_id.in_(
+                    context_ids[offset : offset + SQLITE_MAX_BIND_VARS]
+                )
+            )
+            .filter(before_page_matcher)
+            .order_by(Events.time_fired)
+        )
+        for row in query:
+            origins.setdefault(row.context_id, LazyEventPartialState(row))
+    return origins
+
+
 def _generate_events_query(session):
     return session.query(
         *EVENT_COLUMNS,
         States.state,
         States.entity_id,
         States.domain,
-        States.attributes,
+        STATE_ATTRIBUTES_COLUMN.label("attributes"),
     )
 
 
@@ -512,14 +629,17 @@ def _generate_events_query_without_states(session):
     )
 
 
-def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
+def _generate_states_query(session, time_matcher, old_state, entity_ids):
     return (
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
-        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
+        .filter(time_matcher(States.last_updated))
         .filter(
             (States.last_updated == States.last_changed)
             & States.entity_id.in_(entity_ids)
@@ -527,9 +647,12 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
     )
 
 
-def _apply_events_types_and_states_filter(hass, query, old_state):
+def _apply_events_types_and_states_filter(hass, query, old_state, event_types):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
@@ -539,7 +662,7 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
             (Events.event_type != EVENT_STATE_CHANGED) | _continuous_entity_matcher()
         )
     )
-    return _apply_event_types_filter(hass, events_query, ALL_EVENT_TYPES)
+    return _apply_event_types_filter(hass, events_query, event_types)
 
 
 def _missing_state_matcher(old_state):
@@ -560,14 +683,17 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(STATE_ATTRIBUTES_COLUMN.contains(UNIT_OF_MEASUREMENT_JSON)),
     )
 
 
-def _apply_event_time_filter(events_query, start_day, end_day):
-    return events_query.filter(
-        (Events.time_fired > start_day) & (Events.time_fired < end_day)
-    )
+def _time_matcher(start_day, end_day, include_start=False):
+    def matcher(column):
+        if include_start:
+            return (column >= start_day) & (column < end_day)
+        return (column > start_day) & (column < end_day)
+
+    return matcher
 
 
 def _apply_event_types_filter(hass, query, event_types):
@@ -81,6 +81,7 @@ from .discovery import (
     set_discovery_hash,
 )
 from .models import Message, MessageCallbackType, PublishPayloadType
+from .router import TopicRouter
 from .subscription import async_subscribe_topics, async_unsubscribe_topics
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
@@ -653,6 +654,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: List[Subscription] = []
+        self._router = TopicRouter()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -840,6 +842,7 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        self._router.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -852,6 +855,7 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
+            self._router.remove(topic, subscription)
 
             if any(other.topic == topic for other in self.subscriptions):
                 # Other subscriptions on topic remaining - don't unsubscribe.
@@ -952,10 +956,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
-
+        for subscription in self._router.match(msg.topic):
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
                 try:
@@ -1050,20 +1051,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
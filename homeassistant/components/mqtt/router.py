@@ -0,0 +1,122 @@
+"""Route MQTT topics to the subscriptions with a matching topic filter."""
+from typing import Any, Dict, List, Optional, Tuple
+
+# The maximum number of topics of which the matching subscriptions are cached
+MAX_CACHED_TOPICS = 8192
+
+
+class _TopicNode:
+    """Node of the topic filter trie, one per topic filter level."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: Dict[str, "_TopicNode"] = {}
+        # Pairs of (sequence number, item) subscribed to the filter ending here
+        self.items: List[Tuple[int, Any]] = []
+
+
+class TopicRouter:
+    """Trie of topic filters, matching topics with the MQTT wildcard rules.
+
+    The items matching a topic are returned in the order they were added,
+    and are cached per topic until the next change to the trie.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the router."""
+        self._root = _TopicNode()
+        self._sequence = 0
+        self._cache: Dict[str, List[Any]] = {}
+
+    def add(self, topic_filter: str, item: Any) -> None:
+        """Add an item for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+
+        node.items.append((self._sequence, item))
+        self._sequence += 1
+        self._cache.clear()
+
+    def remove(self, topic_filter: str, item: Any) -> None:
+        """Remove an item from a topic filter, raise ValueError if not found."""
+        path = [self._root]
+        for level in topic_filter.split("/"):
+            child = path[-1].children.get(level)
+            if child is None:
+                raise ValueError(f"{item} not added for {topic_filter}")
+            path.append(child)
+
+        items = path[-1].items
+        for index, (_, added) in enumerate(items):
+            if added is item:
+                del items[index]
+                break
+        else:
+            raise ValueError(f"{item} not added for {topic_filter}")
+
+        # Prune the nodes that no longer lead to an item
+        for level, node, parent in zip(
+            reversed(topic_filter.split("/")), reversed(path), reversed(path[:-1])
+        ):
+            if node.items or node.children:
+                break
+            del parent.children[level]
+
+        self._cache.clear()
+
+    def match(self, topic: str) -> List[Any]:
+        """Return the items of the topic filters matching the topic."""
+        matches = self._cache.get(topic)
+        if matches is not None:
+            return matches
+
+        found: List[Tuple[int, Any]] = []
+        self._match(self._root, topic.split("/"), 0, not topic.startswith("$"), found)
+        found.sort(key=_sequence_key)
+        matches = [item for _, item in found]
+
+        if len(self._cache) >= MAX_CACHED_TOPICS:
+            self._cache.clear()
+        self._cache[topic] = matches
+        return matches
+
+    def _match(
+        self,
+        node: _TopicNode,
+        levels: List[str],
+        index: int,
+        wildcards: bool,
+        found: List[Tuple[int, Any]],
+    ) -> None:
+        """Collect the items of the nodes matching the levels from index.
+
+        Wildcards don't match the first level of topics starting with $.
+        """
+        wildcards = wildcards or index > 0
+        multi_level: Optional[_TopicNode] = node.children.get("#")
+        if multi_level is not None and wildcards:
+            # '#' also matches the parent level, so 'a/#' matches 'a'
+            found.extend(multi_level.items)
+
+        if index == len(levels):
+            found.extend(node.items)
+            return
+
+        child = node.children.get(levels[index])
+        if child is not None:
+            self._match(child, levels, index + 1, wildcards, found)
+
+        single_level = node.children.get("+")
+        if single_level is not None and wildcards:
+            self._match(single_level, levels, index + 1, wildcards, found)
+
+
+def _sequence_key(pair: Tuple[int, Any]) -> int:
+    """Return the sequence number of a (sequence number, item) pair."""
+    return pair[0]
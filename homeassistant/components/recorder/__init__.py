@@ -1,13 +1,13 @@
 """Support for recording details."""
 import asyncio
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import concurrent.futures
 from datetime import datetime
 import logging
 import queue
 import threading
 import time
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -34,9 +34,15 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
-from . import migration, purge
-from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from . import migration, purge, statistics
+from .const import (
+    CONF_DB_INTEGRITY_CHECK,
+    DATA_INSTANCE,
+    DOMAIN,
+    SQLITE_MAX_BIND_VARS,
+    SQLITE_URL_PREFIX,
+)
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .util import session_scope, validate_or_move_away_sqlite_database
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,6 +65,13 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 KEEPALIVE_TIME = 30
+MAX_BATCH_SIZE = 1000
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
+# Reused so they are compiled only once, see Recorder._insert_connection
+INSERT_EVENTS = Events.__table__.insert()
+INSERT_STATES = States.__table__.insert()
+INSERT_STATE_ATTRIBUTES = StateAttributes.__table__.insert()
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
@@ -194,12 +207,26 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack"])
+StatisticsTask = namedtuple("StatisticsTask", ["start"])
 
 
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+def _insert_values(dbobject):
+    """Return the values of a database object for a Core insert.
+
+    Unset columns with a default are left out, the default applies then.
+    """
+    values = {}
+    for column in dbobject.__table__.columns:
+        value = getattr(dbobject, column.key)
+        if not column.primary_key and (value is not None or column.default is None):
+            values[column.key] = value
+    return values
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -240,6 +267,15 @@ class Recorder(threading.Thread):
         self._timechanges_seen = 0
         self._keepalive_count = 0
         self._old_state_ids = {}
+        self._pending_events = []
+        self._pending_state_changes = []
+        self._pending_states = set()
+        self._pending_state_attributes = {}
+        self._state_attributes_ids = OrderedDict()
+        self._compiled_inserts = {}
+        self._last_batch_size = 0
+        self._max_batch_size = 0
+        self.purge_progress = None
         self.event_session = None
         self.get_session = None
         self._completed_database_setup = False
@@ -343,83 +379,296 @@ class Recorder(threading.Thread):
                 async_purge, hour=4, minute=12, second=0
             )
 
+        @callback
+        def async_compile_statistics(now):
+            """Trigger the statistics compilation of the last 5 minutes."""
+            self.queue.put(StatisticsTask(statistics.get_start_time()))
+
+        # Compile short term statistics every 5 minutes
+        self.hass.helpers.event.track_utc_time_change(
+            async_compile_statistics, minute="/5", second=10
+        )
+
         self.event_session = self.get_session()
         # Use a session for the event read loop
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         while True:
-            event = self.queue.get()
-            if event is None:
-                self._close_run()
-                self._close_connection()
-                return
-            if isinstance(event, PurgeTask):
-                # Schedule a new purge task if this one didn't finish
-                if not purge.purge_old_data(self, event.keep_days, event.repack):
-                    self.queue.put(PurgeTask(event.keep_days, event.repack))
-                continue
-            if isinstance(event, WaitTask):
-                self._queue_watch.set()
-                continue
-            if event.event_type == EVENT_TIME_CHANGED:
-                self._keepalive_count += 1
-                if self._keepalive_count >= KEEPALIVE_TIME:
-                    self._keepalive_count = 0
-                    self._send_keep_alive()
-                if self.commit_interval:
-                    self._timechanges_seen += 1
-                    if self._timechanges_seen >= self.commit_interval:
-                        self._timechanges_seen = 0
-                        self._commit_event_session_or_retry()
-                continue
-            if event.event_type in self.exclude_t:
-                continue
-
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
+            batch = self._get_batch()
+            for event in batch:
+                if event is None:
+                    self._write_pending()
+                    self._close_run()
+                    self._close_connection()
+                    return
+                if isinstance(event, PurgeTask):
+                    self._write_pending()
+                    # Schedule a new purge task if this one didn't finish,
+                    # events queued in the meantime are written first
+                    if not purge.purge_old_data(self, event.keep_days, event.repack):
+                        self.queue.put(PurgeTask(event.keep_days, event.repack))
+                    # Cached attributes may have been purged
+                    self._state_attributes_ids.clear()
+                    continue
+                if isinstance(event, StatisticsTask):
+                    self._write_pending()
+                    try:
+                        statistics.compile_missing_statistics(self, event.start)
+                    except Exception as err:  # pylint: disable=broad-except
+                        # Must catch the exception to prevent the loop from collapsing
+                        _LOGGER.exception("Error compiling statistics: %s", err)
+                    continue
+                if isinstance(event, WaitTask):
+                    self._write_pending()
+                    self._queue_watch.set()
+                    continue
+                if event.event_type == EVENT_TIME_CHANGED:
+                    self._keepalive_count += 1
+                    if self._keepalive_count >= KEEPALIVE_TIME:
+                        self._keepalive_count = 0
+                        self._write_pending()
+                        self._send_keep_alive()
+                    if self.commit_interval:
+                        self._timechanges_seen += 1
+                        if self._timechanges_seen >= self.commit_interval:
+                            self._timechanges_seen = 0
+                            self._write_pending()
+                            self._commit_event_session_or_retry()
+                    continue
+                if event.event_type in self.exclude_t:
                     continue
 
-            try:
-                dbevent = Events.from_event(event)
-                if event.event_type == EVENT_STATE_CHANGED:
-                    dbevent.event_data = "{}"
-                self.event_session.add(dbevent)
-                self.event_session.flush()
-            except (TypeError, ValueError):
-                _LOGGER.warning("Event is not JSON serializable: %s", event)
-            except Exception as err:  # pylint: disable=broad-except
-                # Must catch the exception to prevent the loop from collapsing
-                _LOGGER.exception("Error adding event: %s", err)
-
-            if dbevent and event.event_type == EVENT_STATE_CHANGED:
-                try:
-                    dbstate = States.from_event(event)
-                    has_new_state = event.data.get("new_state")
-                    dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
-                    if not has_new_state:
-                        dbstate.state = None
-                    dbstate.event_id = dbevent.event_id
-                    self.event_session.add(dbstate)
-                    self.event_session.flush()
-                    if has_new_state:
-                        self._old_state_ids[dbstate.entity_id] = dbstate.state_id
-                    elif dbstate.entity_id in self._old_state_ids:
-                        del self._old_state_ids[dbstate.entity_id]
-                except (TypeError, ValueError):
-                    _LOGGER.warning(
-                        "State is not JSON serializable: %s",
-                        event.data.get("new_state"),
-                    )
-                except Exception as err:  # pylint: disable=broad-except
-                    # Must catch the exception to prevent the loop from collapsing
-                    _LOGGER.exception("Error adding state change: %s", err)
+                entity_id = event.data.get(ATTR_ENTITY_ID)
+                if entity_id is not None:
+                    if not self.entity_filter(entity_id):
+                        continue
+
+                self._add_pending(event)
+
+            self._write_pending()
 
             # If they do not have a commit interval
             # than we commit right away
             if not self.commit_interval:
                 self._commit_event_session_or_retry()
 
+    @property
+    def status(self) -> Dict[str, Any]:
+        """Return information about the write pipeline and purge of the recorder."""
+        return {
+            "queue_depth": self.queue.qsize(),
+            "last_batch_size": self._last_batch_size,
+            "max_batch_size": self._max_batch_size,
+            "purge": self.purge_progress and self.purge_progress.as_dict(),
+        }
+
+    def _get_batch(self) -> List[Any]:
+        """Block until the queue has items and drain up to a batch of them."""
+        batch = [self.queue.get()]
+        while len(batch) < MAX_BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        else:
+            _LOGGER.debug(
+                "Recorder is behind, %s events still queued", self.queue.qsize()
+            )
+
+        self._last_batch_size = len(batch)
+        self._max_batch_size = max(self._max_batch_size, self._last_batch_size)
+        return batch
+
+    def _add_pending(self, event):
+        """Add an event and its state to the pending rows of the batch."""
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                # The state is stored in the states table
+                event_row = _insert_values(Events.from_event(event, event_data="{}"))
+            else:
+                event_row = _insert_values(Events.from_event(event))
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding event: %s", err)
+            return
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            self._pending_events.append(event_row)
+            return
+
+        try:
+            state_row = _insert_values(States.from_event(event))
+            shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding state change: %s", err)
+            return
+
+        entity_id = state_row["entity_id"]
+        if entity_id in self._pending_states:
+            # The old state id must be known before the next state of
+            # the same entity can be linked to it
+            self._write_pending()
+
+        has_new_state = event.data.get("new_state")
+        if not has_new_state:
+            state_row["state"] = None
+        state_row["event_id"] = None
+        state_row["attributes_id"] = None
+        state_row["old_state_id"] = self._old_state_ids.get(entity_id)
+        self._pending_state_changes.append((event_row, state_row))
+
+        if has_new_state:
+            self._pending_states.add(entity_id)
+            attributes_id = self._state_attributes_ids.get(shared_attrs)
+            if attributes_id is not None:
+                self._state_attributes_ids.move_to_end(shared_attrs)
+                state_row["attributes_id"] = attributes_id
+            else:
+                self._pending_state_attributes.setdefault(shared_attrs, []).append(
+                    state_row
+                )
+        else:
+            self._old_state_ids.pop(entity_id, None)
+
+    def _resolve_pending_state_attributes(self):
+        """Link pending states to existing or new shared attributes.
+
+        The new attributes are inserted with one statement and their ids
+        are looked up afterwards by hash like the existing ones.
+        """
+        existing = self._query_state_attributes_ids(self._pending_state_attributes)
+        new_rows = [
+            {
+                "hash": StateAttributes.hash_shared_attrs(shared_attrs),
+                "shared_attrs": shared_attrs,
+            }
+            for shared_attrs in self._pending_state_attributes
+            if shared_attrs not in existing
+        ]
+        if new_rows:
+            self._insert_connection().execute(INSERT_STATE_ATTRIBUTES, new_rows)
+            existing.update(
+                self._query_state_attributes_ids(
+                    [row["shared_attrs"] for row in new_rows]
+                )
+            )
+
+        for shared_attrs, state_rows in self._pending_state_attributes.items():
+            attributes_id = existing[shared_attrs]
+            for state_row in state_rows:
+                state_row["attributes_id"] = attributes_id
+        return existing
+
+    def _query_state_attributes_ids(self, shared_attrs_list):
+        """Return the ids of the stored attributes by their shared attributes."""
+        hashes = list(
+            {
+                StateAttributes.hash_shared_attrs(shared_attrs)
+                for shared_attrs in shared_attrs_list
+            }
+        )
+        attributes_ids = {}
+        for idx in range(0, len(hashes), SQLITE_MAX_BIND_VARS):
+            query = self.event_session.query(
+                StateAttributes.attributes_id, StateAttributes.shared_attrs
+            ).filter(StateAttributes.hash.in_(hashes[idx : idx + SQLITE_MAX_BIND_VARS]))
+            for attributes_id, shared_attrs in query:
+                attributes_ids.setdefault(shared_attrs, attributes_id)
+        return attributes_ids
+
+    def _cache_state_attributes_id(self, shared_attrs, attributes_id):
+        """Remember the id of shared attributes, evicting the least recent."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
+    def _insert_connection(self):
+        """Return the connection of the session that caches compiled inserts."""
+        return self.event_session.connection().execution_options(
+            compiled_cache=self._compiled_inserts
+        )
+
+    def _insert_pending(self):
+        """Insert the pending rows and return the ids of the new states.
+
+        Events without a state and states are inserted with one executemany
+        each. The events of state changes are inserted one by one as the
+        states reference their ids, which an executemany does not return.
+        """
+        connection = self._insert_connection()
+        if self._pending_events:
+            connection.execute(INSERT_EVENTS, self._pending_events)
+        if not self._pending_state_changes:
+            return {}
+
+        for event_row, state_row in self._pending_state_changes:
+            result = connection.execute(INSERT_EVENTS, event_row)
+            state_row["event_id"] = result.inserted_primary_key[0]
+        connection.execute(
+            INSERT_STATES, [state_row for _, state_row in self._pending_state_changes]
+        )
+
+        event_ids = [
+            state_row["event_id"]
+            for _, state_row in self._pending_state_changes
+            if state_row["entity_id"] in self._pending_states
+        ]
+        state_ids = {}
+        for idx in range(0, len(event_ids), SQLITE_MAX_BIND_VARS):
+            query = self.event_session.query(States.entity_id, States.state_id).filter(
+                States.event_id.in_(event_ids[idx : idx + SQLITE_MAX_BIND_VARS])
+            )
+            state_ids.update(query)
+        return state_ids
+
+    def _write_pending(self):
+        """Insert all pending events, states and attributes of the batch."""
+        if not self._pending_events and not self._pending_state_changes:
+            return
+
+        try:
+            attributes_ids = self._resolve_pending_state_attributes()
+            state_ids = self._insert_pending()
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding events: %s", err)
+            self._rollback_event_session()
+            return
+
+        self._old_state_ids.update(state_ids)
+        for shared_attrs, attributes_id in attributes_ids.items():
+            self._cache_state_attributes_id(shared_attrs, attributes_id)
+
+        self._clear_pending()
+
+    def _rollback_event_session(self):
+        """Roll back the session, forgetting the ids of the rows rolled back.
+
+        The batches written since the last commit are rolled back too, the
+        cached ids may point to their rows.
+        """
+        self._clear_pending()
+        self._old_state_ids.clear()
+        self._state_attributes_ids.clear()
+        self.event_session.rollback()
+
+    def _clear_pending(self):
+        """Forget the pending events, states and attributes."""
+        self._pending_events = []
+        self._pending_state_changes = []
+        self._pending_states = set()
+        self._pending_state_attributes = {}
+
     def _send_keep_alive(self):
         try:
             _LOGGER.debug("Sending keepalive")
@@ -472,7 +721,7 @@ class Recorder(threading.Thread):
 
     def _reopen_event_session(self):
         try:
-            self.event_session.rollback()
+            self._rollback_event_session()
         except Exception as err:  # pylint: disable=broad-except
             # Must catch the exception to prevent the loop from collapsing
             _LOGGER.exception("Error while rolling back event session: %s", err)
@@ -494,7 +743,7 @@ class Recorder(threading.Thread):
             self.event_session.commit()
         except Exception as err:
             _LOGGER.error("Error executing query: %s", err)
-            self.event_session.rollback()
+            self._rollback_event_session()
             raise
 
     @callback
@@ -4,4 +4,7 @@ DATA_INSTANCE = "recorder_instance"
 SQLITE_URL_PREFIX = "sqlite://"
 DOMAIN = "recorder"
 
+# The maximum number of bind variables in a single sqlite query
+SQLITE_MAX_BIND_VARS = 999
+
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
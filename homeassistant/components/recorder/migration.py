@@ -277,6 +277,11 @@ def _apply_update(engine, new_version, old_version):
         _drop_index(engine, "states", "ix_states_entity_id")
         _create_index(engine, "events", "ix_events_event_type_time_fired")
         _drop_index(engine, "events", "ix_events_event_type")
+    elif new_version == 10:
+        # The state_attributes table is created by create_all. Existing
+        # states keep their attributes in the states table.
+        _add_columns(engine, "states", ["attributes_id INTEGER"])
+        _create_index(engine, "states", "ix_states_attributes_id")
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
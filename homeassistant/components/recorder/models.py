@@ -1,11 +1,14 @@
 """Models for SQLAlchemy."""
 import json
 import logging
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -14,6 +17,7 @@ from sqlalchemy import (
     distinct,
 )
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
@@ -24,7 +28,7 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 10
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,10 +36,30 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
-
-ALL_TABLES = [TABLE_EVENTS, TABLE_STATES, TABLE_RECORDER_RUNS, TABLE_SCHEMA_CHANGES]
+TABLE_STATISTICS = "statistics"
+TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+
+ALL_TABLES = [
+    TABLE_EVENTS,
+    TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_RECORDER_RUNS,
+    TABLE_SCHEMA_CHANGES,
+    TABLE_STATISTICS,
+    TABLE_STATISTICS_SHORT_TERM,
+]
+
+# Tables that exist in every schema version, newer tables are
+# missing until the schema has been migrated
+TABLES_TO_CHECK = [
+    TABLE_EVENTS,
+    TABLE_STATES,
+    TABLE_RECORDER_RUNS,
+    TABLE_SCHEMA_CHANGES,
+]
 
 
 class Events(Base):  # type: ignore
@@ -59,11 +83,11 @@ class Events(Base):  # type: ignore
     )
 
     @staticmethod
-    def from_event(event):
+    def from_event(event, event_data=None):
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data=event_data or json.dumps(event.data, cls=JSONEncoder),
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -92,6 +116,31 @@ class Events(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history.
+
+    Rows are shared by all states that have the same attributes.
+    """
+
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text)
+
+    @staticmethod
+    def shared_attrs_from_event(event):
+        """Create the shared attributes JSON from a state_changed event."""
+        state = event.data.get("new_state")
+        if state is None:
+            return "{}"
+        return json.dumps(dict(state.attributes), cls=JSONEncoder)
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs):
+        """Return the hash used to look up shared attributes."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+
 class States(Base):  # type: ignore
     """State change history."""
 
@@ -102,10 +151,16 @@ class States(Base):  # type: ignore
     state = Column(String(255))
     attributes = Column(Text)
     event_id = Column(Integer, ForeignKey("events.event_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     last_changed = Column(DateTime(timezone=True), default=dt_util.utcnow)
     last_updated = Column(DateTime(timezone=True), default=dt_util.utcnow, index=True)
     created = Column(DateTime(timezone=True), default=dt_util.utcnow)
     old_state_id = Column(Integer)
+    # Loaded with one query for all the states a query returns, queries
+    # of the states table's columns don't load them
+    state_attributes = relationship(StateAttributes, lazy="selectin")
 
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
@@ -115,7 +170,11 @@ class States(Base):  # type: ignore
 
     @staticmethod
     def from_event(event):
-        """Create object from a state_changed event."""
+        """Create object from a state_changed event.
+
+        The attributes are stored in the state_attributes table
+        and must be linked by the caller.
+        """
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
@@ -131,7 +190,6 @@ class States(Base):  # type: ignore
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -139,11 +197,14 @@ class States(Base):  # type: ignore
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        attributes = self.attributes
+        if self.state_attributes is not None:
+            attributes = self.state_attributes.shared_attrs
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json.loads(attributes or "{}"),
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -157,6 +218,50 @@ class States(Base):  # type: ignore
             return None
 
 
+class StatisticsBase:
+    """Statistics of a numeric sensor over a period."""
+
+    id = Column(Integer, primary_key=True)
+    created = Column(DateTime(timezone=True), default=dt_util.utcnow)
+    start = Column(DateTime(timezone=True), index=True)
+    entity_id = Column(String(255))
+    mean = Column(Float)
+    min = Column(Float)
+    max = Column(Float)
+
+    def as_dict(self):
+        """Return a dictionary representation of the statistics."""
+        return {
+            "entity_id": self.entity_id,
+            "start": process_timestamp_to_utc_isoformat(self.start),
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class Statistics(Base, StatisticsBase):  # type: ignore
+    """Hourly statistics."""
+
+    __tablename__ = TABLE_STATISTICS
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_entity_id_start", "entity_id", "start"),
+    )
+
+
+class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore
+    """Statistics over 5 minutes."""
+
+    __tablename__ = TABLE_STATISTICS_SHORT_TERM
+    # The value held at the end of the period, None if it isn't numeric
+    last_state = Column(Float)
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_short_term_entity_id_start", "entity_id", "start"),
+    )
+
+
 class RecorderRuns(Base):  # type: ignore
     """Representation of recorder run."""
 
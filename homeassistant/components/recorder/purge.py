@@ -2,66 +2,106 @@
 from datetime import timedelta
 import logging
 import time
+from typing import Any, Dict
 
+from sqlalchemy import exists
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
 
-from .models import Events, RecorderRuns, States
-from .util import execute, session_scope
+from .const import SQLITE_MAX_BIND_VARS
+from .models import Events, RecorderRuns, StateAttributes, States, StatisticsShortTerm
+from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# The maximum number of rows deleted per table in a single transaction
+MAX_ROWS_TO_PURGE = SQLITE_MAX_BIND_VARS
+
+# The maximum number of free pages released by a single incremental vacuum
+SQLITE_INCREMENTAL_VACUUM_PAGES = 4096
+SQLITE_AUTO_VACUUM_INCREMENTAL = 2
+
+
+class PurgeProgress:
+    """Progress of a purge that is running in batches."""
+
+    def __init__(self, purge_before):
+        """Initialize the progress."""
+        self.purge_before = purge_before
+        self.started = dt_util.utcnow()
+        self.finished = None
+        self.batches = 0
+        self.states_deleted = 0
+        self.events_deleted = 0
+        self.state_attributes_deleted = 0
+        self.statistics_short_term_deleted = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary representation of the progress."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "started": self.started.isoformat(),
+            "finished": self.finished and self.finished.isoformat(),
+            "batches": self.batches,
+            "states_deleted": self.states_deleted,
+            "events_deleted": self.events_deleted,
+            "state_attributes_deleted": self.state_attributes_deleted,
+            "statistics_short_term_deleted": self.statistics_short_term_deleted,
+        }
+
 
 def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
     """Purge events and states older than purge_days ago.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Deletes at most MAX_ROWS_TO_PURGE rows of a table per call and
+    returns False when the purge has not completed yet, so the recorder
+    can write pending events before the next batch.
     """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
+    progress = instance.purge_progress
+    if progress is None or progress.finished is not None:
+        progress = instance.purge_progress = PurgeProgress(purge_before)
     _LOGGER.debug("Purging states and events before target %s", purge_before)
 
     try:
         with session_scope(session=instance.get_session()) as session:
-            # Purge a max of 1 hour, based on the oldest states or events record
-            batch_purge_before = purge_before
-
-            query = session.query(States).order_by(States.last_updated.asc()).limit(1)
-            states = execute(query, to_native=True, validate_entity_ids=False)
-            if states:
-                batch_purge_before = min(
-                    batch_purge_before,
-                    states[0].last_updated + timedelta(hours=1),
-                )
+            progress.batches += 1
 
-            query = session.query(Events).order_by(Events.time_fired.asc()).limit(1)
-            events = execute(query, to_native=True)
-            if events:
-                batch_purge_before = min(
-                    batch_purge_before,
-                    events[0].time_fired + timedelta(hours=1),
-                )
-
-            _LOGGER.debug("Purging states and events before %s", batch_purge_before)
+            state_ids = _select_state_ids_to_purge(session, purge_before)
+            if state_ids:
+                deleted_rows = _delete_rows(session, States.state_id, state_ids)
+                progress.states_deleted += deleted_rows
+                _LOGGER.debug("Deleted %s states", deleted_rows)
+                return False
 
-            deleted_rows = (
-                session.query(States)
-                .filter(States.last_updated < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s states", deleted_rows)
+            event_ids = _select_event_ids_to_purge(session, purge_before)
+            if event_ids:
+                deleted_rows = _delete_rows(session, Events.event_id, event_ids)
+                progress.events_deleted += deleted_rows
+                _LOGGER.debug("Deleted %s events", deleted_rows)
+                return False
 
-            deleted_rows = (
-                session.query(Events)
-                .filter(Events.time_fired < batch_purge_before)
-                .delete(synchronize_session=False)
+            # Hourly statistics are kept, they replace the purged states
+            # for long term history
+            statistics_ids = _select_short_term_statistics_ids_to_purge(
+                session, purge_before
             )
-            _LOGGER.debug("Deleted %s events", deleted_rows)
+            if statistics_ids:
+                deleted_rows = _delete_rows(
+                    session, StatisticsShortTerm.id, statistics_ids
+                )
+                progress.statistics_short_term_deleted += deleted_rows
+                _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+                return False
 
-            # If states or events purging isn't processing the purge_before yet,
-            # return false, as we are not done yet.
-            if batch_purge_before != purge_before:
-                _LOGGER.debug("Purging hasn't fully completed yet")
+            attributes_ids = _select_unused_attributes_ids(session)
+            if attributes_ids:
+                deleted_rows = _delete_rows(
+                    session, StateAttributes.attributes_id, attributes_ids
+                )
+                progress.state_attributes_deleted += deleted_rows
+                _LOGGER.debug("Deleted %s state_attributes", deleted_rows)
                 return False
 
             # Recorder runs is small, no need to batch run it
@@ -72,15 +112,9 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             )
             _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
-        if repack:
-            # Execute sqlite or postgresql vacuum command to free up space on disk
-            if instance.engine.driver in ("pysqlite", "postgresql"):
-                _LOGGER.debug("Vacuuming SQL DB to free space")
-                instance.engine.execute("VACUUM")
-            # Optimize mysql / mariadb tables to free up space on disk
-            elif instance.engine.driver in ("mysqldb", "pymysql"):
-                _LOGGER.debug("Optimizing SQL DB to free space")
-                instance.engine.execute("OPTIMIZE TABLE states, events, recorder_runs")
+        if repack and not _repack(instance):
+            _LOGGER.debug("Repacking hasn't fully completed yet")
+            return False
 
     except OperationalError as err:
         # Retry when one of the following MySQL errors occurred:
@@ -99,4 +133,88 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
         _LOGGER.warning("Error purging history: %s", err)
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s", err)
+
+    progress.finished = dt_util.utcnow()
+    return True
+
+
+def _select_state_ids_to_purge(session, purge_before):
+    """Return a batch of state ids to purge."""
+    query = (
+        session.query(States.state_id)
+        .filter(States.last_updated < purge_before)
+        .limit(MAX_ROWS_TO_PURGE)
+    )
+    return [state_id for state_id, in query]
+
+
+def _select_event_ids_to_purge(session, purge_before):
+    """Return a batch of event ids to purge."""
+    query = (
+        session.query(Events.event_id)
+        .filter(Events.time_fired < purge_before)
+        .limit(MAX_ROWS_TO_PURGE)
+    )
+    return [event_id for event_id, in query]
+
+
+def _select_short_term_statistics_ids_to_purge(session, purge_before):
+    """Return a batch of short term statistics ids to purge."""
+    query = (
+        session.query(StatisticsShortTerm.id)
+        .filter(StatisticsShortTerm.start < purge_before)
+        .limit(MAX_ROWS_TO_PURGE)
+    )
+    return [statistics_id for statistics_id, in query]
+
+
+def _select_unused_attributes_ids(session):
+    """Return a batch of state attributes ids no longer used by any state."""
+    query = (
+        session.query(StateAttributes.attributes_id)
+        .filter(~exists().where(States.attributes_id == StateAttributes.attributes_id))
+        .limit(MAX_ROWS_TO_PURGE)
+    )
+    return [attributes_id for attributes_id, in query]
+
+
+def _delete_rows(session, primary_key, ids):
+    """Delete the rows with the given primary keys."""
+    return (
+        session.query(primary_key.class_)
+        .filter(primary_key.in_(ids))
+        .delete(synchronize_session=False)
+    )
+
+
+def _repack(instance) -> bool:
+    """Free up space on disk, return False if it needs to run again."""
+    # Execute sqlite or postgresql vacuum command to free up space on disk
+    if instance.engine.driver == "pysqlite":
+        with instance.engine.connect() as connection:
+            auto_vacuum = connection.execute("PRAGMA auto_vacuum").scalar()
+            if auto_vacuum == SQLITE_AUTO_VACUUM_INCREMENTAL:
+                _LOGGER.debug("Incrementally vacuuming SQL DB to free space")
+                # Executing the pragma as a statement only frees a single
+                # page as sqlite3 steps it once, a script runs it to the end
+                connection.connection.executescript(
+                    f"PRAGMA incremental_vacuum({SQLITE_INCREMENTAL_VACUUM_PAGES});"
+                )
+                return not connection.execute("PRAGMA freelist_count").scalar()
+
+            # The full vacuum rewrites the database with incremental auto
+            # vacuum enabled so the next repack does not need to
+            _LOGGER.debug("Vacuuming SQL DB to free space")
+            connection.execute(f"PRAGMA auto_vacuum = {SQLITE_AUTO_VACUUM_INCREMENTAL}")
+            connection.execute("VACUUM")
+    elif instance.engine.driver == "postgresql":
+        _LOGGER.debug("Vacuuming SQL DB to free space")
+        instance.engine.execute("VACUUM")
+    # Optimize mysql / mariadb tables to free up space on disk
+    elif instance.engine.driver in ("mysqldb", "pymysql"):
+        _LOGGER.debug("Optimizing SQL DB to free space")
+        instance.engine.execute(
+            "OPTIMIZE TABLE states, state_attributes, events, recorder_runs, "
+            "statistics, statistics_short_term"
+        )
     return True
@@ -0,0 +1,234 @@
+"""Statistics helper."""
+from collections import defaultdict
+from datetime import datetime, timedelta
+import logging
+import math
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import exists, func
+
+import homeassistant.util.dt as dt_util
+
+from .models import States, Statistics, StatisticsShortTerm, process_timestamp
+from .util import execute, session_scope
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTICS_DOMAINS = ("sensor",)
+
+SHORT_TERM_PERIOD = timedelta(minutes=5)
+HOURLY_PERIOD = timedelta(hours=1)
+
+PERIOD_5MINUTE = "5minute"
+PERIOD_HOUR = "hour"
+STATISTICS_PERIODS = {
+    PERIOD_5MINUTE: StatisticsShortTerm,
+    PERIOD_HOUR: Statistics,
+}
+
+
+def get_start_time() -> datetime:
+    """Return the start of the last completed short term period."""
+    now = dt_util.utcnow()
+    current_period = now.replace(
+        minute=now.minute - now.minute % 5, second=0, microsecond=0
+    )
+    return current_period - SHORT_TERM_PERIOD
+
+
+def _float_or_none(state: Optional[str]) -> Optional[float]:
+    """Return the state as a finite float or None."""
+    try:
+        value = float(state)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def compile_missing_statistics(instance, start: datetime) -> None:
+    """Compile the statistics of a period and of the periods missed before it.
+
+    Periods are missed while Home Assistant is not running, they are
+    compiled from the first period after the last compiled one, going back
+    at most as far as the states are kept.
+    """
+    with session_scope(session=instance.get_session()) as session:
+        last_start = session.query(func.max(StatisticsShortTerm.start)).scalar()
+
+    period_start = start
+    if last_start is not None:
+        period_start = max(
+            process_timestamp(last_start) + SHORT_TERM_PERIOD,
+            start - timedelta(days=instance.keep_days),
+        )
+        # Align the first period on a 5 minute boundary
+        period_start -= timedelta(
+            minutes=period_start.minute % 5,
+            seconds=period_start.second,
+            microseconds=period_start.microsecond,
+        )
+
+    while period_start < start:
+        compile_statistics(instance, period_start)
+        period_start += SHORT_TERM_PERIOD
+    compile_statistics(instance, start)
+
+
+def compile_statistics(instance, start: datetime) -> None:
+    """Compile 5-minute statistics, and hourly statistics at the end of an hour.
+
+    Only numeric states are used, states that can't be parsed as a
+    number such as unavailable are ignored.
+    """
+    end = start + SHORT_TERM_PERIOD
+    _LOGGER.debug("Compiling statistics for %s-%s", start, end)
+
+    with session_scope(session=instance.get_session()) as session:
+        if session.query(exists().where(StatisticsShortTerm.start == start)).scalar():
+            _LOGGER.debug("Statistics already compiled for %s-%s", start, end)
+            return
+
+        for entity_id, mean, min_, max_, last_state in _compile_period(
+            session, start, end
+        ):
+            session.add(
+                StatisticsShortTerm(
+                    start=start,
+                    entity_id=entity_id,
+                    mean=mean,
+                    min=min_,
+                    max=max_,
+                    last_state=last_state,
+                )
+            )
+
+        hour_start = end - HOURLY_PERIOD
+        if (
+            end.minute == 0
+            and not session.query(
+                exists().where(Statistics.start == hour_start)
+            ).scalar()
+        ):
+            for entity_id, mean, min_, max_, _ in _compile_period(
+                session, hour_start, end
+            ):
+                session.add(
+                    Statistics(
+                        start=hour_start,
+                        entity_id=entity_id,
+                        mean=mean,
+                        min=min_,
+                        max=max_,
+                    )
+                )
+
+
+def _start_states(session, start: datetime) -> Dict[str, Optional[str]]:
+    """Return the states of the sensors when a period starts.
+
+    They are the values held at the end of the previous period, or when it
+    wasn't compiled, the last states recorded during the previous period.
+    Both queries only read the previous period, using an index.
+    """
+    previous_start = start - SHORT_TERM_PERIOD
+    previous = execute(
+        session.query(
+            StatisticsShortTerm.entity_id, StatisticsShortTerm.last_state
+        ).filter(StatisticsShortTerm.start == previous_start)
+    )
+    if previous:
+        return {
+            entity_id: None if last_state is None else str(last_state)
+            for entity_id, last_state in previous
+        }
+
+    query = (
+        session.query(States.entity_id, States.state)
+        .filter(States.domain.in_(STATISTICS_DOMAINS))
+        .filter((States.last_updated >= previous_start) & (States.last_updated < start))
+        .order_by(States.last_updated)
+    )
+    # The last state of each entity is kept
+    return dict(execute(query))
+
+
+def _compile_period(
+    session, start: datetime, end: datetime
+) -> Iterator[Tuple[str, float, float, float, Optional[float]]]:
+    """Yield the time weighted mean, min and max of the sensors over a period.
+
+    The value held at the end of the period is yielded last. Each value is
+    weighted by how long it was held during the period.
+    """
+    initial_states = _start_states(session, start)
+
+    query = (
+        session.query(States.entity_id, States.state, States.last_updated)
+        .filter(States.domain.in_(STATISTICS_DOMAINS))
+        .filter((States.last_updated >= start) & (States.last_updated < end))
+        .order_by(States.entity_id, States.last_updated)
+    )
+    changes: Dict[str, List[Tuple[datetime, Optional[str]]]] = {}
+    for entity_id, state, last_updated in execute(query):
+        changes.setdefault(entity_id, []).append(
+            (process_timestamp(last_updated), state)
+        )
+
+    for entity_id in sorted(initial_states.keys() | changes.keys()):
+        held = changes.get(entity_id, [])
+        if entity_id in initial_states:
+            held.insert(0, (start, initial_states[entity_id]))
+        compiled = _time_weighted_statistics(held, end)
+        if compiled is not None:
+            yield (entity_id, *compiled, _float_or_none(held[-1][1]))
+
+
+def _time_weighted_statistics(
+    held: List[Tuple[datetime, Optional[str]]], end: datetime
+) -> Optional[Tuple[float, float, float]]:
+    """Return the mean, min and max of states held from a time until the next.
+
+    The last state is held until the end, None is returned if no state is
+    numeric.
+    """
+    duration = weighted_sum = 0.0
+    values = []
+    for index, (since, state) in enumerate(held):
+        value = _float_or_none(state)
+        if value is None:
+            continue
+        until = held[index + 1][0] if index + 1 < len(held) else end
+        held_for = (until - since).total_seconds()
+        values.append(value)
+        duration += held_for
+        weighted_sum += value * held_for
+
+    if not values:
+        return None
+    mean = weighted_sum / duration if duration else sum(values) / len(values)
+    return mean, min(values), max(values)
+
+
+def statistics_during_period(
+    hass,
+    start_time: datetime,
+    end_time: Optional[datetime] = None,
+    entity_ids: Optional[Iterable[str]] = None,
+    period: str = PERIOD_HOUR,
+) -> Dict[str, List[Dict]]:
+    """Return statistics during UTC period start_time - end_time."""
+    table = STATISTICS_PERIODS[period]
+    result: Dict[str, List[Dict]] = defaultdict(list)
+
+    with session_scope(hass=hass) as session:
+        query = session.query(table).filter(table.start >= start_time)
+        if end_time is not None:
+            query = query.filter(table.start < end_time)
+        if entity_ids is not None:
+            query = query.filter(table.entity_id.in_(entity_ids))
+        query = query.order_by(table.entity_id, table.start)
+
+        for stat in execute(query):
+            result[stat.entity_id].append(stat.as_dict())
+
+    return dict(result)
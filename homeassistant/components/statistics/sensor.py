@@ -1,12 +1,14 @@
 """Support for statistics for sensor values."""
 from collections import deque
+import heapq
 import logging
-import statistics
+import math
 
+from sqlalchemy import literal, select, union_all
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
-from homeassistant.components.recorder.util import execute, session_scope
+from homeassistant.components.recorder.models import States, process_timestamp
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
@@ -54,6 +56,11 @@ DEFAULT_SIZE = 20
 DEFAULT_PRECISION = 2
 ICON = "mdi:calculator"
 
+DATA_DATABASE_LOAD_QUEUE = "statistics_database_load_queue"
+
+# The number of sensors initialized by a single database query
+DATABASE_LOAD_BATCH_SIZE = 100
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -85,6 +92,248 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     return True
 
 
+@callback
+def _async_queue_database_load(hass, sensor, window):
+    """Queue a sensor to be initialized from the database.
+
+    The sensors start at the same time, so the sensors queued before the
+    load runs share a single query. The window is a tuple of the source
+    entity_id, the max age and the sampling size.
+    """
+    queue = hass.data.get(DATA_DATABASE_LOAD_QUEUE)
+    if queue is None:
+        queue = hass.data[DATA_DATABASE_LOAD_QUEUE] = []
+        hass.async_create_task(_async_load_from_database(hass))
+    queue.append((sensor, window))
+
+
+async def _async_load_from_database(hass):
+    """Initialize the queued sensors from the database."""
+    queue = hass.data.pop(DATA_DATABASE_LOAD_QUEUE)
+    samples = await hass.async_add_executor_job(
+        _get_recorded_samples, hass, [window for _, window in queue]
+    )
+    for (sensor, _), sensor_samples in zip(queue, samples):
+        sensor.async_initialize_from_samples(sensor_samples)
+
+
+def _get_recorded_samples(hass, windows):
+    """Return the recorded (state, last_updated) samples of each window.
+
+    The latest samples of each window are selected by a subquery, and the
+    subqueries are combined into a single query per batch of windows.
+    """
+    samples = [[] for _ in windows]
+    now = dt_util.utcnow()
+
+    with session_scope(hass=hass) as session:
+        for offset in range(0, len(windows), DATABASE_LOAD_BATCH_SIZE):
+            queries = []
+            for index, (entity_id, max_age, sampling_size) in enumerate(
+                windows[offset : offset + DATABASE_LOAD_BATCH_SIZE], offset
+            ):
+                query = session.query(
+                    literal(index).label("sample_window"),
+                    States.state,
+                    States.last_updated,
+                ).filter(States.entity_id == entity_id)
+                if max_age is not None:
+                    query = query.filter(States.last_updated >= now - max_age)
+                query = query.order_by(States.last_updated.desc()).limit(sampling_size)
+                queries.append(select([query.subquery()]))
+
+            for row in session.execute(union_all(*queries)):
+                samples[row.sample_window].append(
+                    (row.state, process_timestamp(row.last_updated))
+                )
+
+    # The samples were selected latest first
+    for window_samples in samples:
+        window_samples.reverse()
+    return samples
+
+
+class SampleWindow:
+    """A window of samples with statistics that are updated per sample.
+
+    The mean and variance are updated with Welford's algorithm, and the
+    sums are recomputed each time the window has been replaced to avoid
+    accumulating rounding errors. Minimum and maximum are kept in monotonic
+    deques. The median is kept with a max heap of the lower half and a min
+    heap of the upper half of the samples; samples leaving the window are
+    only dropped from a heap once they reach its top.
+    """
+
+    def __init__(self, size, numeric=True):
+        """Initialize the window."""
+        self.values = deque()
+        self.ages = deque()
+        self._size = size
+        self._numeric = numeric
+        self._appended = 0
+        self._updates_until_recompute = size
+        self._sum = 0.0
+        self._mean = 0.0
+        # Sum of squared differences from the mean
+        self._m2 = 0.0
+        # Pairs of (sample number, value) with increasing/decreasing values
+        self._min = deque()
+        self._max = deque()
+        # Heaps of (-value, -sample number) and (value, sample number), with
+        # the number of samples of the window in each of them
+        self._low = []
+        self._high = []
+        self._low_size = 0
+        self._high_size = 0
+
+    def __len__(self):
+        """Return the number of samples in the window."""
+        return len(self.values)
+
+    def append(self, value, age):
+        """Add a sample, removing the oldest sample if the window is full."""
+        if len(self.values) == self._size:
+            self.popleft()
+
+        self.values.append(value)
+        self.ages.append(age)
+        number = self._appended
+        self._appended += 1
+
+        if not self._numeric:
+            return
+
+        self._sum += value
+        delta = value - self._mean
+        self._mean += delta / len(self.values)
+        self._m2 += delta * (value - self._mean)
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((number, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((number, value))
+
+        if self._low_size and (value, number) < (-self._low[0][0], -self._low[0][1]):
+            heapq.heappush(self._low, (-value, -number))
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, (value, number))
+            self._high_size += 1
+        self._balance_median()
+        self._count_update()
+
+    def popleft(self):
+        """Remove the oldest sample."""
+        number = self._appended - len(self.values)
+        value = self.values.popleft()
+        self.ages.popleft()
+
+        if not self._numeric:
+            return
+
+        self._sum -= value
+        if self.values:
+            delta = value - self._mean
+            self._mean -= delta / len(self.values)
+            self._m2 -= delta * (value - self._mean)
+        else:
+            self._mean = self._m2 = 0.0
+
+        if self._min[0][0] == number:
+            self._min.popleft()
+        if self._max[0][0] == number:
+            self._max.popleft()
+
+        # The tops of the heaps are in the window, this sample included
+        if self._low_size and (value, number) <= (-self._low[0][0], -self._low[0][1]):
+            self._low_size -= 1
+        else:
+            self._high_size -= 1
+        self._balance_median()
+        self._count_update()
+
+    def _balance_median(self):
+        """Keep the lower half one sample larger at most, drop left samples."""
+        first = self._appended - len(self.values)
+        self._prune_median(first)
+        if self._low_size > self._high_size + 1:
+            value, number = heapq.heappop(self._low)
+            heapq.heappush(self._high, (-value, -number))
+            self._low_size -= 1
+            self._high_size += 1
+        elif self._low_size < self._high_size:
+            value, number = heapq.heappop(self._high)
+            heapq.heappush(self._low, (-value, -number))
+            self._high_size -= 1
+            self._low_size += 1
+        self._prune_median(first)
+
+    def _prune_median(self, first):
+        """Drop the samples that left the window from the tops of the heaps."""
+        while self._low and -self._low[0][1] < first:
+            heapq.heappop(self._low)
+        while self._high and self._high[0][1] < first:
+            heapq.heappop(self._high)
+
+    def _rebuild_median(self):
+        """Rebuild the heaps from the window, dropping the samples that left."""
+        first = self._appended - len(self.values)
+        samples = sorted(zip(self.values, range(first, self._appended)))
+        self._low_size = (len(samples) + 1) // 2
+        self._high_size = len(samples) - self._low_size
+        self._low = [(-value, -number) for value, number in samples[: self._low_size]]
+        heapq.heapify(self._low)
+        self._high = samples[self._low_size :]
+
+    def _count_update(self):
+        """Recompute the sums after as many updates as the window size."""
+        self._updates_until_recompute -= 1
+        if self._updates_until_recompute > 0:
+            return
+
+        self._updates_until_recompute = self._size
+        if not self.values:
+            return
+        self._sum = math.fsum(self.values)
+        self._mean = self._sum / len(self.values)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self.values)
+        self._rebuild_median()
+
+    @property
+    def total(self):
+        """Return the sum of the samples."""
+        return self._sum
+
+    @property
+    def mean(self):
+        """Return the mean of the samples."""
+        return self._mean
+
+    @property
+    def variance(self):
+        """Return the sample variance, requires at least two samples."""
+        return max(self._m2, 0.0) / (len(self.values) - 1)
+
+    @property
+    def median(self):
+        """Return the median of the samples."""
+        if self._low_size > self._high_size:
+            return -self._low[0][0]
+        return (-self._low[0][0] + self._high[0][0]) / 2
+
+    @property
+    def min(self):
+        """Return the smallest sample."""
+        return self._min[0][1]
+
+    @property
+    def max(self):
+        """Return the largest sample."""
+        return self._max[0][1]
+
+
 class StatisticsSensor(Entity):
     """Representation of a Statistics sensor."""
 
@@ -97,8 +346,9 @@ class StatisticsSensor(Entity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
-        self.ages = deque(maxlen=self._sampling_size)
+        self._samples = SampleWindow(self._sampling_size, not self.is_binary)
+        self.states = self._samples.values
+        self.ages = self._samples.ages
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -138,7 +388,14 @@ class StatisticsSensor(Entity):
 
             if "recorder" in self.hass.config.components:
                 # Only use the database if it's configured
-                self.hass.async_create_task(self._async_initialize_from_database())
+                _LOGGER.debug(
+                    "%s: initializing values from the database", self.entity_id
+                )
+                _async_queue_database_load(
+                    self.hass,
+                    self,
+                    (self._entity_id.lower(), self._max_age, self._sampling_size),
+                )
 
         self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, async_stats_sensor_startup
@@ -146,21 +403,23 @@ class StatisticsSensor(Entity):
 
     def _add_state_to_queue(self, new_state):
         """Add the state to the queue."""
-        if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
+        self._add_sample(new_state.state, new_state.last_updated)
+
+    def _add_sample(self, state, last_updated):
+        """Add a sample to the queue."""
+        if state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                self._samples.append(state, last_updated)
             else:
-                self.states.append(float(new_state.state))
-
-            self.ages.append(new_state.last_updated)
+                self._samples.append(float(state), last_updated)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
                 self.entity_id,
-                new_state.state,
+                state,
             )
 
     @property
@@ -227,8 +486,7 @@ class StatisticsSensor(Entity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._samples.popleft()
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -245,27 +503,32 @@ class StatisticsSensor(Entity):
         if self._max_age is not None:
             self._purge_old()
 
-        self.count = len(self.states)
+        self.count = len(self._samples)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count >= 1:  # require only one data point
+                self.mean = round(self._samples.mean, self._precision)
+                self.median = round(self._samples.median, self._precision)
+            else:
+                _LOGGER.debug(
+                    "%s: mean requires at least one data point", self.entity_id
+                )
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count >= 2:  # require at least two data points
+                variance = self._samples.variance
+                self.stdev = round(math.sqrt(variance), self._precision)
+                self.variance = round(variance, self._precision)
+            else:
+                _LOGGER.debug(
+                    "%s: variance requires at least two data points", self.entity_id
+                )
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(self._samples.total, self._precision)
+                self.min = round(self._samples.min, self._precision)
+                self.max = round(self._samples.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -312,42 +575,11 @@ class StatisticsSensor(Entity):
                 self.hass, _scheduled_update, next_to_purge_timestamp
             )
 
-    async def _async_initialize_from_database(self):
-        """Initialize the list of states from the database.
-
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
-
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
-        """
-
-        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
-
-        with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._entity_id.lower()
-            )
-
-            if self._max_age is not None:
-                records_older_then = dt_util.utcnow() - self._max_age
-                _LOGGER.debug(
-                    "%s: retrieve records not older then %s",
-                    self.entity_id,
-                    records_older_then,
-                )
-                query = query.filter(States.last_updated >= records_older_then)
-            else:
-                _LOGGER.debug("%s: retrieving all records", self.entity_id)
-
-            query = query.order_by(States.last_updated.desc()).limit(
-                self._sampling_size
-            )
-            states = execute(query, to_native=True, validate_entity_ids=False)
-
-        for state in reversed(states):
-            self._add_state_to_queue(state)
+    @callback
+    def async_initialize_from_samples(self, samples):
+        """Initialize the queue with samples from the database."""
+        for state, last_updated in samples:
+            self._add_sample(state, last_updated)
 
         self.async_schedule_update_ha_state(True)
 
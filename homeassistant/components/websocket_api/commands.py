@@ -7,7 +7,7 @@ import voluptuous as vol
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from homeassistant.core import DOMAIN as HASS_DOMAIN, callback
+from homeassistant.core import DOMAIN as HASS_DOMAIN, callback, split_entity_id
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -15,8 +15,16 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, entity
-from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.entity_platform import async_get_polling_stats
+from homeassistant.helpers.event import (
+    TrackTemplate,
+    async_get_timer_stats,
+    async_track_state_change_domain,
+    async_track_state_change_event,
+    async_track_template_result,
+)
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.template import async_get_bytecode_cache_stats
 from homeassistant.loader import IntegrationNotFound, async_get_integration
 
 from . import const, decorators, messages
@@ -30,6 +38,7 @@ _LOGGER = logging.getLogger(__name__)
 def async_register_commands(hass, async_reg):
     """Register commands."""
     async_reg(hass, handle_subscribe_events)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_unsubscribe_events)
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_get_states)
@@ -42,6 +51,10 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
+    async_reg(hass, handle_timer_stats)
+    async_reg(hass, handle_executor_stats)
+    async_reg(hass, handle_polling_stats)
+    async_reg(hass, handle_template_stats)
 
 
 def pong_message(iden):
@@ -96,6 +109,90 @@ def handle_subscribe_events(hass, connection, msg):
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("domains"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("attributes"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+def handle_subscribe_entities(hass, connection, msg):
+    """Handle subscribe entities command.
+
+    Sends the states of the entities, followed by compressed changes. The
+    entities are selected by entity_id or domain, all entities if neither
+    is given, and their attributes can be limited to the given names.
+    """
+    entity_ids = set(msg.get("entity_ids", []))
+    domains = set(msg.get("domains", []))
+    attributes = msg.get("attributes")
+    if attributes is not None:
+        attributes = frozenset(attributes)
+    entity_perm = connection.user.permissions.check_entity
+
+    @callback
+    def forward_entity_changes(event):
+        """Forward a compressed state change to websocket."""
+        if not entity_perm(event.data["entity_id"], POLICY_READ):
+            return
+
+        message = messages.entity_event_message(msg["id"], event, attributes)
+        if message is not None:
+            connection.send_message(message)
+
+    # Entities and domains are both routed by the indexed state change
+    # trackers, so no listener filters every state change on its own
+    unsubs = []
+    if domains or not entity_ids:
+        unsubs.append(
+            async_track_state_change_domain(
+                hass, domains or MATCH_ALL, forward_entity_changes
+            )
+        )
+    tracked_entity_ids = [
+        entity_id
+        for entity_id in entity_ids
+        if split_entity_id(entity_id)[0] not in domains
+    ]
+    if tracked_entity_ids:
+        unsubs.append(
+            async_track_state_change_event(
+                hass, tracked_entity_ids, forward_entity_changes
+            )
+        )
+
+    @callback
+    def unsubscribe():
+        """Remove the listeners."""
+        for unsub in unsubs:
+            unsub()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_message(messages.result_message(msg["id"]))
+
+    if domains or not entity_ids:
+        states = hass.states.async_all(domains or None)
+    else:
+        states = []
+    states.extend(
+        state for state in map(hass.states.get, tracked_entity_ids) if state is not None
+    )
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            {
+                messages.ENTITY_EVENT_ADD: {
+                    state.entity_id: messages.compressed_state_dict(state, attributes)
+                    for state in states
+                    if entity_perm(state.entity_id, POLICY_READ)
+                }
+            },
+        )
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -183,7 +280,7 @@ def handle_get_states(hass, connection, msg):
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    connection.send_message(messages.states_result_message(msg["id"], states))
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -393,3 +490,35 @@ async def handle_test_condition(hass, connection, msg):
     connection.send_result(
         msg["id"], {"result": check_condition(hass, msg.get("variables"))}
     )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "timers/stats"})
+@decorators.require_admin
+def handle_timer_stats(hass, connection, msg):
+    """Handle timer stats command."""
+    connection.send_result(msg["id"], async_get_timer_stats(hass))
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "executor/stats"})
+@decorators.require_admin
+def handle_executor_stats(hass, connection, msg):
+    """Handle executor stats command."""
+    connection.send_result(msg["id"], hass.async_get_executor_stats())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "polling/stats"})
+@decorators.require_admin
+def handle_polling_stats(hass, connection, msg):
+    """Handle polling stats command."""
+    connection.send_result(msg["id"], async_get_polling_stats(hass))
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "templates/stats"})
+@decorators.require_admin
+def handle_template_stats(hass, connection, msg):
+    """Handle template stats command."""
+    connection.send_result(msg["id"], async_get_bytecode_cache_stats(hass))
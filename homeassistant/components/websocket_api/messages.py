@@ -1,13 +1,13 @@
 """Message templates for websocket commands."""
 
-from functools import lru_cache
 import logging
-from typing import Any, Dict
+from typing import Any, Collection, Dict, Iterable, Optional
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import json_fragments_list
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -27,6 +27,19 @@ MINIMAL_MESSAGE_SCHEMA = vol.Schema(
 # Base schema to extend by message handlers
 BASE_COMMAND_MESSAGE_SCHEMA = vol.Schema({vol.Required("id"): cv.positive_int})
 
+# Keys of the compressed states of subscribe_entities
+COMPRESSED_STATE_STATE = "s"
+COMPRESSED_STATE_ATTRIBUTES = "a"
+COMPRESSED_STATE_LAST_CHANGED = "lc"
+COMPRESSED_STATE_LAST_UPDATED = "lu"
+ENTITY_EVENT_ADD = "a"
+ENTITY_EVENT_CHANGE = "c"
+ENTITY_EVENT_REMOVE = "r"
+
+# Envelopes of the messages holding already serialized JSON
+_EVENT_MESSAGE_JSON = '{"id": %d, "type": "event", "event": %s}'
+_RESULT_MESSAGE_JSON = '{"id": %d, "type": "result", "success": true, "result": %s}'
+
 
 def result_message(iden: int, result: Any = None) -> Dict:
     """Return a success result message."""
@@ -48,17 +61,116 @@ def event_message(iden: int, event: Any) -> Dict:
     return {"id": iden, "type": "event", "event": event}
 
 
-@lru_cache(maxsize=128)
 def cached_event_message(iden: int, event: Event) -> str:
     """Return an event message.
 
-    Serialize to json once per message.
+    Serialize to json once per event.
 
     Since we can have many clients connected that are
     all getting many of the same events (mostly state changed)
-    we can avoid serializing the same data for each connection.
+    the JSON of the event is shared by all subscriptions,
+    only the envelope holding the subscription id is built per message.
+    """
+    try:
+        return _EVENT_MESSAGE_JSON % (iden, event.as_json())
+    except (ValueError, TypeError):
+        return message_to_json(event_message(iden, event))
+
+
+def states_result_message(iden: int, states: Iterable[State]) -> str:
+    """Return a result message of a list of states.
+
+    The JSON of the states is spliced into the message envelope.
     """
-    return message_to_json(event_message(iden, event))
+    states = list(states)
+    try:
+        return _RESULT_MESSAGE_JSON % (
+            iden,
+            json_fragments_list(state.as_json() for state in states),
+        )
+    except (ValueError, TypeError):
+        return message_to_json(result_message(iden, states))
+
+
+def _project_attributes(
+    state: State, attributes: Optional[Collection[str]]
+) -> Dict[str, Any]:
+    """Return the attributes of a state, only the given ones if not None."""
+    if attributes is None:
+        return dict(state.attributes)
+    return {
+        name: value for name, value in state.attributes.items() if name in attributes
+    }
+
+
+def compressed_state_dict(
+    state: State, attributes: Optional[Collection[str]] = None
+) -> Dict[str, Any]:
+    """Return a compressed representation of a state."""
+    return {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: _project_attributes(state, attributes),
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+        COMPRESSED_STATE_LAST_UPDATED: state.last_updated.timestamp(),
+    }
+
+
+def entity_event_message(
+    iden: int, event: Event, attributes: Optional[Collection[str]] = None
+) -> Optional[Dict]:
+    """Return the compressed change of a state changed event.
+
+    Returns None if neither the state nor the given attributes changed.
+    Changes hold the new state and the changed or added attributes under
+    "+", and the names of the removed attributes under "-".
+    """
+    entity_id = event.data["entity_id"]
+    old_state: Optional[State] = event.data.get("old_state")
+    new_state: Optional[State] = event.data.get("new_state")
+
+    if new_state is None:
+        return event_message(iden, {ENTITY_EVENT_REMOVE: [entity_id]})
+
+    if old_state is None:
+        return event_message(
+            iden,
+            {
+                ENTITY_EVENT_ADD: {
+                    entity_id: compressed_state_dict(new_state, attributes)
+                }
+            },
+        )
+
+    old_attributes = _project_attributes(old_state, attributes)
+    new_attributes = _project_attributes(new_state, attributes)
+    changed_attributes = {
+        name: value
+        for name, value in new_attributes.items()
+        if name not in old_attributes or old_attributes[name] != value
+    }
+    removed_attributes = [name for name in old_attributes if name not in new_attributes]
+
+    if (
+        old_state.state == new_state.state
+        and not changed_attributes
+        and not removed_attributes
+    ):
+        return None
+
+    additions: Dict[str, Any] = {
+        COMPRESSED_STATE_LAST_UPDATED: new_state.last_updated.timestamp()
+    }
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    if changed_attributes:
+        additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+
+    diff: Dict[str, Any] = {"+": additions}
+    if removed_attributes:
+        diff["-"] = {COMPRESSED_STATE_ATTRIBUTES: removed_attributes}
+
+    return event_message(iden, {ENTITY_EVENT_CHANGE: {entity_id: diff}})
 
 
 def message_to_json(message: Any) -> str:
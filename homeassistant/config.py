@@ -28,6 +28,7 @@ from homeassistant.const import (
     CONF_CUSTOMIZE_DOMAIN,
     CONF_CUSTOMIZE_GLOB,
     CONF_ELEVATION,
+    CONF_EXECUTOR_POOLS,
     CONF_EXTERNAL_URL,
     CONF_ID,
     CONF_INTERNAL_URL,
@@ -45,7 +46,13 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     __version__,
 )
-from homeassistant.core import DOMAIN as CONF_CORE, SOURCE_YAML, HomeAssistant, callback
+from homeassistant.core import (
+    DEFAULT_EXECUTOR_POOL_SIZES,
+    DOMAIN as CONF_CORE,
+    SOURCE_YAML,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, extract_domain_configs
 import homeassistant.helpers.config_validation as cv
@@ -224,6 +231,11 @@ CORE_CONFIG_SCHEMA = CUSTOMIZE_CONFIG_SCHEMA.extend(
         ),
         # pylint: disable=no-value-for-parameter
         vol.Optional(CONF_MEDIA_DIRS): cv.schema_with_slug_keys(vol.IsDir()),
+        vol.Optional(CONF_EXECUTOR_POOLS): {
+            vol.In(DEFAULT_EXECUTOR_POOL_SIZES): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            )
+        },
     }
 )
 
@@ -457,6 +469,10 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: Dict) -> Non
     """
     config = CORE_CONFIG_SCHEMA(config)
 
+    # Size the executor pools before the stores are loaded with them
+    for pool, max_workers in config.get(CONF_EXECUTOR_POOLS, {}).items():
+        hass.async_set_executor_pool_size(pool, max_workers)
+
     # Only load auth during startup.
     if not hasattr(hass, "auth"):
         auth_conf = config.get(CONF_AUTH_PROVIDERS)
@@ -13,6 +13,7 @@ import logging
 import os
 import pathlib
 import re
+import sys
 import threading
 from time import monotonic
 from types import MappingProxyType
@@ -28,6 +29,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -69,9 +71,14 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import location, network
 from homeassistant.util.async_ import fire_coroutine_threadsafe, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import (
+    InstrumentedThreadPoolExecutor,
+    shutdown_executor,
+)
 from homeassistant.util.thread import fix_threading_exception_logging
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
@@ -113,6 +120,25 @@ SOURCE_YAML = "yaml"
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# How long to wait for the threads of an executor to finish on shutdown.
+EXECUTOR_SHUTDOWN_TIMEOUT = 10
+
+# The default executor of the loop in the executor stats
+POOL_DEFAULT = "default"
+
+# Executor pools running the jobs of a workload class apart from the default
+# executor, so a slow workload doesn't starve the others
+POOL_IO = "io"
+POOL_CPU = "cpu"
+POOL_POLLING = "polling"
+POOL_STORAGE = "storage"
+DEFAULT_EXECUTOR_POOL_SIZES = {
+    POOL_IO: 16,
+    POOL_CPU: os.cpu_count() or 1,
+    POOL_POLLING: 32,
+    POOL_STORAGE: 4,
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -148,6 +174,51 @@ def is_callback(func: Callable[..., Any]) -> bool:
     return getattr(func, "_hass_callback", False) is True
 
 
+class HassJobType(enum.Enum):
+    """Represent a job type."""
+
+    Coroutinefunction = 1
+    Callback = 2
+    Executor = 3
+
+
+class HassJob:
+    """Represent a job to be run later.
+
+    We check the callable type in advance
+    so we can avoid checking it every time
+    we run the job.
+    """
+
+    __slots__ = ("job_type", "target")
+
+    def __init__(self, target: Callable):
+        """Create a job object."""
+        if asyncio.iscoroutine(target):
+            raise ValueError("Coroutine not allowed to be passed to HassJob")
+
+        self.target = target
+        self.job_type = _get_callable_job_type(target)
+
+    def __repr__(self) -> str:
+        """Return the job."""
+        return f"<Job {self.job_type} {self.target}>"
+
+
+def _get_callable_job_type(target: Callable) -> HassJobType:
+    """Determine the job type from the callable."""
+    # Check for partials to properly determine if coroutine function
+    check_target = target
+    while isinstance(check_target, functools.partial):
+        check_target = check_target.func
+
+    if asyncio.iscoroutinefunction(check_target):
+        return HassJobType.Coroutinefunction
+    if is_callback(check_target):
+        return HassJobType.Callback
+    return HassJobType.Executor
+
+
 class CoreState(enum.Enum):
     """Represent the current state of Home Assistant."""
 
@@ -189,6 +260,8 @@ class HomeAssistant:
         self._stopped: Optional[asyncio.Event] = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        self._executor_pool_sizes = dict(DEFAULT_EXECUTOR_POOL_SIZES)
+        self._executor_pools: Dict[str, InstrumentedThreadPoolExecutor] = {}
 
     @property
     def is_running(self) -> bool:
@@ -327,6 +400,33 @@ class HomeAssistant:
 
         return task
 
+    @callback
+    def async_add_hass_job(
+        self, hassjob: HassJob, *args: Any
+    ) -> Optional[asyncio.Future]:
+        """Add a HassJob from within the event loop.
+
+        This method must be run in the event loop.
+        hassjob: HassJob to call.
+        args: parameters for method to call.
+        """
+        task = None
+
+        if hassjob.job_type == HassJobType.Coroutinefunction:
+            task = self.loop.create_task(hassjob.target(*args))
+        elif hassjob.job_type == HassJobType.Callback:
+            self.loop.call_soon(hassjob.target, *args)
+        else:
+            task = self.loop.run_in_executor(  # type: ignore
+                None, hassjob.target, *args
+            )
+
+        # If a task is scheduled
+        if self._track_task and task is not None:
+            self._pending_tasks.append(task)
+
+        return task
+
     @callback
     def async_create_task(self, target: Coroutine) -> asyncio.tasks.Task:
         """Create a task from within the eventloop.
@@ -344,10 +444,15 @@ class HomeAssistant:
 
     @callback
     def async_add_executor_job(
-        self, target: Callable[..., T], *args: Any
+        self, target: Callable[..., T], *args: Any, pool: Optional[str] = None
     ) -> Awaitable[T]:
-        """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        """Add an executor job from within the event loop.
+
+        The job runs in the named executor pool if one is given, else in the
+        default executor.
+        """
+        executor = None if pool is None else self._async_get_executor_pool(pool)
+        task = self.loop.run_in_executor(executor, target, *args)
 
         # If a task is scheduled
         if self._track_task:
@@ -355,6 +460,47 @@ class HomeAssistant:
 
         return task
 
+    @callback
+    def _async_get_executor_pool(self, pool: str) -> InstrumentedThreadPoolExecutor:
+        """Return a named executor pool, creating it on first use."""
+        executor = self._executor_pools.get(pool)
+        if executor is None:
+            if pool not in self._executor_pool_sizes:
+                raise ValueError(f"Unknown executor pool {pool}")
+            executor = self._executor_pools[pool] = InstrumentedThreadPoolExecutor(
+                self._executor_pool_sizes[pool],
+                thread_name_prefix=f"{pool.capitalize()}Worker",
+            )
+        return executor
+
+    @callback
+    def async_set_executor_pool_size(self, pool: str, max_workers: int) -> None:
+        """Set the number of threads of a named executor pool.
+
+        A pool already in use is replaced by a new one of the new size, the
+        old pool finishes the jobs it has been given and its threads exit.
+        """
+        if pool not in self._executor_pool_sizes:
+            raise ValueError(f"Unknown executor pool {pool}")
+        self._executor_pool_sizes[pool] = max_workers
+        executor = self._executor_pools.get(pool)
+        if executor is not None and executor.max_workers != max_workers:
+            # The next job creates the pool again with the new size
+            del self._executor_pools[pool]
+            executor.shutdown(wait=False)
+
+    @callback
+    def async_get_executor_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the load of the default executor and the pools used so far."""
+        stats = {
+            pool: executor.stats() for pool, executor in self._executor_pools.items()
+        }
+        # The default executor of the loop is instrumented by runner.py
+        default_executor = getattr(self.loop, "_default_executor", None)
+        if isinstance(default_executor, InstrumentedThreadPoolExecutor):
+            stats[POOL_DEFAULT] = default_executor.stats()
+        return stats
+
     @callback
     def async_track_tasks(self) -> None:
         """Track tasks so you can wait for all tasks to be done."""
@@ -492,7 +638,22 @@ class HomeAssistant:
                 "Timed out waiting for shutdown stage 3 to complete, the shutdown will continue"
             )
 
-        # Python 3.9+ and backported in runner.py
+        # The named pools are shut down from the default executor
+        shutdowns = await asyncio.gather(
+            *(
+                self.loop.run_in_executor(
+                    None, shutdown_executor, executor, EXECUTOR_SHUTDOWN_TIMEOUT
+                )
+                for executor in self._executor_pools.values()
+            )
+        )
+        if not all(shutdowns):
+            _LOGGER.warning(
+                "Timed out waiting for the executor pools to shut down, the shutdown will continue"
+            )
+
+        # Python 3.9+ and backported in runner.py, which bounds it to
+        # EXECUTOR_SHUTDOWN_TIMEOUT
         await self.loop.shutdown_default_executor()  # type: ignore
 
         self.exit_code = exit_code
@@ -531,7 +692,7 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = ["event_type", "data", "origin", "time_fired", "context", "_as_json"]
 
     def __init__(
         self,
@@ -547,6 +708,7 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._as_json: Optional[str] = None
 
     def __hash__(self) -> int:
         """Make hashable."""
@@ -566,6 +728,18 @@ class Event:
             "context": self.context.as_dict(),
         }
 
+    def as_json(self) -> str:
+        """Return the JSON of the dict representation of this Event.
+
+        The JSON is serialized once and shared by all its consumers, so the
+        event data should not be changed after the event has been fired.
+
+        Raises ValueError or TypeError if the data can't be serialized.
+        """
+        if self._as_json is None:
+            self._as_json = json_dumps(self.as_dict())
+        return self._as_json
+
     def __repr__(self) -> str:
         """Return the representation."""
         # pylint: disable=maybe-no-member
@@ -591,7 +765,10 @@ class EventBus:
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: Dict[str, List[Callable]] = {}
+        self._listeners: Dict[str, List[HassJob]] = {}
+        # The listeners of an event type merged with the MATCH_ALL
+        # listeners, built on fire and cleared on (un)subscribe
+        self._merged_listeners: Dict[str, Tuple[HassJob, ...]] = {}
         self._hass = hass
 
     @callback
@@ -631,12 +808,9 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        listeners = self._listeners.get(event_type, [])
-
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        listeners = self._merged_listeners.get(event_type)
+        if listeners is None:
+            listeners = self._async_merge_listeners(event_type)
 
         event = Event(event_type, event_data, origin, None, context)
 
@@ -646,8 +820,24 @@ class EventBus:
         if not listeners:
             return
 
-        for func in listeners:
-            self._hass.async_add_job(func, event)
+        for job in listeners:
+            self._hass.async_add_hass_job(job, event)
+
+    @callback
+    def _async_merge_listeners(self, event_type: str) -> Tuple[HassJob, ...]:
+        """Merge and cache the MATCH_ALL listeners with those of event_type.
+
+        This method must be run in the event loop.
+        """
+        listeners = self._listeners.get(event_type, [])
+
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        match_all_listeners = self._listeners.get(MATCH_ALL)
+        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
+            listeners = match_all_listeners + listeners
+
+        merged = self._merged_listeners[event_type] = tuple(listeners)
+        return merged
 
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
@@ -674,14 +864,20 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        if event_type in self._listeners:
-            self._listeners[event_type].append(listener)
-        else:
-            self._listeners[event_type] = [listener]
+        return self._async_listen_job(event_type, HassJob(listener))
+
+    @callback
+    def _async_listen_job(self, event_type: str, hassjob: HassJob) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a job.
+
+        This method must be run in the event loop.
+        """
+        self._listeners.setdefault(event_type, []).append(hassjob)
+        self._async_invalidate_merged_listeners(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
-            self._async_remove_listener(event_type, listener)
+            self._async_remove_listener(event_type, hassjob)
 
         return remove_listener
 
@@ -714,6 +910,7 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        job: Optional[HassJob] = None
 
         @callback
         def onetime_listener(event: Event) -> None:
@@ -726,19 +923,20 @@ class EventBus:
             # multiple times as well.
             # This will make sure the second time it does nothing.
             setattr(onetime_listener, "run", True)
-            self._async_remove_listener(event_type, onetime_listener)
+            self._async_remove_listener(event_type, job)  # type: ignore
             self._hass.async_run_job(listener, event)
 
-        return self.async_listen(event_type, onetime_listener)
+        job = HassJob(onetime_listener)
+        return self._async_listen_job(event_type, job)
 
     @callback
-    def _async_remove_listener(self, event_type: str, listener: Callable) -> None:
+    def _async_remove_listener(self, event_type: str, hassjob: HassJob) -> None:
         """Remove a listener of a specific event_type.
 
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(listener)
+            self._listeners[event_type].remove(hassjob)
 
             # delete event_type list if empty
             if not self._listeners[event_type]:
@@ -746,7 +944,20 @@ class EventBus:
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
-            _LOGGER.warning("Unable to remove unknown listener %s", listener)
+            _LOGGER.warning("Unable to remove unknown listener %s", hassjob.target)
+        else:
+            self._async_invalidate_merged_listeners(event_type)
+
+    @callback
+    def _async_invalidate_merged_listeners(self, event_type: str) -> None:
+        """Clear the cached merged listeners affected by event_type.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            self._merged_listeners.clear()
+        else:
+            self._merged_listeners.pop(event_type, None)
 
 
 class State:
@@ -798,11 +1009,17 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        # Read-only attributes, such as those of a previous state, are shared
+        self.attributes = (
+            attributes
+            if isinstance(attributes, MappingProxyType)
+            else MappingProxyType(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
-        self.domain = split_entity_id(self.entity_id)[0]
+        # There are only a few domains, share the string between states
+        self.domain = sys.intern(split_entity_id(self.entity_id)[0])
 
     @property
     def object_id(self) -> str:
@@ -833,6 +1050,18 @@ class State:
             "context": self.context.as_dict(),
         }
 
+    def as_json(self) -> str:
+        """Return the JSON of the dict representation of the State.
+
+        Async friendly.
+
+        Unlike the JSON of an event, the JSON of a state is not kept: the
+        current states live as long as their entities and keeping their
+        JSON would about double the memory they use.
+        Raises ValueError or TypeError if the attributes can't be serialized.
+        """
+        return json_dumps(self.as_dict())
+
     @classmethod
     def from_dict(cls, json_dict: Dict) -> Any:
         """Initialize a state from a dict.
@@ -1046,12 +1275,16 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == MappingProxyType(attributes)
+            same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
             return
 
+        if same_attr:
+            # Share the unchanged attributes instead of keeping a copy
+            attributes = old_state.attributes  # type: ignore
+
         if context is None:
             context = Context()
 
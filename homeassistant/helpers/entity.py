@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 from timeit import default_timer as timer
-from typing import Any, Awaitable, Dict, Iterable, List, Optional
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
 
 from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
@@ -24,7 +24,13 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    POOL_POLLING,
+    Context,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entity_registry import RegistryEntry
@@ -123,6 +129,18 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _added = False
 
+    # If the attributes other than the state attributes and the device state
+    # attributes are only computed again after an update of the registry
+    # entry or of the customize config, or a call to
+    # async_invalidate_static_attributes
+    cache_static_attributes = False
+
+    # Registry entry and customize config the cached attributes are for,
+    # the capability attributes and the attributes overriding the others
+    _static_attributes: Optional[
+        Tuple[Optional[RegistryEntry], Any, Optional[Dict[str, Any]], Dict[str, Any]]
+    ] = None
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -311,8 +329,27 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        assert self.hass is not None
+        if self.cache_static_attributes:
+            customize = self.hass.data.get(DATA_CUSTOMIZE)
+            cached = self._static_attributes
+            if (
+                cached is None
+                or cached[0] is not self.registry_entry
+                or cached[1] is not customize
+            ):
+                cached = self._static_attributes = (
+                    self.registry_entry,
+                    customize,
+                    self.capability_attributes,
+                    self._async_calculate_static_attributes(),
+                )
+            _, _, capability_attr, static_attr = cached
+        else:
+            capability_attr = self.capability_attributes
+            static_attr = None
+
+        attr = dict(capability_attr) if capability_attr else {}
 
         if not self.available:
             state = STATE_UNAVAILABLE
@@ -322,35 +359,9 @@ class Entity(ABC):
             attr.update(self.state_attributes or {})
             attr.update(self.device_state_attributes or {})
 
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        entry = self.registry_entry
-        # pylint: disable=consider-using-ternary
-        name = (entry and entry.name) or self.name
-        if name is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        icon = (entry and entry.icon) or self.icon
-        if icon is not None:
-            attr[ATTR_ICON] = icon
-
-        entity_picture = self.entity_picture
-        if entity_picture is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        assumed_state = self.assumed_state
-        if assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        supported_features = self.supported_features
-        if supported_features is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
-
-        device_class = self.device_class
-        if device_class is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
+        if static_attr is None:
+            static_attr = self._async_calculate_static_attributes()
+        attr.update(static_attr)
 
         end = timer()
 
@@ -377,11 +388,6 @@ class Entity(ABC):
                 extra,
             )
 
-        # Overwrite properties that have been set in the config file.
-        assert self.hass is not None
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
-
         # Convert temperature if we detect one
         try:
             unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
@@ -409,6 +415,60 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_calculate_static_attributes(self) -> Dict[str, Any]:
+        """Return the attributes overriding the state attributes.
+
+        The properties that have been set in the config file overwrite
+        the ones of the entity.
+        """
+        attr: Dict[str, Any] = {}
+
+        unit_of_measurement = self.unit_of_measurement
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        entry = self.registry_entry
+        # pylint: disable=consider-using-ternary
+        name = (entry and entry.name) or self.name
+        if name is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        icon = (entry and entry.icon) or self.icon
+        if icon is not None:
+            attr[ATTR_ICON] = icon
+
+        entity_picture = self.entity_picture
+        if entity_picture is not None:
+            attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        assumed_state = self.assumed_state
+        if assumed_state:
+            attr[ATTR_ASSUMED_STATE] = assumed_state
+
+        supported_features = self.supported_features
+        if supported_features is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        device_class = self.device_class
+        if device_class is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        assert self.hass is not None
+        if DATA_CUSTOMIZE in self.hass.data:
+            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+
+        return attr
+
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Compute the cached attributes again on the next write.
+
+        For entities caching their static attributes, to call when the
+        properties used for them change.
+        """
+        self._static_attributes = None
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -468,7 +528,9 @@ class Entity(ABC):
             if hasattr(self, "async_update"):
                 await self.async_update()  # type: ignore
             elif hasattr(self, "update"):
-                await self.hass.async_add_executor_job(self.update)  # type: ignore
+                await self.hass.async_add_executor_job(
+                    self.update, pool=POOL_POLLING  # type: ignore
+                )
         finally:
             self._update_staged = False
             if warning:
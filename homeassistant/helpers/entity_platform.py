@@ -2,9 +2,22 @@
 import asyncio
 from contextvars import ContextVar
 from datetime import datetime, timedelta
+from functools import partial
 from logging import Logger
+from time import monotonic
 from types import ModuleType
-from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+import zlib
 
 from homeassistant import config_entries
 from homeassistant.const import DEVICE_DEFAULT_NAME
@@ -18,10 +31,11 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
 from homeassistant.helpers.typing import HomeAssistantType
+import homeassistant.util.dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later, async_track_point_in_utc_time
 
 if TYPE_CHECKING:
     from .entity import Entity
@@ -37,6 +51,51 @@ PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Failed updates in a row before an entity is polled less often
+POLLING_FAILURES_BEFORE_BACKOFF = 3
+# The maximum number of polls of an entity skipped after a slow or failed update
+POLLING_MAX_SKIPPED = 8
+# The scan interval of a platform is split in phases, the entities polled
+# in the same phase share a timer
+POLLING_PHASES = 10
+
+
+class PollingStats:
+    """Statistics of the polling of a platform."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.polls = 0
+        self.overruns = 0
+        self.failures = 0
+        self.skipped = 0
+        self.total_duration = 0.0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "polls": self.polls,
+            "overruns": self.overruns,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "last_duration": self.last_duration,
+            "mean_duration": self.total_duration / self.polls if self.polls else 0.0,
+            "max_duration": self.max_duration,
+        }
+
+
+class _EntityBackoff:
+    """Polls of an entity to skip after slow or failed updates."""
+
+    __slots__ = ("failures", "to_skip")
+
+    def __init__(self) -> None:
+        """Initialize the backoff."""
+        self.failures = 0
+        self.to_skip = 0
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -63,11 +122,18 @@ class EntityPlatform:
         self.config_entry: Optional[config_entries.ConfigEntry] = None
         self.entities: Dict[str, Entity] = {}  # pylint: disable=used-before-assignment
         self._tasks: List[asyncio.Future] = []
-        # Method to cancel the state change listener
-        self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
+        # Phase the entities are polled in, by entity id
+        self._polling_entities: Dict[str, int] = {}
+        # Entities polled in a phase, in the order they were added
+        self._polling_phases: Dict[int, Dict[str, None]] = {}
+        # Methods to cancel the timer of a phase, by phase
+        self._polling_unsubs: Dict[int, CALLBACK_TYPE] = {}
+        # Entities with an update still running
+        self._polling_in_flight: Set[str] = set()
+        self._polling_backoff: Dict[str, _EntityBackoff] = {}
+        self.polling_stats = PollingStats()
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
-        self._process_updates: Optional[asyncio.Lock] = None
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
 
@@ -316,17 +382,97 @@ class EntityPlatform:
                 timeout,
             )
 
-        if self._async_unsub_polling is not None or not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            return
+        utc_now = dt_util.utcnow()
+        for entity_id, entity in self.entities.items():
+            if entity.should_poll and entity_id not in self._polling_entities:
+                self._async_start_polling(entity_id, utc_now)
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
+    @property
+    def polling(self) -> bool:
+        """Return if the entities of the platform are polled."""
+        return bool(self._polling_entities)
+
+    def _polling_phase(self, entity_id: str) -> float:
+        """Return the fraction of the scan interval an entity is polled at.
+
+        The fraction comes from the domain, platform, config entry and entity
+        id, so each entity keeps its phase across restarts and the entities
+        are spread over the phases of the scan interval.
+        """
+        entry_id = self.config_entry.entry_id if self.config_entry else ""
+        key = f"{self.domain}.{self.platform_name}.{entry_id}.{entity_id}"
+        return zlib.crc32(key.encode()) / 2 ** 32
+
+    @callback
+    def _async_start_polling(self, entity_id: str, utc_now: datetime) -> None:
+        """Poll an entity with the other entities of its phase."""
+        phase = int(self._polling_phase(entity_id) * POLLING_PHASES)
+        self._polling_entities[entity_id] = phase
+        self._polling_phases.setdefault(phase, {})[entity_id] = None
+        if phase not in self._polling_unsubs:
+            self._async_schedule_poll(
+                phase, utc_now + self.scan_interval * (1 - phase / POLLING_PHASES)
+            )
+
+    @callback
+    def _async_schedule_poll(self, phase: int, point_in_time: datetime) -> None:
+        """Schedule the next poll of the entities of a phase."""
+        self._polling_unsubs[phase] = async_track_point_in_utc_time(
+            self.hass, partial(self._async_handle_poll, phase), point_in_time
         )
 
+    @callback
+    def _async_stop_polling(self, entity_id: str) -> None:
+        """Stop polling an entity."""
+        self._polling_backoff.pop(entity_id, None)
+        phase = self._polling_entities.pop(entity_id, None)
+        if phase is None:
+            return
+        entity_ids = self._polling_phases[phase]
+        del entity_ids[entity_id]
+        if not entity_ids:
+            del self._polling_phases[phase]
+            self._polling_unsubs.pop(phase)()
+
+    @callback
+    def _async_handle_poll(self, phase: int, now: datetime) -> None:
+        """Poll the entities of a phase and schedule their next poll."""
+        next_poll = now + self.scan_interval
+        utc_now = dt_util.utcnow()
+        if next_poll <= utc_now:
+            # Skip the polls missed while the event loop was blocked
+            missed = (utc_now - next_poll) // self.scan_interval + 1
+            next_poll += self.scan_interval * missed
+        self._async_schedule_poll(phase, next_poll)
+
+        for entity_id in list(self._polling_phases[phase]):
+            self._async_poll(entity_id)
+
+    @callback
+    def _async_poll(self, entity_id: str) -> None:
+        """Poll an entity unless its previous update is running or failed."""
+        entity = self.entities[entity_id]
+        if not entity.should_poll:
+            return
+
+        if entity_id in self._polling_in_flight:
+            self.polling_stats.overruns += 1
+            self.polling_stats.skipped += 1
+            self.logger.warning(
+                "Updating %s took longer than the scheduled update interval %s",
+                entity_id,
+                self.scan_interval,
+            )
+            return
+
+        backoff = self._polling_backoff.get(entity_id)
+        if backoff is not None and backoff.to_skip:
+            backoff.to_skip -= 1
+            self.polling_stats.skipped += 1
+            return
+
+        self.hass.async_create_task(self._async_poll_entity(entity))
+
     async def _async_add_entity(
         self, entity, update_before_add, entity_registry, device_registry
     ):
@@ -476,10 +622,16 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
-        entity.async_on_remove(lambda: self.entities.pop(entity_id))
+        entity.async_on_remove(partial(self._async_entity_removed, entity_id))
 
         await entity.add_to_platform_finish()
 
+    @callback
+    def _async_entity_removed(self, entity_id: str) -> None:
+        """Forget an entity removed from Home Assistant."""
+        self.entities.pop(entity_id)
+        self._async_stop_polling(entity_id)
+
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
 
@@ -496,10 +648,6 @@ class EntityPlatform:
 
         await asyncio.gather(*tasks)
 
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
-
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
 
@@ -512,13 +660,6 @@ class EntityPlatform:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
-        # Clean up polling job if no longer needed
-        if self._async_unsub_polling is not None and not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
-
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
     ) -> List["Entity"]:
@@ -562,34 +703,43 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
-
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+    async def _async_poll_entity(self, entity: "Entity") -> None:
+        """Update an entity, polling it less often if failing.
 
-        This method must be run in the event loop.
+        The polls of an entity are skipped while its update is running, an
+        entity failing repeatedly skips exponentially more polls after each
+        failure, up to POLLING_MAX_SKIPPED.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
+        entity_id = entity.entity_id
+        self._polling_in_flight.add(entity_id)
+        start = monotonic()
+        try:
+            await entity.async_device_update()
+        except Exception:  # pylint: disable=broad-except
+            self.logger.exception("Update for %s fails", entity_id)
+            self.polling_stats.failures += 1
+            if entity_id in self._polling_entities:
+                backoff = self._polling_backoff.setdefault(entity_id, _EntityBackoff())
+                backoff.failures += 1
+                if backoff.failures >= POLLING_FAILURES_BEFORE_BACKOFF:
+                    backoff.to_skip = min(
+                        2 ** (backoff.failures - POLLING_FAILURES_BEFORE_BACKOFF + 1)
+                        - 1,
+                        POLLING_MAX_SKIPPED,
+                    )
             return
+        finally:
+            self._polling_in_flight.discard(entity_id)
+            duration = monotonic() - start
+            stats = self.polling_stats
+            stats.polls += 1
+            stats.total_duration += duration
+            stats.last_duration = duration
+            stats.max_duration = max(stats.max_duration, duration)
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
-
-            if tasks:
-                await asyncio.gather(*tasks)
+        self._polling_backoff.pop(entity_id, None)
+        if entity_id in self.entities:
+            entity.async_write_ha_state()
 
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
@@ -611,3 +761,20 @@ def async_get_platforms(
     platforms: List[EntityPlatform] = hass.data[DATA_ENTITY_PLATFORM][integration_name]
 
     return platforms
+
+
+@callback
+def async_get_polling_stats(hass: HomeAssistantType) -> List[Dict[str, Any]]:
+    """Return the polling statistics of the platforms polling entities."""
+    return [
+        {
+            "domain": platform.domain,
+            "platform": platform.platform_name,
+            "config_entry_id": platform.config_entry and platform.config_entry.entry_id,
+            "scan_interval": platform.scan_interval.total_seconds(),
+            **platform.polling_stats.as_dict(),
+        }
+        for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values()
+        for platform in platforms
+        if platform.polling or platform.polling_stats.polls
+    ]
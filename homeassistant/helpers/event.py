@@ -3,6 +3,7 @@ import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
 import logging
 import time
 from typing import (
@@ -52,6 +53,9 @@ MAX_TIME_TRACKING_ERROR = 0.001
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
 TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
 
+TRACK_STATE_CHANGE_DOMAIN_CALLBACKS = "track_state_change_domain_callbacks"
+TRACK_STATE_CHANGE_DOMAIN_LISTENER = "track_state_change_domain_listener"
+
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
@@ -65,6 +69,13 @@ _TEMPLATE_ALL_LISTENER = "all"
 _TEMPLATE_DOMAINS_LISTENER = "domains"
 _TEMPLATE_ENTITIES_LISTENER = "entities"
 
+DATA_TIMER_WHEEL = "event_timer_wheel"
+# Resolution of the slots of the timer wheel in seconds
+TIMER_WHEEL_TICK = 1
+
+# Attribute of the wrappers scheduled for an action, naming the owner of the action
+_TIMER_OWNER_ATTR = "_timer_owner"
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -74,10 +85,15 @@ class TrackTemplate:
 
     The template is template to calculate.
     The variables are variables to pass to the template.
+    The rate limit is the minimum time between renders triggered by state
+    changes in the domains the template iterates, or by any state change
+    when the template iterates all states. The changes are coalesced into a
+    single render at the end of the rate limit.
     """
 
     template: Template
     variables: TemplateVarsType
+    rate_limit: Optional[timedelta] = None
 
 
 @dataclass
@@ -358,6 +374,51 @@ def _async_dispatch_domain_event(
             )
 
 
+@bind_hass
+def async_track_state_change_domain(
+    hass: HomeAssistant,
+    domains: Union[str, Iterable[str]],
+    action: Callable[[Event], Any],
+) -> Callable[[], None]:
+    """Track state change events indexed by domain.
+
+    Pass MATCH_ALL to track the state changes of every domain. A single
+    EVENT_STATE_CHANGED listener is shared by all callers and routes the
+    events with a dict lookup of the domain.
+    """
+
+    domain_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_DOMAIN_CALLBACKS, {})
+
+    if TRACK_STATE_CHANGE_DOMAIN_LISTENER not in hass.data:
+
+        @callback
+        def _async_state_change_dispatcher(event: Event) -> None:
+            """Dispatch state changes by domain."""
+            _async_dispatch_domain_event(hass, event, domain_callbacks)
+
+        hass.data[TRACK_STATE_CHANGE_DOMAIN_LISTENER] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, _async_state_change_dispatcher
+        )
+
+    domains = _async_string_to_lower_list(domains)
+
+    for domain in domains:
+        domain_callbacks.setdefault(domain, []).append(action)
+
+    @callback
+    def remove_listener() -> None:
+        """Remove state change listener."""
+        _async_remove_indexed_listeners(
+            hass,
+            TRACK_STATE_CHANGE_DOMAIN_CALLBACKS,
+            TRACK_STATE_CHANGE_DOMAIN_LISTENER,
+            domains,
+            action,
+        )
+
+    return remove_listener
+
+
 @bind_hass
 def async_track_state_added_domain(
     hass: HomeAssistant,
@@ -562,16 +623,31 @@ class _TrackTemplateResultInfo:
         self._last_result: Dict[Template, Union[str, TemplateError]] = {}
         self._last_info: Dict[Template, RenderInfo] = {}
         self._info: Dict[Template, RenderInfo] = {}
+        # The states read by the templates, found without rendering them
+        self._static_info: Dict[Template, RenderInfo] = {}
+        self._last_refresh_event: Optional[Event] = None
         self._last_domains: Set = set()
         self._last_entities: Set = set()
 
+        self._last_render: Dict[Template, datetime] = {}
+        self._pending_renders: Dict[Template, CALLBACK_TYPE] = {}
+        self._skipped_renders = 0
+        self._delayed_renders = 0
+
     def async_setup(self) -> None:
         """Activation of template tracking."""
         for track_template_ in self._track_templates:
             template = track_template_.template
             variables = track_template_.variables
 
+            static_info = template.async_static_render_info()
+            # Templates that can read all states are better served by the
+            # listeners of the branches rendered
+            if static_info is not None and not static_info.all_states:
+                self._static_info[template] = static_info
+
             self._info[template] = template.async_render_to_info(variables)
+            self._last_render[template] = dt_util.utcnow()
             if self._info[template].exception:
                 _LOGGER.error(
                     "Error while processing template: %s",
@@ -596,23 +672,45 @@ class _TrackTemplateResultInfo:
             "domains": self._last_domains,
         }
 
+    def _dependency_info(
+        self, template: Template, infos: Dict[Template, RenderInfo]
+    ) -> RenderInfo:
+        """Return the info of the states read by a template.
+
+        The info found without rendering is used when available, it includes
+        the states read by all branches of the template. Renders that raised
+        an error fall back to listening for all states.
+        """
+        info = infos[template]
+        if info.exception:
+            return info
+        return self._static_info.get(template) or info
+
     @property
     def _needs_all_listener(self) -> bool:
         for track_template_ in self._track_templates:
-            template = track_template_.template
+            info = self._dependency_info(track_template_.template, self._info)
 
             # Tracking all states
-            if self._info[template].all_states:
+            if info.all_states:
                 return True
 
             # Previous call had an exception
             # so we do not know which states
             # to track
-            if self._info[template].exception:
+            if info.exception:
                 return True
 
         return False
 
+    @property
+    def rate_limit_stats(self) -> Dict[str, int]:
+        """Renders skipped and delayed by the rate limits."""
+        return {
+            "skipped": self._skipped_renders,
+            "delayed": self._delayed_renders,
+        }
+
     @property
     def _all_templates_are_static(self) -> bool:
         for track_template_ in self._track_templates:
@@ -631,7 +729,7 @@ class _TrackTemplateResultInfo:
             return
 
         self._last_entities, self._last_domains = _entities_domains_from_info(
-            self._info.values()
+            self._dependency_info(template, self._info) for template in self._info
         )
         self._setup_domains_listener(self._last_domains)
         self._setup_entities_listener(self._last_domains, self._last_entities)
@@ -660,7 +758,9 @@ class _TrackTemplateResultInfo:
         if had_all_listener:
             self._cancel_listener(_TEMPLATE_ALL_LISTENER)
 
-        entities, domains = _entities_domains_from_info(self._info.values())
+        entities, domains = _entities_domains_from_info(
+            self._dependency_info(template, self._info) for template in self._info
+        )
         domains_changed = domains != self._last_domains
 
         if had_all_listener or domains_changed:
@@ -695,7 +795,7 @@ class _TrackTemplateResultInfo:
             return
 
         self._listeners[_TEMPLATE_DOMAINS_LISTENER] = async_track_state_added_domain(
-            self.hass, domains, self._refresh
+            self.hass, domains, self._refresh_domain_changed
         )
 
     @callback
@@ -710,6 +810,8 @@ class _TrackTemplateResultInfo:
         self._cancel_listener(_TEMPLATE_ALL_LISTENER)
         self._cancel_listener(_TEMPLATE_DOMAINS_LISTENER)
         self._cancel_listener(_TEMPLATE_ENTITIES_LISTENER)
+        while self._pending_renders:
+            self._pending_renders.popitem()[1]()
 
     @callback
     def async_refresh(self) -> None:
@@ -717,20 +819,92 @@ class _TrackTemplateResultInfo:
         self._refresh(None)
 
     @callback
-    def _refresh(self, event: Optional[Event]) -> None:
+    def _refresh_domain_changed(self, event: Event) -> None:
+        """Refresh after an entity is added to or removed from a domain."""
+        # The entities of the domains are not part of the rendered info, so
+        # a render does not update the listener for them
+        self._cancel_listener(_TEMPLATE_ENTITIES_LISTENER)
+        self._setup_entities_listener(self._last_domains, self._last_entities)
+
+        self._refresh(event)
+
+    @callback
+    def _rate_limited(
+        self, track_template_: TrackTemplate, entity_id: Optional[str]
+    ) -> bool:
+        """Return if the render is skipped or delayed by the rate limit.
+
+        Only renders triggered through iterated domains or all states are
+        rate limited, entities referenced on their own render immediately.
+        """
+        if track_template_.rate_limit is None or entity_id is None:
+            return False
+
+        template = track_template_.template
+        info = self._dependency_info(template, self._last_info)
+        if not info.all_states and split_entity_id(entity_id)[0] not in info.domains:
+            return False
+
+        if template in self._pending_renders:
+            # Coalesced into the pending render
+            self._skipped_renders += 1
+            return True
+
+        last_render = self._last_render.get(template)
+        if last_render is None:
+            return False
+
+        next_render = last_render + track_template_.rate_limit
+        if next_render <= dt_util.utcnow():
+            return False
+
+        @callback
+        def _render_delayed(_now: datetime) -> None:
+            del self._pending_renders[template]
+            self._refresh(None, [track_template_])
+
+        self._skipped_renders += 1
+        self._delayed_renders += 1
+        self._pending_renders[template] = async_track_point_in_utc_time(
+            self.hass, _render_delayed, next_render
+        )
+        return True
+
+    @callback
+    def _refresh(
+        self,
+        event: Optional[Event],
+        track_templates: Optional[Iterable[TrackTemplate]] = None,
+    ) -> None:
+        if event is not None:
+            if event is self._last_refresh_event:
+                # Refreshed by both the domains and the entities listener
+                return
+            self._last_refresh_event = event
+
         entity_id = event and event.data.get(ATTR_ENTITY_ID)
         updates = []
         info_changed = False
 
-        for track_template_ in self._track_templates:
+        for track_template_ in track_templates or self._track_templates:
             template = track_template_.template
             if (
                 entity_id
                 and len(self._last_info) > 1
-                and not self._last_info[template].filter_lifecycle(entity_id)
+                and not self._dependency_info(
+                    template, self._last_info
+                ).filter_lifecycle(entity_id)
             ):
                 continue
 
+            if self._rate_limited(track_template_, entity_id):
+                continue
+
+            if template in self._pending_renders:
+                # The render is up to date, drop the pending render
+                self._pending_renders.pop(template)()
+            self._last_render[template] = dt_util.utcnow()
+
             _LOGGER.debug(
                 "Template update %s triggered by event: %s", template.template, event
             )
@@ -816,6 +990,11 @@ def async_track_template_result(
     Once the template returns to a non-error condition the result is sent
     to the action as usual.
 
+    Templates with a rate limit that iterate all states or the states of a
+    domain are rendered at most once per rate limit for changes of those
+    states. The rate limited changes are coalesced into a render at the
+    end of the rate limit.
+
     Parameters
     ----------
     hass
@@ -904,6 +1083,191 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+class _Timer:
+    """Action scheduled by the timer wheel."""
+
+    __slots__ = ("owner", "when", "action", "cancelled")
+
+    def __init__(self, owner: str, when: float, action: Callable[[], None]) -> None:
+        """Initialize the timer."""
+        self.owner = owner
+        self.when = when
+        self.action = action
+        self.cancelled = False
+
+
+class TimerWheel:
+    """Schedule the timers of the time trackers on the event loop.
+
+    The timers are kept in slots of TIMER_WHEEL_TICK seconds by the UTC
+    timestamp they are due at. The wheel has a single call_at handle of the
+    event loop, at the time the earliest timer is due. When it fires, all the
+    timers that are due by then run in the order they are due and the handle
+    moves on to the next slot, so thousands of trackers only add one handle
+    to the event loop and scheduling or cancelling a timer does not touch
+    the event loop's heap of handles.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        # Timers by the tick they are due in, the timers of a slot are
+        # kept in the order they were scheduled
+        self._slots: Dict[int, Dict[_Timer, None]] = {}
+        # Heap of the ticks of the slots, it may hold ticks of slots that
+        # were emptied by cancelling their timers but holds each tick once
+        self._ticks: List[int] = []
+        self._queued_ticks: Set[int] = set()
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._handle_when: Optional[float] = None
+
+    @callback
+    def async_schedule(
+        self, owner: str, timestamp: float, action: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Run a callback action at a UTC timestamp, return a cancel callback."""
+        timer = _Timer(owner, timestamp, action)
+        tick = int(timestamp // TIMER_WHEEL_TICK)
+        slot = self._slots.get(tick)
+        if slot is None:
+            slot = self._slots[tick] = {}
+            if tick not in self._queued_ticks:
+                self._queued_ticks.add(tick)
+                heapq.heappush(self._ticks, tick)
+        slot[timer] = None
+        if self._handle_when is None or timestamp < self._handle_when:
+            self._async_set_handle(timestamp)
+
+        @callback
+        def cancel_timer() -> None:
+            """Cancel the timer."""
+            # A timer that is due can still be cancelled by one that runs
+            # before it
+            timer.cancelled = True
+            slot = self._slots.get(tick)
+            if slot is None or slot.pop(timer, False) is False:
+                return
+            if not slot:
+                del self._slots[tick]
+            if not self._slots:
+                self._async_cancel_handle()
+
+        return cancel_timer
+
+    @callback
+    def _async_set_handle(self, timestamp: float) -> None:
+        """Move the handle of the event loop to a UTC timestamp."""
+        self._async_cancel_handle()
+        self._handle_when = timestamp
+        # We always get time.time() first to avoid time.time()
+        # ticking forward after fetching hass.loop.time()
+        self._handle = self.hass.loop.call_at(
+            -time.time() + self.hass.loop.time() + timestamp, self._async_fire
+        )
+
+    @callback
+    def _async_cancel_handle(self) -> None:
+        """Cancel the handle of the event loop."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._handle_when = None
+
+    @callback
+    def _async_fire(self) -> None:
+        """Run the timers that are due and move the handle to the next one."""
+        assert self._handle_when is not None
+        # The handle may fire a little early, its timers are due anyway
+        now = max(self._handle_when, pattern_utc_now().timestamp())
+        self._handle = self._handle_when = None
+
+        due: List[_Timer] = []
+        while self._ticks and self._ticks[0] <= now // TIMER_WHEEL_TICK:
+            tick = self._ticks[0]
+            slot = self._slots.get(tick)
+            if slot is None:
+                self._async_pop_tick()
+                continue
+            pending = {timer: None for timer in slot if timer.when > now}
+            due.extend(timer for timer in slot if timer.when <= now)
+            if pending:
+                # Only the slot of the current tick has timers due later
+                self._slots[tick] = pending
+                break
+            del self._slots[tick]
+            self._async_pop_tick()
+
+        # Sorting is stable, the timers due at the same time keep their order
+        due.sort(key=lambda timer: timer.when)
+        for timer in due:
+            if timer.cancelled:
+                continue
+            try:
+                timer.action()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running timer of %s", timer.owner)
+
+        # The actions may have scheduled timers, the next one is the earliest
+        # of the first slot
+        while self._ticks and self._ticks[0] not in self._slots:
+            self._async_pop_tick()
+        if self._ticks:
+            when = min(timer.when for timer in self._slots[self._ticks[0]])
+            if when != self._handle_when:
+                self._async_set_handle(when)
+
+    @callback
+    def _async_pop_tick(self) -> None:
+        """Remove the first tick from the heap of ticks."""
+        self._queued_ticks.discard(heapq.heappop(self._ticks))
+
+    @callback
+    def async_stats(self) -> Dict[str, Any]:
+        """Return the number of pending timers, in total and by owner."""
+        owners: Dict[str, int] = {}
+        for slot in self._slots.values():
+            for timer in slot:
+                owners[timer.owner] = owners.get(timer.owner, 0) + 1
+        return {
+            "timers": sum(owners.values()),
+            "slots": len(self._slots),
+            "owners": dict(sorted(owners.items(), key=lambda item: -item[1])),
+        }
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Return the timer wheel of Home Assistant."""
+    wheel: Optional[TimerWheel] = hass.data.get(DATA_TIMER_WHEEL)
+    if wheel is None:
+        wheel = hass.data[DATA_TIMER_WHEEL] = TimerWheel(hass)
+    return wheel
+
+
+@callback
+@bind_hass
+def async_get_timer_stats(hass: HomeAssistant) -> Dict[str, Any]:
+    """Return the number of pending timers, in total and by owner.
+
+    The owner of a timer is the module of the action it runs.
+    """
+    return _async_get_timer_wheel(hass).async_stats()
+
+
+def _timer_owner(action: Callable[..., Any]) -> str:
+    """Return the owner of an action scheduled on the timer wheel."""
+    owner: Optional[str] = getattr(action, _TIMER_OWNER_ATTR, None)
+    if owner is not None:
+        return owner
+    while isinstance(action, ft.partial):
+        action = action.func
+    return getattr(action, "__module__", None) or "unknown"
+
+
+def _set_timer_owner(wrapper: Callable[..., Any], action: Callable[..., Any]) -> None:
+    """Set the owner of the action a wrapper calls as the owner of the wrapper."""
+    setattr(wrapper, _TIMER_OWNER_ATTR, _timer_owner(action))
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
@@ -916,6 +1280,7 @@ def async_track_point_in_time(
         """Convert passed in UTC now to local now."""
         hass.async_run_job(action, dt_util.as_local(utc_now))
 
+    _set_timer_owner(utc_converter, action)
     return async_track_point_in_utc_time(hass, utc_converter, point_in_time)
 
 
@@ -931,20 +1296,12 @@ def async_track_point_in_utc_time(
     # Ensure point_in_time is UTC
     utc_point_in_time = dt_util.as_utc(point_in_time)
 
-    cancel_callback = hass.loop.call_at(
-        hass.loop.time() + point_in_time.timestamp() - time.time(),
-        hass.async_run_job,
-        action,
-        utc_point_in_time,
+    return _async_get_timer_wheel(hass).async_schedule(
+        _timer_owner(action),
+        point_in_time.timestamp(),
+        ft.partial(hass.async_run_job, action, utc_point_in_time),
     )
 
-    @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        cancel_callback.cancel()
-
-    return unsub_point_in_time_listener
-
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
 
@@ -984,6 +1341,7 @@ def async_track_time_interval(
         remove = async_track_point_in_utc_time(hass, interval_listener, next_interval())
         hass.async_run_job(action, now)
 
+    _set_timer_owner(interval_listener, action)
     remove = async_track_point_in_utc_time(hass, interval_listener, next_interval())
 
     def remove_listener() -> None:
@@ -1126,9 +1484,12 @@ def async_track_utc_time_change(
 
     # Make sure rolling back the clock doesn't prevent the timer from
     # triggering.
-    cancel_callback: Optional[asyncio.TimerHandle] = None
+    cancel_callback: Optional[CALLBACK_TYPE] = None
     calculate_next(next_time)
 
+    wheel = _async_get_timer_wheel(hass)
+    owner = _timer_owner(action)
+
     @callback
     def pattern_time_change_listener() -> None:
         """Listen for matching time_changed events."""
@@ -1139,15 +1500,13 @@ def async_track_utc_time_change(
 
         calculate_next(now + timedelta(seconds=1))
 
-        cancel_callback = hass.loop.call_at(
-            -time.time()
-            + hass.loop.time()
-            + next_time.timestamp()
-            + MAX_TIME_TRACKING_ERROR,
+        cancel_callback = wheel.async_schedule(
+            owner,
+            next_time.timestamp() + MAX_TIME_TRACKING_ERROR,
             pattern_time_change_listener,
         )
 
-    # We always get time.time() first to avoid time.time()
+    # The timer wheel gets time.time() first to avoid time.time()
     # ticking forward after fetching hass.loop.time()
     # and callback being scheduled a few microseconds early.
     #
@@ -1168,11 +1527,11 @@ def async_track_utc_time_change(
     # in the event being fired again since we would otherwise
     # potentially fire early.
     #
-    cancel_callback = hass.loop.call_at(
-        -time.time()
-        + hass.loop.time()
-        + next_time.timestamp()
-        + MAX_TIME_TRACKING_ERROR,
+    # The trackers matching the same second are due at the same
+    # timestamp, so they share a slot of the timer wheel.
+    cancel_callback = wheel.async_schedule(
+        owner,
+        next_time.timestamp() + MAX_TIME_TRACKING_ERROR,
         pattern_time_change_listener,
     )
 
@@ -1181,7 +1540,7 @@ def async_track_utc_time_change(
         """Cancel the call_later."""
         nonlocal cancel_callback
         assert cancel_callback is not None
-        cancel_callback.cancel()
+        cancel_callback()
 
     return unsub_pattern_time_change_listener
 
@@ -1,25 +1,77 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
 from datetime import datetime
+from functools import partial
 import json
 import logging
-from typing import Any
+from typing import Any, Callable, Iterable, Optional
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Raise TypeError for objects that can't be converted.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class JSONEncoder(json.JSONEncoder):
     """JSONEncoder that supports Home Assistant objects."""
 
     def default(self, o: Any) -> Any:
-        """Convert Home Assistant objects.
-
-        Hand other objects to the original method.
-        """
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, set):
-            return list(o)
-        if hasattr(o, "as_dict"):
-            return o.as_dict()
-
-        return json.JSONEncoder.default(self, o)
+        """Convert Home Assistant objects."""
+        return json_encoder_default(o)
+
+
+JSON_DUMP: Callable[[Any], str] = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
+
+_json_backend: Callable[[Any], str] = JSON_DUMP
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data to JSON with the active backend.
+
+    Raises ValueError or TypeError if the data can't be serialized.
+    """
+    return _json_backend(data)
+
+
+def set_json_backend(dumps: Optional[Callable[[Any], str]]) -> None:
+    """Replace the backend of json_dumps, None restores the default one.
+
+    The backend is called with the data to serialize and returns a string,
+    it should support the Home Assistant objects by calling
+    json_encoder_default for the objects it can't serialize itself.
+
+    JSON already cached by the serialized objects is not invalidated.
+    """
+    global _json_backend  # pylint: disable=global-statement
+    _json_backend = dumps or JSON_DUMP
+
+
+def orjson_dumps(data: Any) -> str:
+    """Serialize data to JSON with orjson, a faster backend.
+
+    orjson is not a requirement of Home Assistant, it needs to be installed
+    to use this backend. Unlike the default backend, it writes NaN and
+    infinity as null instead of raising ValueError.
+    """
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    return orjson.dumps(  # type: ignore[no-any-return]
+        data,
+        default=json_encoder_default,
+        option=orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+def json_fragments_list(fragments: Iterable[str]) -> str:
+    """Return the JSON of a list from the JSON of its items."""
+    return f"[{', '.join(fragments)}]"
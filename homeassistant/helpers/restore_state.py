@@ -2,7 +2,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import logging
-from typing import Any, Dict, List, Optional, Set, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import (
@@ -34,17 +34,45 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long between full dumps. The states of the registered entities that
+# don't change are only seen again by a full dump, so it must run well within
+# the expiration of the stored states.
+FULL_DUMP_INTERVAL = timedelta(days=1)
+
+# The journal is compacted into a full dump when it holds more entries than
+# the number of stored states, or than this minimum
+JOURNAL_COMPACT_MIN_ENTRIES = 1000
+
 
 class StoredState:
-    """Object to represent a stored state."""
+    """Object to represent a stored state.
 
-    def __init__(self, state: State, last_seen: datetime) -> None:
+    Stored states loaded from storage parse their state on first access.
+    """
+
+    def __init__(
+        self,
+        state: Optional[State],
+        last_seen: datetime,
+        state_dict: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """Initialize a new stored state."""
-        self.state = state
+        self._state = state
+        self._state_dict = state_dict
         self.last_seen = last_seen
 
+    @property
+    def state(self) -> State:
+        """Return the stored state."""
+        if self._state_dict is not None:
+            self._state = State.from_dict(self._state_dict)
+            self._state_dict = None
+        return cast(State, self._state)
+
     def as_dict(self) -> Dict[str, Any]:
         """Return a dict representation of the stored state."""
+        if self._state_dict is not None:
+            return {"state": self._state_dict, "last_seen": self.last_seen}
         return {"state": self.state.as_dict(), "last_seen": self.last_seen}
 
     @classmethod
@@ -55,7 +83,7 @@ class StoredState:
         if isinstance(last_seen, str):
             last_seen = dt_util.parse_datetime(last_seen)
 
-        return cls(State.from_dict(json_dict["state"]), last_seen)
+        return cls(None, last_seen, json_dict["state"])
 
 
 class RestoreStateData:
@@ -71,20 +99,23 @@ class RestoreStateData:
             data = cls(hass)
 
             try:
-                stored_states = await data.store.async_load()
+                stored_states, journal = await asyncio.gather(
+                    data.store.async_load(), data.store.async_load_journal()
+                )
             except HomeAssistantError as exc:
                 _LOGGER.error("Error loading last states", exc_info=exc)
-                stored_states = None
+                stored_states, journal = None, []
 
-            if stored_states is None:
+            if stored_states is None and not journal:
                 _LOGGER.debug("Not creating cache - no saved states found")
                 data.last_states = {}
             else:
                 data.last_states = {
                     item["state"]["entity_id"]: StoredState.from_dict(item)
-                    for item in stored_states
+                    for item in stored_states or ()
                     if valid_entity_id(item["state"]["entity_id"])
                 }
+                _replay_journal(data.last_states, journal)
                 _LOGGER.debug("Created cache with %s", list(data.last_states))
 
             if hass.state == CoreState.running:
@@ -102,10 +133,15 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, compact=True
         )
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # What the states and stored states of the last dump were, by entity
+        # id, without keeping the states alive
+        self._dumped: Dict[str, Tuple[datetime, Optional[str]]] = {}
+        self._journal_entries = 0
+        self._last_full_dump: Optional[datetime] = None
 
     @callback
     def async_get_stored_states(self) -> List[StoredState]:
@@ -116,6 +152,20 @@ class RestoreStateData:
         entities on this run, and have not expired.
         """
         now = dt_util.utcnow()
+        current_states, stored_states = self._async_get_states_to_store(now)
+        return [StoredState(state, now) for state in current_states.values()] + list(
+            stored_states.values()
+        )
+
+    @callback
+    def _async_get_states_to_store(
+        self, now: datetime
+    ) -> Tuple[Dict[str, State], Dict[str, StoredState]]:
+        """Get the states of the registered entities and the stored states.
+
+        Returns the states of the registered entities and the stored states
+        from the previous run to store, by entity id.
+        """
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
         current_entity_ids = {
@@ -125,13 +175,14 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(state, now)
+        current_states = {
+            state.entity_id: state
             for state in all_states
             if state.entity_id in self.entity_ids and
             # Ignore all states that are entity registry placeholders
             not state.attributes.get(entity_registry.ATTR_RESTORED)
-        ]
+        }
+        stored_states = {}
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
@@ -145,40 +196,98 @@ class RestoreStateData:
             if stored_state.last_seen < expiration_time:
                 continue
 
-            stored_states.append(stored_state)
+            stored_states[entity_id] = stored_state
 
-        return stored_states
+        return current_states, stored_states
 
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        current_states, stored_states = self._async_get_states_to_store(now)
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [StoredState(state, now).as_dict() for state in current_states.values()]
+                + [stored_state.as_dict() for stored_state in stored_states.values()]
             )
+            # The full dump replaces the journal
+            await self.store.async_remove_journal()
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._dumped = _dumped_keys(current_states, stored_states)
+        self._journal_entries = 0
+        self._last_full_dump = now
+
+    async def async_dump_changed_states(self) -> None:
+        """Append the states changed since the last dump to the journal.
+
+        The journal is compacted into a full dump when it grows larger
+        than the number of stored states, or when the last full dump is
+        older than FULL_DUMP_INTERVAL.
+        """
+        now = dt_util.utcnow()
+        current_states, stored_states = self._async_get_states_to_store(now)
+        if (
+            self._last_full_dump is None
+            or now - self._last_full_dump >= FULL_DUMP_INTERVAL
+            or self._journal_entries
+            > max(JOURNAL_COMPACT_MIN_ENTRIES, len(current_states) + len(stored_states))
+        ):
+            await self.async_dump_states()
+            return
+
+        _LOGGER.debug("Dumping changed states")
+        dumped = self._dumped
+        entries: List[Dict[str, Any]] = [
+            # States of the registered entities are seen until the last dump
+            {"state": state.as_dict(), "dumped": now}
+            for entity_id, state in current_states.items()
+            if dumped.get(entity_id) != (state.last_updated, state.context.id)
+        ]
+        entries.extend(
+            {**stored_state.as_dict(), "dumped": now}
+            for entity_id, stored_state in stored_states.items()
+            if dumped.get(entity_id) != (stored_state.last_seen, None)
+        )
+        entries.extend(
+            {"removed": entity_id, "dumped": now}
+            for entity_id in dumped
+            if entity_id not in current_states and entity_id not in stored_states
+        )
+        entries.append({"dumped": now})
+
+        try:
+            await self.store.async_append_journal(entries)
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+            return
+
+        self._dumped = _dumped_keys(current_states, stored_states)
+        self._journal_entries += len(entries)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
-        async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
-        self.hass.async_create_task(_async_dump_states())
+        self.hass.async_create_task(self.async_dump_states())
 
-        # Dump states periodically
-        async_track_time_interval(self.hass, _async_dump_states, STATE_DUMP_INTERVAL)
+        # Dump changed states periodically
+        async_track_time_interval(
+            self.hass, _async_dump_changed_states, STATE_DUMP_INTERVAL
+        )
 
-        # Dump states when stopping hass
-        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_dump_states)
+        # Dump changed states when stopping hass
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, _async_dump_changed_states
+        )
 
     @callback
     def async_restore_entity_added(self, entity_id: str) -> None:
@@ -202,6 +311,69 @@ class RestoreStateData:
         self.entity_ids.remove(entity_id)
 
 
+def _replay_journal(
+    last_states: Dict[str, StoredState], journal: List[Dict[str, Any]]
+) -> None:
+    """Apply the entries of a journal to the stored states of a full dump.
+
+    Entries dumped before the stored state of the full dump was last seen
+    are older than the full dump, they are left by a full dump that could
+    not remove the journal.
+    """
+    if not journal:
+        return
+
+    dumped_times: Dict[str, datetime] = {}
+
+    def parse_dumped(entry: Dict[str, Any]) -> datetime:
+        """Return when an entry was dumped."""
+        dumped = entry["dumped"]
+        if dumped not in dumped_times:
+            dumped_times[dumped] = dt_util.parse_datetime(dumped)
+        return dumped_times[dumped]
+
+    last_dumped = parse_dumped(journal[-1])
+    replayed: Set[str] = set()
+    for entry in journal:
+        entity_id = entry.get("removed") or entry.get("state", {}).get("entity_id")
+        if entity_id is None or not valid_entity_id(entity_id):
+            continue
+
+        if entity_id not in replayed:
+            stored_state = last_states.get(entity_id)
+            dumped = parse_dumped(entry)
+            if stored_state is not None and stored_state.last_seen > dumped:
+                continue
+            replayed.add(entity_id)
+
+        if "removed" in entry:
+            last_states.pop(entity_id, None)
+        elif "last_seen" in entry:
+            last_states[entity_id] = StoredState.from_dict(entry)
+        else:
+            # A registered entity, seen until the last dump
+            last_states[entity_id] = StoredState(None, last_dumped, entry["state"])
+
+
+def _dumped_keys(
+    current_states: Dict[str, State], stored_states: Dict[str, StoredState]
+) -> Dict[str, Tuple[datetime, Optional[str]]]:
+    """Return what identifies the dumped states, by entity id.
+
+    A state is identified by when it was last updated and its context, a
+    stored state by when it was last seen.
+    """
+    dumped: Dict[str, Tuple[datetime, Optional[str]]] = {
+        entity_id: (state.last_updated, state.context.id)
+        for entity_id, state in current_states.items()
+    }
+    dumped.update(
+        (entity_id, (stored_state.last_seen, None))
+        for entity_id, stored_state in stored_states.items()
+    )
+    return dumped
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
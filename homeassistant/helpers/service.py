@@ -54,6 +54,7 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+AREA_ENTITIES_CACHE = "service_area_entities_cache"
 
 
 @bind_hass
@@ -230,26 +231,53 @@ async def async_extract_entity_ids(
         if isinstance(area_ids, str):
             area_ids = [area_ids]
 
-        dev_reg, ent_reg = await asyncio.gather(
-            hass.helpers.device_registry.async_get_registry(),
-            hass.helpers.entity_registry.async_get_registry(),
+        for area_id in area_ids:
+            extracted.update(await _async_get_area_entity_ids(hass, area_id))
+
+    return extracted
+
+
+async def _async_get_area_entity_ids(
+    hass: HomeAssistantType, area_id: str
+) -> Tuple[str, ...]:
+    """Return the ids of the entities of the devices in an area.
+
+    The ids are cached until the device or entity registry is updated.
+    """
+    if AREA_ENTITIES_CACHE not in hass.data:
+        hass.data[AREA_ENTITIES_CACHE] = {}
+
+        @ha.callback
+        def clear_cache(event: ha.Event) -> None:
+            """Clear the cached entity ids when a registry is updated."""
+            hass.data[AREA_ENTITIES_CACHE].clear()
+
+        hass.bus.async_listen(
+            hass.helpers.device_registry.EVENT_DEVICE_REGISTRY_UPDATED, clear_cache
         )
-        devices = [
-            device
-            for area_id in area_ids
-            for device in hass.helpers.device_registry.async_entries_for_area(
-                dev_reg, area_id
-            )
-        ]
-        extracted.update(
-            entry.entity_id
-            for device in devices
-            for entry in hass.helpers.entity_registry.async_entries_for_device(
-                ent_reg, device.id
-            )
+        hass.bus.async_listen(
+            hass.helpers.entity_registry.EVENT_ENTITY_REGISTRY_UPDATED, clear_cache
         )
 
-    return extracted
+    cache: Dict[str, Tuple[str, ...]] = hass.data[AREA_ENTITIES_CACHE]
+    entity_ids = cache.get(area_id)
+    if entity_ids is not None:
+        return entity_ids
+
+    dev_reg, ent_reg = await asyncio.gather(
+        hass.helpers.device_registry.async_get_registry(),
+        hass.helpers.entity_registry.async_get_registry(),
+    )
+    entity_ids = cache[area_id] = tuple(
+        entry.entity_id
+        for device in hass.helpers.device_registry.async_entries_for_area(
+            dev_reg, area_id
+        )
+        for entry in hass.helpers.entity_registry.async_entries_for_device(
+            ent_reg, device.id
+        )
+    )
+    return entity_ids
 
 
 async def _load_services_file(hass: HomeAssistantType, domain: str) -> JSON_TYPE:
@@ -383,20 +411,7 @@ async def entity_service_call(
     # A list with entities to call the service on.
     entity_candidates: List["Entity"] = []
 
-    if entity_perms is None:
-        for platform in platforms:
-            if target_all_entities:
-                entity_candidates.extend(platform.entities.values())
-            else:
-                entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in entity_ids
-                    ]
-                )
-
-    elif target_all_entities:
+    if target_all_entities:
         # If we target all entities, we will select all entities the user
         # is allowed to control.
         for platform in platforms:
@@ -404,26 +419,41 @@ async def entity_service_call(
                 [
                     entity
                     for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
+                    if entity_perms is None
+                    or entity_perms(entity.entity_id, POLICY_CONTROL)
                 ]
             )
 
     else:
+        # The entities of a platform are indexed by entity id, look up the
+        # targeted entities instead of going through all the entities.
         for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in entity_ids:
-                    continue
-
-                if not entity_perms(entity.entity_id, POLICY_CONTROL):
-                    raise Unauthorized(
-                        context=call.context,
-                        entity_id=entity.entity_id,
-                        permission=POLICY_CONTROL,
-                    )
-
-                platform_entities.append(entity)
+            platform_entities = [
+                platform.entities[entity_id]
+                for entity_id in entity_ids
+                if entity_id in platform.entities
+            ]
+            if len(platform_entities) > 1:
+                # Call the entities in the order they were added to the
+                # platform, stop once all the targeted ones have been seen.
+                remaining = len(platform_entities)
+                platform_entities = []
+                for entity in platform.entities.values():
+                    if entity.entity_id not in entity_ids:
+                        continue
+                    platform_entities.append(entity)
+                    remaining -= 1
+                    if not remaining:
+                        break
+
+            if entity_perms is not None:
+                for entity in platform_entities:
+                    if not entity_perms(entity.entity_id, POLICY_CONTROL):
+                        raise Unauthorized(
+                            context=call.context,
+                            entity_id=entity.entity_id,
+                            permission=POLICY_CONTROL,
+                        )
 
             entity_candidates.extend(platform_entities)
 
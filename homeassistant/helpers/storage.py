@@ -1,12 +1,21 @@
 """Helper to help store data."""
 import asyncio
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    POOL_STORAGE,
+    CoreState,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_call_later
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
@@ -17,6 +26,11 @@ from homeassistant.util import json as json_util
 STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
+DATA_STORAGE_WRITER = "storage_writer"
+
+# Delayed writes due within this many seconds are written with an earlier write
+WRITE_COALESCE_WINDOW = 1
+
 
 @bind_hass
 async def async_migrator(
@@ -72,8 +86,14 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        compact: bool = False,
+        compress: bool = False,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        The data is written as indented JSON, unless compact or compress
+        which write minified JSON, gzip compressed for compress.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -81,15 +101,22 @@ class Store:
         self._data: Optional[Dict[str, Any]] = None
         self._unsub_delay_listener: Optional[CALLBACK_TYPE] = None
         self._unsub_final_write_listener: Optional[CALLBACK_TYPE] = None
-        self._write_lock = asyncio.Lock()
+        self._delay_due: Optional[float] = None
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._compact = compact
+        self._compress = compress
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self):
+        """Return the path of the journal."""
+        return self.hass.config.path(STORAGE_DIR, f"{self.key}.journal")
+
     async def async_load(self) -> Union[Dict, List, None]:
         """Load data.
 
@@ -115,7 +142,7 @@ class Store:
                 data["data"] = data.pop("data_func")()
         else:
             data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
+                json_util.load_json, self.path, pool=POOL_STORAGE
             )
 
             if data == {}:
@@ -162,6 +189,8 @@ class Store:
         self._unsub_delay_listener = async_call_later(
             self.hass, delay, self._async_callback_delayed_write
         )
+        self._delay_due = time.monotonic() + delay
+        async_get_writer(self.hass).async_add_delayed(self)
         self._async_ensure_final_write_listener()
 
     @callback
@@ -182,6 +211,9 @@ class Store:
     @callback
     def _async_cleanup_delay_listener(self):
         """Clean up a delay listener."""
+        if self._delay_due is not None:
+            self._delay_due = None
+            async_get_writer(self.hass).async_remove_delayed(self)
         if self._unsub_delay_listener is not None:
             self._unsub_delay_listener()
             self._unsub_delay_listener = None
@@ -193,6 +225,7 @@ class Store:
             self._async_ensure_final_write_listener()
             return
         self._unsub_delay_listener = None
+        self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
         await self._async_handle_write_data()
 
@@ -204,33 +237,108 @@ class Store:
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
+        await async_get_writer(self.hass).async_write(self)
 
-        async with self._write_lock:
-            if self._data is None:
-                # Another write already consumed the data
-                return
-
-            data = self._data
+    @callback
+    def _async_pop_write_data(self) -> Optional[Dict]:
+        """Return the data to write, None if another write consumed it."""
+        if self._data is None:
+            return None
 
-            if "data_func" in data:
-                data["data"] = data.pop("data_func")()
+        data = self._data
 
-            self._data = None
+        if "data_func" in data:
+            data["data"] = data.pop("data_func")()
 
-            try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
-                )
-            except (json_util.SerializationError, json_util.WriteError) as err:
-                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+        self._data = None
+        return data
 
-    def _write_data(self, path: str, data: Dict) -> None:
-        """Write the data."""
+    def _write_data(self, path: str, data: Dict) -> Optional[int]:
+        """Write the data, return the number of bytes written."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s", self.key)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        return json_util.save_json(
+            path,
+            data,
+            self._private,
+            encoder=self._encoder,
+            compact=self._compact,
+            compress=self._compress,
+        )
+
+    async def async_append_journal(self, entries: List[Any]) -> None:
+        """Append entries to the journal of the store.
+
+        The journal is a file of JSON lines next to the data of the store,
+        for data that changes often but is only partially changed. It's not
+        versioned or migrated, users remove it when saving the full data.
+        """
+        await self.hass.async_add_executor_job(
+            self._append_journal_data, self.journal_path, entries, pool=POOL_STORAGE
+        )
+
+    async def async_load_journal(self) -> List[Any]:
+        """Load the entries of the journal, empty if there is no journal."""
+        return await self.hass.async_add_executor_job(
+            self._load_journal_data, self.journal_path, pool=POOL_STORAGE
+        )
+
+    async def async_remove_journal(self) -> None:
+        """Remove the journal."""
+        try:
+            await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+        except FileNotFoundError:
+            pass
+
+    def _append_journal_data(self, path: str, entries: List[Any]) -> None:
+        """Append entries to the journal and sync it to disk."""
+        try:
+            content = "".join(
+                f"{json.dumps(entry, cls=self._encoder)}\n" for entry in entries
+            )
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {path}"
+            ) from err
+
+        _LOGGER.debug(
+            "Appending %s entries to the journal of %s", len(entries), self.key
+        )
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            fd = os.open(
+                path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            with open(fd, "a", encoding="utf-8") as fdesc:
+                fdesc.write(content)
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
+        except OSError as err:
+            raise json_util.WriteError(err) from err
+
+    def _load_journal_data(self, path: str) -> List[Any]:
+        """Load the entries of the journal."""
+        try:
+            with open(path, encoding="utf-8") as fdesc:
+                lines = fdesc.readlines()
+        except FileNotFoundError:
+            return []
+        except OSError as err:
+            raise HomeAssistantError(err) from err
+
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # The last line can be partially written when the system crashed
+                _LOGGER.warning("Ignoring invalid entry in the journal of %s", self.key)
+        return entries
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -242,3 +350,153 @@ class Store:
             await self.hass.async_add_executor_job(os.unlink, self.path)
         except FileNotFoundError:
             pass
+
+
+@callback
+@bind_hass
+def async_get_writer(hass: HomeAssistant) -> "StoreWriter":
+    """Return the writer of the stores."""
+    writer: Optional[StoreWriter] = hass.data.get(DATA_STORAGE_WRITER)
+    if writer is None:
+        writer = hass.data[DATA_STORAGE_WRITER] = StoreWriter(hass)
+    return writer
+
+
+class StoreWriter:
+    """Write the data of all stores, coalescing their writes.
+
+    The stores waiting to be written when a write starts are written
+    together in a single executor job, with the delayed writes due within
+    WRITE_COALESCE_WINDOW. Writes run one at a time, so the stores waiting
+    on a running write are written together by the next one.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        self._lock = asyncio.Lock()
+        self._queue: Dict[Store, asyncio.Future] = {}
+        # The stores with a delayed write, stores are added by async_delay_save
+        self._delayed: Dict[Store, None] = {}
+        # The number of writes, seconds writing and bytes written per key
+        self.metrics: Dict[str, Dict[str, float]] = {}
+
+    @callback
+    def async_add_delayed(self, store: Store) -> None:
+        """Add a store with a delayed write."""
+        self._delayed[store] = None
+
+    @callback
+    def async_remove_delayed(self, store: Store) -> None:
+        """Remove a store that no longer has a delayed write."""
+        self._delayed.pop(store, None)
+
+    async def async_write(self, store: Store) -> None:
+        """Write the data of a store, return when it is written."""
+        future = self._queue.get(store)
+        if future is None:
+            future = self._queue[store] = self.hass.loop.create_future()
+            if len(self._queue) == 1:
+                self.hass.async_create_task(self._async_write_queue())
+        await future
+
+    async def _async_write_queue(self) -> None:
+        """Write the stores in the queue."""
+        # pylint: disable=protected-access
+        async with self._lock:
+            queue, self._queue = self._queue, {}
+            self._async_add_due_delayed_writes(queue)
+
+            writes: List[Tuple[Store, Dict]] = []
+            for store, future in queue.items():
+                try:
+                    data = store._async_pop_write_data()
+                except Exception as err:  # pylint: disable=broad-except
+                    future.set_exception(err)
+                    continue
+                if data is None:
+                    # Another write already consumed the data
+                    future.set_result(None)
+                    continue
+                writes.append((store, data))
+
+            if not writes:
+                return
+
+            try:
+                results = await self.hass.async_add_executor_job(
+                    self._write, writes, pool=POOL_STORAGE
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                # Don't leave the stores waiting if the job can't run
+                results = [(err, None, 0.0)] * len(writes)
+
+            for (store, _), (err, written, duration) in zip(writes, results):
+                self._async_update_metrics(store.key, written, duration)
+                future = queue[store]
+                if err is None:
+                    future.set_result(None)
+                elif isinstance(
+                    err, (json_util.SerializationError, json_util.WriteError)
+                ):
+                    _LOGGER.error("Error writing config for %s: %s", store.key, err)
+                    future.set_result(None)
+                else:
+                    future.set_exception(err)
+
+    @callback
+    def _async_add_due_delayed_writes(self, queue: Dict[Store, asyncio.Future]) -> None:
+        """Add the stores with a delayed write due soon to the queue."""
+        # pylint: disable=protected-access
+        if self.hass.state == CoreState.stopping:
+            # The final write writes all the stores
+            return
+
+        due = time.monotonic() + WRITE_COALESCE_WINDOW
+        for store in list(self._delayed):
+            if store in queue or store._delay_due > due:  # type: ignore
+                continue
+            store._async_cleanup_delay_listener()
+            store._async_cleanup_final_write_listener()
+            queue[store] = self.hass.loop.create_future()
+
+    @staticmethod
+    def _write(
+        writes: List[Tuple[Store, Dict]]
+    ) -> List[Tuple[Optional[Exception], Optional[int], float]]:
+        """Write the data of the stores, return the result of each write."""
+        results: List[Tuple[Optional[Exception], Optional[int], float]] = []
+        for store, data in writes:
+            start = time.monotonic()
+            try:
+                written = store._write_data(  # pylint: disable=protected-access
+                    store.path, data
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                results.append((err, None, time.monotonic() - start))
+            else:
+                results.append((None, written, time.monotonic() - start))
+        return results
+
+    @callback
+    def _async_update_metrics(
+        self, key: str, written: Optional[int], duration: float
+    ) -> None:
+        """Update the write metrics of a store."""
+        metrics = self.metrics.setdefault(
+            key,
+            {
+                "writes": 0,
+                "write_time": 0.0,
+                "last_write_time": 0.0,
+                "bytes_written": 0,
+                "last_bytes_written": 0,
+            },
+        )
+        metrics["writes"] += 1
+        metrics["write_time"] += duration
+        metrics["last_write_time"] = duration
+        if written is not None:
+            metrics["bytes_written"] += written
+            metrics["last_bytes_written"] = written
+        _LOGGER.debug("Wrote %s bytes for %s in %.3fs", written, key, duration)
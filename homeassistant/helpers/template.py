@@ -3,18 +3,23 @@ import base64
 import collections.abc
 from datetime import datetime, timedelta
 from functools import wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import attrgetter
 import random
 import re
-from typing import Any, Iterable, List, Optional, Union
+import threading
+from types import CodeType
+from typing import Any, Dict, Iterable, List, Optional, Union
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
 import jinja2
-from jinja2 import contextfilter, contextfunction
+from jinja2 import contextfilter, contextfunction, nodes
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace  # type: ignore
 import voluptuous as vol
@@ -47,6 +52,14 @@ DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
 
+BYTECODE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_STORAGE_VERSION = 1
+BYTECODE_SAVE_DELAY = 30
+# Compiled code is only valid for the Jinja and Python versions it was made by
+BYTECODE_TAG = f"{jinja2.__version__}-{MAGIC_NUMBER.hex()}"
+# The maximum number of stored templates, the templates used last are kept
+MAX_STORED_TEMPLATES = 10000
+
 _RE_NONE_ENTITIES = re.compile(r"distance\(|closest\(", re.I | re.M)
 _RE_GET_ENTITIES = re.compile(
     r"(?:(?:(?:states\.|(?P<func>is_state|is_state_attr|state_attr|states|expand)\((?:[\ \'\"]?))(?P<entity_id>[\w]+\.[\w]+)|states\.(?P<domain_outer>[a-z]+)|states\[(?:[\'\"]?)(?P<domain_inner>[\w]+))|(?P<variable>[\w]+))",
@@ -59,6 +72,12 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
+# Functions of which the first argument is the entity_id of the state read
+_STATE_FUNCTIONS = {"states", "is_state", "is_state_attr", "state_attr"}
+# Functions reading states that can't be known without rendering
+_UNRESOLVABLE_FUNCTIONS = {"expand", "closest", "distance"}
+_UNRESOLVABLE_NODES = (nodes.Extends, nodes.Include, nodes.Import, nodes.FromImport)
+
 
 @bind_hass
 def attach(hass: HomeAssistantType, obj: Any) -> None:
@@ -214,6 +233,116 @@ class RenderInfo:
             self.filter_lifecycle = self._filter_lifecycle
 
 
+class _UnresolvableTemplate(Exception):
+    """The states read by a template depend on rendering it."""
+
+
+class _StaticAnalyzer:
+    """Find the states a template reads by walking its syntax tree.
+
+    All branches of the template are included, so the states found are
+    the states the template reads in any render.
+    """
+
+    def __init__(self, render_info: RenderInfo) -> None:
+        """Initialize the analyzer."""
+        self.render_info = render_info
+
+    def visit(self, node: nodes.Node) -> None:
+        """Collect the states read by a node."""
+        if isinstance(node, _UNRESOLVABLE_NODES) or (
+            isinstance(node, nodes.Filter) and node.name in _UNRESOLVABLE_FUNCTIONS
+        ):
+            raise _UnresolvableTemplate
+
+        if isinstance(node, nodes.Name):
+            self._visit_name(node)
+            return
+
+        if (
+            isinstance(node, nodes.Call)
+            and isinstance(node.node, nodes.Name)
+            and node.node.name in _STATE_FUNCTIONS
+        ):
+            self._visit_state_function(node)
+            return
+
+        if isinstance(node, (nodes.Getattr, nodes.Getitem)):
+            keys = _states_keys(node)
+            if keys is not None:
+                self._visit_states_keys(keys)
+                return
+
+        for child in node.iter_child_nodes():
+            self.visit(child)
+
+    def _visit_name(self, node: nodes.Name) -> None:
+        """Collect a name, such as iterating all states."""
+        if node.name not in _STATE_FUNCTIONS and node.name not in (
+            _UNRESOLVABLE_FUNCTIONS
+        ):
+            return
+
+        if node.name != "states" or node.ctx != "load":
+            # Assigned to or used without calling it
+            raise _UnresolvableTemplate
+
+        self.render_info.all_states = True
+
+    def _visit_state_function(self, node: nodes.Call) -> None:
+        """Collect the entity_id passed to a state function."""
+        if not node.args or not (
+            isinstance(node.args[0], nodes.Const)
+            and isinstance(node.args[0].value, str)
+        ):
+            raise _UnresolvableTemplate
+
+        self.render_info.entities.add(node.args[0].value.lower())
+        for child in node.iter_child_nodes(exclude=("node",)):
+            self.visit(child)
+
+    def _visit_states_keys(self, keys: List[str]) -> None:
+        """Collect the entity or domain read through the states object."""
+        if "." in keys[0]:
+            self.render_info.entities.add(keys[0].lower())
+            return
+
+        if keys[0] in _RESERVED_NAMES:
+            return
+
+        if len(keys) == 1:
+            if not valid_entity_id(f"{keys[0]}.entity"):
+                raise _UnresolvableTemplate
+            self.render_info.domains.add(keys[0])
+            return
+
+        entity_id = f"{keys[0]}.{keys[1]}"
+        if not valid_entity_id(entity_id):
+            raise _UnresolvableTemplate
+        self.render_info.entities.add(entity_id)
+
+
+def _states_keys(node: nodes.Node) -> Optional[List[str]]:
+    """Return the constant keys of an attribute or item lookup on states.
+
+    Returns None if the node doesn't look up a constant key on states.
+    """
+    keys = []
+    while isinstance(node, (nodes.Getattr, nodes.Getitem)):
+        if isinstance(node, nodes.Getattr):
+            keys.append(node.attr)
+        elif isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
+            keys.append(node.arg.value)
+        else:
+            return None
+        node = node.node
+
+    if isinstance(node, nodes.Name) and node.name == "states" and node.ctx == "load":
+        keys.reverse()
+        return keys
+    return None
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -227,6 +356,7 @@ class Template:
         self._compiled = None
         self.hass = hass
         self.is_static = not is_template_string(template)
+        self._static_render_info: Union[RenderInfo, None, object] = _SENTINEL
 
     @property
     def _env(self):
@@ -313,6 +443,31 @@ class Template:
         render_info._freeze()
         return render_info
 
+    @callback
+    def async_static_render_info(self) -> Optional[RenderInfo]:
+        """Return the states the template reads, found without rendering it.
+
+        Returns None if the states depend on rendering the template, for
+        example when it reads a state by an entity_id from a variable.
+        """
+        if self._static_render_info is _SENTINEL:
+            self._static_render_info = self._analyze()
+        return self._static_render_info  # type: ignore
+
+    def _analyze(self) -> Optional[RenderInfo]:
+        """Find the states the template reads by walking its syntax tree."""
+        if self.is_static:
+            return None
+
+        render_info = RenderInfo(self)
+        try:
+            _StaticAnalyzer(render_info).visit(self._env.parse(self.template))
+        except (_UnresolvableTemplate, jinja2.TemplateSyntaxError):
+            return None
+
+        render_info._freeze()  # pylint: disable=protected-access
+        return render_info
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -1035,6 +1190,130 @@ def urlencode(value):
     return urllib_urlencode(value).encode("utf-8")
 
 
+class TemplateBytecodeCache:
+    """Cache of compiled template code that is stored across restarts.
+
+    The stored code is loaded when the first template is compiled, the
+    templates compiled before it is loaded are compiled from their source.
+    Code stored by other Jinja or Python versions is discarded.
+    """
+
+    def __init__(self, hass):
+        """Initialize the cache."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self._store = None
+        # Templates are compiled from any thread
+        self._lock = threading.Lock()
+        self._load_scheduled = False
+        self._save_scheduled = False
+        # Base64 encoded marshalled code by key, stored by the previous run
+        self._stored: Dict[str, str] = {}
+        # The code used by this run
+        self._used: Dict[str, str] = {}
+
+    async def async_load(self) -> None:
+        """Load the code stored by the previous run."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers.storage import Store
+
+        if self._store is not None:
+            return
+
+        store = Store(
+            self.hass, BYTECODE_STORAGE_VERSION, BYTECODE_STORAGE_KEY, compact=True
+        )
+        data = await store.async_load()
+        with self._lock:
+            self._store = store
+            if data is not None and data["tag"] == BYTECODE_TAG:
+                self._stored = data["templates"]
+            save = self._save_scheduled
+        if save:
+            self._async_schedule_save()
+
+    def get(self, key: str) -> Optional[CodeType]:
+        """Return the compiled code for a key or None, from any thread."""
+        with self._lock:
+            load = not self._load_scheduled
+            self._load_scheduled = True
+            encoded = self._used.get(key) or self._stored.get(key)
+            if encoded is None:
+                self.misses += 1
+        if load:
+            self.hass.add_job(self.async_load)
+        if encoded is None:
+            return None
+
+        try:
+            code = marshal.loads(base64.b64decode(encoded))
+        except (ValueError, EOFError, TypeError):
+            _LOGGER.debug("Discarding invalid compiled template %s", key)
+            with self._lock:
+                self._stored.pop(key, None)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self._used[key] = encoded
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the compiled code for a key, from any thread.
+
+        The cache is saved once after the code of a batch of templates
+        was added.
+        """
+        encoded = base64.b64encode(marshal.dumps(code)).decode()
+        with self._lock:
+            self._used[key] = encoded
+            if self._save_scheduled:
+                return
+            self._save_scheduled = True
+        self.hass.add_job(self._async_schedule_save)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of hits, misses and compiled templates."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stored": len(self._stored),
+                "used": len(self._used),
+            }
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache once it is loaded."""
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, BYTECODE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the data to store, the code used by this run first."""
+        with self._lock:
+            self._save_scheduled = False
+            templates = dict(self._used)
+            for key, encoded in self._stored.items():
+                if len(templates) >= MAX_STORED_TEMPLATES:
+                    break
+                templates.setdefault(key, encoded)
+
+        return {"tag": BYTECODE_TAG, "templates": templates}
+
+
+@callback
+@bind_hass
+def async_get_bytecode_cache_stats(hass: HomeAssistantType) -> Dict[str, int]:
+    """Return the number of hits, misses and compiled templates of the cache."""
+    env = hass.data.get(_ENVIRONMENT)
+    if env is None:
+        return {"hits": 0, "misses": 0, "stored": 0, "used": 0}
+    return env.bytecode_cache.stats()
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -1043,6 +1322,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         super().__init__()
         self.hass = hass
         self.template_cache = weakref.WeakValueDictionary()
+        self.bytecode_cache = None if hass is None else TemplateBytecodeCache(hass)
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1152,9 +1432,37 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         cached = self.template_cache.get(source)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = self.template_cache[source] = self._compile_with_bytecode_cache(
+                source
+            )
 
         return cached
 
+    def _compile_with_bytecode_cache(self, source: str) -> CodeType:
+        """Compile the template, using the stored code when available."""
+        if self.bytecode_cache is None:
+            return super().compile(source)
+
+        key = self._bytecode_key(source)
+        code = self.bytecode_cache.get(key)
+        if code is None:
+            code = super().compile(source)
+            self.bytecode_cache.set(key, code)
+
+        return code
+
+    def _bytecode_key(self, source: str) -> str:
+        """Return the key of the compiled code of a template.
+
+        The names of the globals, filters and tests are part of the key as
+        the compiled code depends on them.
+        """
+        key = hashlib.sha256()
+        for names in (self.globals, self.filters, self.tests):
+            key.update("\n".join(sorted(names)).encode())
+            key.update(b"\0")
+        key.update(source.encode())
+        return key.hexdigest()
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
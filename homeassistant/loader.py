@@ -9,6 +9,7 @@ import functools as ft
 import importlib
 import json
 import logging
+import os
 import pathlib
 import sys
 from types import ModuleType
@@ -17,9 +18,11 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -41,6 +44,8 @@ DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
+# Manifests of the built-in integrations, generated by hassfest
+MANIFEST_INDEX_PATH = pathlib.Path(__file__).parent / "generated" / "manifests.json"
 CUSTOM_WARNING = (
     "You are using a custom integration for %s which has not "
     "been tested by Home Assistant. This component might "
@@ -442,11 +447,7 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
         event.set()
         return integration
 
-    from homeassistant import components  # pylint: disable=import-outside-toplevel
-
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    integration = await hass.async_add_executor_job(_resolve_built_in, hass, domain)
 
     if integration is not None:
         cache[domain] = integration
@@ -468,6 +469,99 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
     return integration
 
 
+async def async_get_integrations(
+    hass: "HomeAssistant", domains: Iterable[str]
+) -> Dict[str, Integration]:
+    """Get integrations, resolving the built-in ones with their dependencies.
+
+    The built-in integrations and the integrations they depend on are
+    resolved together in a single executor job, mostly from the manifest
+    index, so getting them afterwards doesn't need an executor job each.
+    Integrations that are not found are left out.
+    """
+    domains = list(domains)
+    cache = hass.data.get(DATA_INTEGRATIONS, {})
+    custom = await async_get_custom_components(hass)
+    to_resolve = [
+        domain for domain in domains if domain not in cache and domain not in custom
+    ]
+
+    if to_resolve and _async_mount_config_dir(hass):
+        resolved = await hass.async_add_executor_job(
+            _resolve_built_in_with_dependencies, hass, to_resolve, set(custom)
+        )
+        cache = hass.data.setdefault(DATA_INTEGRATIONS, {})
+        for domain, integration in resolved.items():
+            # Don't replace integrations being resolved or already resolved
+            cache.setdefault(domain, integration)
+
+    results = await asyncio.gather(
+        *(async_get_integration(hass, domain) for domain in domains),
+        return_exceptions=True,
+    )
+    return {
+        integration.domain: integration
+        for integration in results
+        if isinstance(integration, Integration)
+    }
+
+
+@ft.lru_cache(maxsize=1)
+def _load_manifest_index() -> Tuple[Dict[str, Dict[str, Any]], float]:
+    """Load the manifest index and the time it was last modified."""
+    try:
+        mtime = MANIFEST_INDEX_PATH.stat().st_mtime
+        index = json.loads(MANIFEST_INDEX_PATH.read_text())
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Unable to load the manifest index: %s", err)
+        return {}, 0.0
+    return index, mtime
+
+
+def _resolve_built_in(hass: "HomeAssistant", domain: str) -> Optional[Integration]:
+    """Resolve a built-in integration, from the manifest index if up to date.
+
+    An indexed manifest is only used when the manifest.json file was not
+    modified after the index, or else the file is read.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import components
+
+    index, index_mtime = _load_manifest_index()
+    manifest = index.get(domain)
+    if manifest is not None:
+        file_path = pathlib.Path(components.__file__).parent / domain
+        try:
+            up_to_date = os.stat(file_path / "manifest.json").st_mtime <= index_mtime
+        except OSError:
+            up_to_date = False
+        if up_to_date:
+            return Integration(
+                hass, f"{PACKAGE_BUILTIN}.{domain}", file_path, dict(manifest)
+            )
+
+    return Integration.resolve_from_root(hass, components, domain)
+
+
+def _resolve_built_in_with_dependencies(
+    hass: "HomeAssistant", domains: List[str], skip: Set[str]
+) -> Dict[str, Integration]:
+    """Resolve built-in integrations and the integrations they depend on."""
+    resolved: Dict[str, Integration] = {}
+    to_resolve = list(domains)
+    while to_resolve:
+        domain = to_resolve.pop()
+        if domain in resolved or domain in skip:
+            continue
+        integration = _resolve_built_in(hass, domain)
+        if integration is None:
+            continue
+        resolved[domain] = integration
+        to_resolve.extend(integration.dependencies)
+        to_resolve.extend(integration.after_dependencies)
+    return resolved
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
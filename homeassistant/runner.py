@@ -1,6 +1,5 @@
 """Run Home Assistant."""
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import dataclasses
 import logging
 import sys
@@ -8,8 +7,12 @@ import threading
 from typing import Any, Dict, Optional
 
 from homeassistant import bootstrap
-from homeassistant.core import callback
+from homeassistant.core import EXECUTOR_SHUTDOWN_TIMEOUT, callback
 from homeassistant.helpers.frame import warn_use
+from homeassistant.util.executor import (
+    InstrumentedThreadPoolExecutor,
+    shutdown_executor,
+)
 
 #
 # Python 3.8 has significantly less workers by default
@@ -40,6 +43,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    profile_imports: bool = False
 
 
 # In Python 3.8+ proactor policy is the default on Windows
@@ -69,30 +73,32 @@ class HassEventLoopPolicy(PolicyBase):  # type: ignore
         if self.debug:
             loop.set_debug(True)
 
-        executor = ThreadPoolExecutor(
-            thread_name_prefix="SyncWorker", max_workers=MAX_EXECUTOR_WORKERS
+        executor = InstrumentedThreadPoolExecutor(
+            MAX_EXECUTOR_WORKERS, thread_name_prefix="SyncWorker"
         )
         loop.set_default_executor(executor)
         loop.set_default_executor = warn_use(  # type: ignore
             loop.set_default_executor, "sets default executor on the event loop"
         )
 
-        # Python 3.9+
-        if hasattr(loop, "shutdown_default_executor"):
-            return loop
-
-        # Copied from Python 3.9 source
-        def _do_shutdown(future: asyncio.Future) -> None:
+        # Replaces the one of Python 3.9+, which waits for the jobs of the
+        # executor without a timeout
+        def _do_shutdown(future: asyncio.Future, timeout: float) -> None:
             try:
-                executor.shutdown(wait=True)
+                if not shutdown_executor(executor, timeout):
+                    logging.getLogger(__name__).warning(
+                        "Timed out waiting for the default executor to shut down, the shutdown will continue"
+                    )
                 loop.call_soon_threadsafe(future.set_result, None)
             except Exception as ex:  # pylint: disable=broad-except
                 loop.call_soon_threadsafe(future.set_exception, ex)
 
-        async def shutdown_default_executor() -> None:
+        async def shutdown_default_executor(timeout: Optional[float] = None) -> None:
             """Schedule the shutdown of the default executor."""
+            if timeout is None:
+                timeout = EXECUTOR_SHUTDOWN_TIMEOUT
             future = loop.create_future()
-            thread = threading.Thread(target=_do_shutdown, args=(future,))
+            thread = threading.Thread(target=_do_shutdown, args=(future, timeout))
             thread.start()
             try:
                 await future
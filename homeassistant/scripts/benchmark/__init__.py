@@ -6,7 +6,10 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+import sys
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 from typing import Callable, Dict, TypeVar
 
 from homeassistant import core
@@ -75,11 +78,11 @@ async def fire_events(hass):
 
     hass.bus.async_listen(event_name, listener)
 
+    start = timer()
+
     for _ in range(10 ** 6):
         hass.bus.async_fire(event_name)
 
-    start = timer()
-
     await event.wait()
 
     return timer() - start
@@ -323,6 +326,278 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def state_memory(hass):
+    """Write 5000 states 5 times and measure the memory used per state."""
+    entity_count = 5000
+    attributes = {
+        "friendly_name": "Kitchen Lights",
+        "supported_features": 41,
+        "brightness": 255,
+        "color_mode": "hs",
+        "hs_color": [30.0, 70.0],
+    }
+
+    tracemalloc.start()
+    start = timer()
+
+    for update in range(5):
+        for idx in range(entity_count):
+            hass.states.async_set(f"light.kitchen_{idx}", update, dict(attributes))
+
+    runtime = timer() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Memory used per state: {current // entity_count} bytes")
+    return runtime
+
+
+@benchmark
+async def write_ha_state(hass):
+    """Write the state of an entity 100k times."""
+    return await _write_ha_state(hass, False)
+
+
+@benchmark
+async def write_ha_state_cached(hass):
+    """Write the state of an entity caching its static attributes 100k times."""
+    return await _write_ha_state(hass, True)
+
+
+async def _write_ha_state(hass, cache_static_attributes):
+    """Write the state of a sensor-like entity, only its state changes."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.entity import Entity
+
+    class BenchmarkEntity(Entity):
+        """Entity with a changing state and static attributes."""
+
+        value = 0
+
+        @property
+        def name(self):
+            """Return the name."""
+            return "Power"
+
+        @property
+        def state(self):
+            """Return the state."""
+            return self.value
+
+        @property
+        def unit_of_measurement(self):
+            """Return the unit of measurement."""
+            return "W"
+
+        @property
+        def device_class(self):
+            """Return the device class."""
+            return "power"
+
+        @property
+        def icon(self):
+            """Return the icon."""
+            return "mdi:flash"
+
+    entity = BenchmarkEntity()
+    entity.hass = hass
+    entity.entity_id = "sensor.power"
+    entity.cache_static_attributes = cache_static_attributes
+    count = 10 ** 5
+
+    start = timer()
+    for value in range(count):
+        entity.value = value
+        entity.async_write_ha_state()
+    runtime = timer() - start
+
+    print(f"Writes per second: {count / runtime:.0f}")
+    return runtime
+
+
+@benchmark
+async def recorder_write(hass):
+    """Record 10000 state changes of 100 entities in a SQLite database.
+
+    Measures the time from the first state change to the rows being committed.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    await recorder.async_setup(
+        hass,
+        recorder.CONFIG_SCHEMA(
+            {
+                recorder.DOMAIN: {
+                    recorder.CONF_DB_URL: "sqlite://",
+                    recorder.CONF_COMMIT_INTERVAL: 0,
+                }
+            }
+        ),
+    )
+    await hass.async_start()
+    instance = hass.data[recorder.DATA_INSTANCE]
+
+    start = timer()
+    for idx in range(10 ** 4):
+        hass.states.async_set(
+            f"sensor.bench_{idx % 100}", idx, {"unit_of_measurement": "W"}
+        )
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(instance.block_till_done)
+    return timer() - start
+
+
+@benchmark
+async def mqtt_topic_router(hass):
+    """Route a million messages with 2000 subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.router import TopicRouter
+
+    router = TopicRouter()
+    for idx in range(1000):
+        router.add(f"homeassistant/sensor/node_{idx}/state", idx)
+        router.add(f"homeassistant/sensor/node_{idx}/attributes", idx)
+    router.add("homeassistant/+/+/config", None)
+    router.add("zigbee2mqtt/#", None)
+    topics = [
+        f"homeassistant/sensor/node_{idx}/{suffix}"
+        for idx in range(1000)
+        for suffix in ("state", "attributes", "availability")
+    ]
+    size = len(topics)
+
+    start = timer()
+    for idx in range(10 ** 6):
+        router.match(topics[idx % size])
+    return timer() - start
+
+
+@benchmark
+async def entity_service_call_100(hass):
+    """Call a service targeting 3 of 100 entities."""
+    return await _entity_service_call(hass, 100)
+
+
+@benchmark
+async def entity_service_call_10000(hass):
+    """Call a service targeting 3 of 10000 entities."""
+    return await _entity_service_call(hass, 10000)
+
+
+async def _entity_service_call(hass, entity_count):
+    """Call a service targeting a few entities of a platform."""
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.service import entity_service_call
+
+    class BenchmarkEntity(Entity):
+        """Entity with a service method doing nothing."""
+
+        @property
+        def should_poll(self):
+            """Return False, the entity is not polled."""
+            return False
+
+        async def async_turn_on(self):
+            """Turn the entity on."""
+
+    entities = {}
+    for idx in range(entity_count):
+        entity = BenchmarkEntity()
+        entity.hass = hass
+        entity.entity_id = f"light.light_{idx}"
+        entities[entity.entity_id] = entity
+    platforms = [SimpleNamespace(entities=entities)]
+    call = core.ServiceCall(
+        "light",
+        "turn_on",
+        {"entity_id": ["light.light_0", "light.light_1", "light.light_2"]},
+    )
+    count = 10 ** 4
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        # The group integration expanding the entity ids is loaded from it
+        hass.config.config_dir = config_dir
+
+        start = timer()
+        for _ in range(count):
+            await entity_service_call(hass, platforms, "async_turn_on", call)
+        runtime = timer() - start
+    print(f"Latency per call: {runtime / count * 10 ** 6:.1f}µs")
+    return runtime
+
+
+BOOT_SCRIPT = """
+import asyncio
+import sys
+
+from homeassistant import bootstrap, core
+
+CONFIG = {domain: {} for domain in sys.argv[2:]}
+CONFIG["homeassistant"] = {"time_zone": "UTC"}
+
+
+async def main():
+    hass = core.HomeAssistant()
+    hass.config.config_dir = sys.argv[1]
+    hass.config.skip_pip = True
+    await bootstrap.async_from_config_dict(CONFIG, hass)
+    print("booted", flush=True)
+    await hass.async_stop(force=True)
+
+
+asyncio.run(main())
+"""
+
+BOOT_INTEGRATIONS = (
+    "automation",
+    "counter",
+    "group",
+    "input_boolean",
+    "input_datetime",
+    "input_number",
+    "input_select",
+    "input_text",
+    "script",
+    "sun",
+    "timer",
+    "zone",
+)
+
+
+@benchmark
+async def boot(hass):
+    """Cold start a new process with a small config of built-in integrations.
+
+    Measures the time from starting the process to the end of the set up.
+    """
+    with tempfile.TemporaryDirectory() as config_dir:
+        start = timer()
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            BOOT_SCRIPT,
+            config_dir,
+            *BOOT_INTEGRATIONS,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        assert process.stdout is not None
+        async for line in process.stdout:
+            if line.strip() == b"booted":
+                runtime = timer() - start
+                break
+        else:
+            raise RuntimeError("Home Assistant did not boot")
+        await process.wait()
+
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
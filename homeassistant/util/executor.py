@@ -0,0 +1,119 @@
+"""Executors reporting their load."""
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import threading
+from time import monotonic
+from typing import Any, Callable, Dict, Optional, Set, TypeVar
+
+T = TypeVar("T")
+
+_COMPONENT_PACKAGES = ("homeassistant.components.", "custom_components.")
+
+
+def job_owner(target: Callable[..., Any]) -> str:
+    """Return the integration or module a job runs the code of."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    module: Optional[str] = getattr(target, "__module__", None)
+    if module is None:
+        return "unknown"
+    for package in _COMPONENT_PACKAGES:
+        if module.startswith(package):
+            return module[len(package) :].split(".", 1)[0]
+    return module
+
+
+def shutdown_executor(executor: ThreadPoolExecutor, timeout: float) -> bool:
+    """Shut down an executor, waiting up to timeout seconds for its jobs.
+
+    Return False if jobs were still running at the timeout, their threads are
+    left to finish them.
+    """
+    thread = threading.Thread(
+        target=executor.shutdown, name="ExecutorShutdown", daemon=True
+    )
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool recording the queue depth and the time jobs wait and run.
+
+    The time spent running jobs is attributed to the integration or module
+    the job runs the code of.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        """Initialize the executor."""
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.max_workers = max_workers
+        self._stats_lock = threading.Lock()
+        self._thread_ids: Set[int] = set()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._run_time: Dict[str, float] = {}
+
+    def submit(  # type: ignore[override]  # pylint: disable=arguments-differ
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> "Future[T]":
+        """Submit a job, recording when it was queued."""
+        with self._stats_lock:
+            self._queued += 1
+        try:
+            return super().submit(
+                self._run_job, job_owner(fn), monotonic(), fn, *args, **kwargs
+            )
+        except BaseException:
+            with self._stats_lock:
+                self._queued -= 1
+            raise
+
+    def _run_job(
+        self,
+        owner: str,
+        queued_at: float,
+        fn: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a job in a thread of the executor, recording its wait and run time."""
+        start = monotonic()
+        wait_time = start - queued_at
+        with self._stats_lock:
+            self._thread_ids.add(threading.get_ident())
+            self._queued -= 1
+            self._running += 1
+            self._wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            run_time = monotonic() - start
+            with self._stats_lock:
+                self._running -= 1
+                self._completed += 1
+                self._run_time[owner] = self._run_time.get(owner, 0.0) + run_time
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the load of the executor.
+
+        The wait times are in seconds, as is the run time by owner.
+        """
+        with self._stats_lock:
+            started = self._running + self._completed
+            return {
+                "max_workers": self.max_workers,
+                "threads": len(self._thread_ids),
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "wait_time_avg": self._wait_time / started if started else 0.0,
+                "wait_time_max": self._max_wait_time,
+                "run_time": dict(
+                    sorted(self._run_time.items(), key=lambda item: -item[1])
+                ),
+            }
@@ -0,0 +1,113 @@
+"""Profile the time spent importing modules."""
+import importlib.abc
+import sys
+import threading
+from time import monotonic
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# The number of modules listed in a report
+REPORT_MODULES = 100
+
+
+class _TimedLoader:
+    """Loader timing the modules run by the wrapped loader."""
+
+    def __init__(self, loader: Any, profiler: "ImportProfiler") -> None:
+        """Initialize the loader."""
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, attr: str) -> Any:
+        """Fetch an attribute of the wrapped loader."""
+        return getattr(self._loader, attr)
+
+    def exec_module(self, module: ModuleType) -> None:
+        """Run the module and record the time it took."""
+        self._profiler.start_module()
+        start = monotonic()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler.end_module(module.__name__, monotonic() - start)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Record the time spent running each module imported while active.
+
+    The cumulative time of a module includes the modules it imports,
+    its own time doesn't.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        # Pairs of (cumulative time, own time) by module name
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self._local = threading.local()
+
+    def start(self) -> None:
+        """Start recording the modules imported."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def stop(self) -> None:
+        """Stop recording the modules imported."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Any:
+        """Find the module with the other finders and time its loader."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    def start_module(self) -> None:
+        """Start timing a module, in the thread importing it."""
+        stack = self._stack()
+        stack.append(0.0)
+
+    def end_module(self, name: str, cumulative: float) -> None:
+        """Record the time spent running a module."""
+        stack = self._stack()
+        children = stack.pop()
+        if stack:
+            stack[-1] += cumulative
+        self.timings[name] = (cumulative, cumulative - children)
+
+    def _stack(self) -> List[float]:
+        """Return the time spent in the imported modules, by module importing."""
+        stack: Optional[List[float]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def format_report(self, limit: int = REPORT_MODULES) -> str:
+        """Return a report of the modules that took the longest to run."""
+        total = sum(own for _, own in self.timings.values())
+        lines = [
+            f"Imported {len(self.timings)} modules in {total:.3f}s",
+            "",
+            f"{'own (s)':>10} {'cumulative (s)':>15}  module",
+        ]
+        for name, (cumulative, own) in sorted(
+            self.timings.items(), key=lambda item: item[1][1], reverse=True
+        )[:limit]:
+            lines.append(f"{own:>10.4f} {cumulative:>15.4f}  {name}")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path: str, limit: int = REPORT_MODULES) -> None:
+        """Write the report to a file."""
+        with open(path, "w", encoding="utf-8") as report_file:
+            report_file.write(self.format_report(limit))
@@ -1,5 +1,6 @@
 """JSON utility functions."""
 from collections import deque
+import gzip
 import json
 import logging
 import os
@@ -11,6 +12,9 @@ from homeassistant.exceptions import HomeAssistantError
 
 _LOGGER = logging.getLogger(__name__)
 
+# The first bytes of gzip compressed files
+GZIP_MAGIC = b"\x1f\x8b"
+
 
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
@@ -26,10 +30,14 @@ def load_json(
     """Load JSON data from a file and return as dict or list.
 
     Defaults to returning empty dict if file is not found.
+    Files compressed by save_json are decompressed.
     """
     try:
-        with open(filename, encoding="utf-8") as fdesc:
-            return json.loads(fdesc.read())  # type: ignore
+        with open(filename, "rb") as fdesc:
+            content = fdesc.read()
+        if content[:2] == GZIP_MAGIC:
+            content = gzip.decompress(content)
+        return json.loads(content)  # type: ignore
     except FileNotFoundError:
         # This is not a fatal error
         _LOGGER.debug("JSON file not found: %s", filename)
@@ -48,30 +56,47 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
-) -> None:
+    compact: bool = False,
+    compress: bool = False,
+) -> int:
     """Save JSON data to a file.
 
-    Returns True on success.
+    The JSON is indented unless compact, and gzip compressed if compress.
+    The file is replaced atomically, the new content is synced to disk
+    before it replaces the old file.
+
+    Returns the number of bytes written.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        if compact or compress:
+            json_data = json.dumps(data, separators=(",", ":"), cls=encoder)
+        else:
+            json_data = json.dumps(data, indent=4, cls=encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
+    content = json_data.encode("utf-8")
+    if compress:
+        # The modification time is left out to only change the file on changes
+        content = gzip.compress(content, mtime=0)
+
     tmp_filename = ""
     tmp_path = os.path.split(filename)[0]
     try:
         # Modern versions of Python tempfile create this file with mode 0o600
         with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", dir=tmp_path, delete=False
+            mode="wb", dir=tmp_path, delete=False
         ) as fdesc:
-            fdesc.write(json_data)
+            fdesc.write(content)
             tmp_filename = fdesc.name
+            fdesc.flush()
+            os.fsync(fdesc.fileno())
         if not private:
             os.chmod(tmp_filename, 0o644)
         os.replace(tmp_filename, filename)
+        _fsync_dir(tmp_path)
     except OSError as error:
         _LOGGER.exception("Saving JSON file failed: %s", filename)
         raise WriteError(error) from error
@@ -84,6 +109,20 @@ def save_json(
                 # we should suppress likely follow-on errors in the cleanup
                 _LOGGER.error("JSON replacement cleanup failed: %s", err)
 
+    return len(content)
+
+
+def _fsync_dir(path: str) -> None:
+    """Sync a directory to disk, so a file renamed in it survives a crash."""
+    if not hasattr(os, "O_DIRECTORY"):
+        # Directories can't be opened on Windows
+        return
+    dir_fd = os.open(path or ".", os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
 
 def format_unserializable_data(data: Dict[str, Any]) -> str:
     """Format output of find_paths in a friendly way.
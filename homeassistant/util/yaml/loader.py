@@ -1,10 +1,24 @@
 """Custom loader."""
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import fnmatch
+import hashlib
 import logging
 import os
+import pickle
 import sys
-from typing import Dict, Iterator, List, TypeVar, Union, overload
+import threading
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import yaml
 
@@ -23,6 +37,14 @@ try:
 except ImportError:
     credstash = None
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore
+
 
 # mypy: allow-untyped-calls, no-warn-return-any
 
@@ -31,6 +53,31 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
+# Pickled YAML of the files that only use standard tags, with the hash
+# of the content it was parsed from, by file name, least recently used first
+__YAML_CACHE: "OrderedDict[str, Tuple[bytes, bytes]]" = OrderedDict()
+# The files of include directories are loaded from several threads
+__YAML_CACHE_LOCK = threading.Lock()
+
+# The maximum number of parsed files kept in the cache
+YAML_CACHE_SIZE = 512
+# The maximum number of files of include directories loaded in parallel
+MAX_PARALLEL_LOADS = 8
+
+
+class _YamlLoad(threading.local):
+    """State of the YAML load running in a thread."""
+
+    # Number of load_yaml calls running, the files included count
+    depth = 0
+    # Pool loading the files of include directories, shared by the files
+    # of a load and shut down when it is done
+    pool: Optional[ThreadPoolExecutor] = None
+    # Set in the threads of a pool, they load included files themselves
+    in_pool = False
+
+
+_LOAD = _YamlLoad()
 
 
 def clear_secret_cache() -> None:
@@ -41,6 +88,15 @@ def clear_secret_cache() -> None:
     __SECRET_CACHE.clear()
 
 
+def clear_yaml_cache() -> None:
+    """Clear the cache of parsed YAML files.
+
+    Async friendly.
+    """
+    with __YAML_CACHE_LOCK:
+        __YAML_CACHE.clear()
+
+
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
@@ -52,13 +108,67 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+class FastSafeLoader(FastestAvailableSafeLoader):
+    """Loader class using the libyaml C parser when it is installed.
+
+    The C parser doesn't annotate the nodes with their line, the objects
+    are still annotated with the line they start at.
+    """
+
+    # Set to False by the constructors of tags whose value doesn't only
+    # depend on the content of the file
+    cacheable = True
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initialize the loader."""
+        super().__init__(stream)
+        self.name = getattr(stream, "name", "<file>")
+        self.stream = stream
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    The files that only use standard tags are cached, the same content
+    is parsed once.
+    """
+    _LOAD.depth += 1
+    try:
+        return _load_yaml(fname)
+    finally:
+        _LOAD.depth -= 1
+        if not _LOAD.depth and _LOAD.pool is not None:
+            _LOAD.pool.shutdown()
+            _LOAD.pool = None
+
+
+def _load_yaml(fname: str) -> JSON_TYPE:
+    """Load a YAML file, from the cache if its content didn't change."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            # If configuration file is empty YAML returns None
-            # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+            content = conf_file.read()
+            digest = hashlib.sha256(content.encode("utf-8")).digest()
+            with __YAML_CACHE_LOCK:
+                cached = __YAML_CACHE.get(fname)
+                if cached is not None and cached[0] == digest:
+                    __YAML_CACHE.move_to_end(fname)
+                else:
+                    cached = None
+            if cached is not None:
+                return pickle.loads(cached[1])  # type: ignore[no-any-return]
+
+            conf_file.seek(0)
+            loader = FastSafeLoader(conf_file)
+            try:
+                # If configuration file is empty YAML returns None
+                # We convert that to an empty dict
+                data = loader.get_single_data() or OrderedDict()
+            finally:
+                loader.dispose()
+
+            if loader.cacheable:
+                _cache_yaml(fname, digest, pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+            return data
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -67,6 +177,15 @@ def load_yaml(fname: str) -> JSON_TYPE:
         raise HomeAssistantError(exc) from exc
 
 
+def _cache_yaml(fname: str, digest: bytes, pickled: bytes) -> None:
+    """Cache a parsed file, evicting the least recently used."""
+    with __YAML_CACHE_LOCK:
+        __YAML_CACHE[fname] = (digest, pickled)
+        __YAML_CACHE.move_to_end(fname)
+        if len(__YAML_CACHE) > YAML_CACHE_SIZE:
+            __YAML_CACHE.popitem(last=False)
+
+
 @overload
 def _add_reference(
     obj: Union[list, NodeListClass], loader: yaml.SafeLoader, node: yaml.nodes.Node
@@ -106,6 +225,7 @@ def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         device_tracker: !include device_tracker.yaml
 
     """
+    loader.cacheable = False
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
         return _add_reference(load_yaml(fname), loader, node)
@@ -130,17 +250,61 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _load_yaml_files(fnames: List[str]) -> List[JSON_TYPE]:
+    """Load YAML files, in parallel when there are several.
+
+    Reading many small files is bound by the latency of the storage, the
+    files are read and parsed by a pool of workers. The pool is created
+    once per load, the include directories of the files it loads are
+    loaded by the worker itself.
+    """
+    if len(fnames) < 2 or _LOAD.in_pool:
+        return [load_yaml(fname) for fname in fnames]
+
+    if not _LOAD.depth:
+        # Not loaded by load_yaml, there is no load to share a pool with
+        with _create_pool() as pool:
+            return list(pool.map(load_yaml, fnames))
+
+    if _LOAD.pool is None:
+        _LOAD.pool = _create_pool()
+    return list(_LOAD.pool.map(load_yaml, fnames))
+
+
+def _create_pool() -> ThreadPoolExecutor:
+    """Create a pool loading the files of include directories."""
+    return ThreadPoolExecutor(
+        max_workers=MAX_PARALLEL_LOADS,
+        thread_name_prefix="yaml",
+        initializer=_init_pool_thread,
+    )
+
+
+def _init_pool_thread() -> None:
+    """Mark a thread of the pool loading the files of include directories."""
+    _LOAD.in_pool = True
+
+
+def _find_yaml_files(loader: SafeLineLoader, node: yaml.nodes.Node) -> List[str]:
+    """Return the YAML files of an included directory, except the secrets."""
+    loader.cacheable = False
+    loc = os.path.join(os.path.dirname(loader.name), node.value)
+    return [
+        fname
+        for fname in _find_files(loc, "*.yaml")
+        if os.path.basename(fname) != SECRET_YAML
+    ]
+
+
 def _include_dir_named_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
-    loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    fnames = _find_yaml_files(loader, node)
+    for fname, loaded_yaml in zip(fnames, _load_yaml_files(fnames)):
         filename = os.path.splitext(os.path.basename(fname))[0]
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        mapping[filename] = load_yaml(fname)
+        mapping[filename] = loaded_yaml
     return _add_reference(mapping, loader, node)
 
 
@@ -149,11 +313,7 @@ def _include_dir_merge_named_yaml(
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
-    loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname)
+    for loaded_yaml in _load_yaml_files(_find_yaml_files(loader, node)):
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference(mapping, loader, node)
@@ -163,24 +323,15 @@ def _include_dir_list_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> List[JSON_TYPE]:
     """Load multiple files from directory as a list."""
-    loc = os.path.join(os.path.dirname(loader.name), node.value)
-    return [
-        load_yaml(f)
-        for f in _find_files(loc, "*.yaml")
-        if os.path.basename(f) != SECRET_YAML
-    ]
+    return _load_yaml_files(_find_yaml_files(loader, node))
 
 
 def _include_dir_merge_list_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
-    loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: List[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname)
+    for loaded_yaml in _load_yaml_files(_find_yaml_files(loader, node)):
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -226,6 +377,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    loader.cacheable = False
     args = node.value.split()
 
     # Check for a default value
@@ -266,6 +418,7 @@ def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
 
 def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
+    loader.cacheable = False
     secret_path = os.path.dirname(loader.name)
     while True:
         secrets = _load_secret_yaml(secret_path)
@@ -325,3 +478,5 @@ yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
 yaml.SafeLoader.add_constructor(
     "!include_dir_merge_named", _include_dir_merge_named_yaml
 )
+# Share the constructors, so the ones added to SafeLoader are used by both
+FastSafeLoader.yaml_constructors = yaml.SafeLoader.yaml_constructors
@@ -0,0 +1,46 @@
+"""Generate the manifest index file."""
+import json
+from typing import Dict
+
+from .model import Config, Integration
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate the manifest index data."""
+    lines = []
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        manifest = json.dumps(integration.manifest, sort_keys=True)
+        lines.append(f"  {json.dumps(domain)}: {manifest}")
+
+    return "{\n" + ",\n".join(lines) + "\n}"
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate the manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(index_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.json is not up to date. Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate the manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    with open(str(index_path), "w") as fp:
+        fp.write(f"{config.cache['manifest_index']}\n")
@@ -172,7 +172,7 @@ async def async_test_home_assistant(loop):
 
         return orig_async_add_job(target, *args)
 
-    def async_add_executor_job(target, *args):
+    def async_add_executor_job(target, *args, pool=None):
         """Add executor job."""
         check_target = target
         while isinstance(check_target, ft.partial):
@@ -183,7 +183,7 @@ async def async_test_home_assistant(loop):
             fut.set_result(target(*args))
             return fut
 
-        return orig_async_add_executor_job(target, *args)
+        return orig_async_add_executor_job(target, *args, pool=pool)
 
     def async_create_task(coroutine):
         """Create task."""
@@ -936,6 +936,21 @@ def mock_storage(data=None):
         """Remove data."""
         data.pop(store.key, None)
 
+    def mock_append_journal_data(store, path, entries):
+        """Mock version of appending to the journal."""
+        _LOGGER.info("Appending to the journal of %s: %s", store.key, entries)
+        data.setdefault(f"{store.key}.journal", []).extend(
+            json.loads(json.dumps(entries, cls=store._encoder))
+        )
+
+    def mock_load_journal_data(store, path):
+        """Mock version of loading the journal."""
+        return list(data.get(f"{store.key}.journal", []))
+
+    async def mock_remove_journal(store):
+        """Remove the journal."""
+        data.pop(f"{store.key}.journal", None)
+
     with patch(
         "homeassistant.helpers.storage.Store._async_load",
         side_effect=mock_async_load,
@@ -948,6 +963,18 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Store._append_journal_data",
+        side_effect=mock_append_journal_data,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Store._load_journal_data",
+        side_effect=mock_load_journal_data,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Store.async_remove_journal",
+        side_effect=mock_remove_journal,
+        autospec=True,
     ):
         yield data
 
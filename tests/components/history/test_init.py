@@ -6,19 +6,21 @@ import json
 import unittest
 
 from homeassistant.components import history, recorder
+from homeassistant.components.http.view import _json_dumps
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.statistics import compile_statistics
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
 
-from tests.async_mock import patch, sentinel
+from tests.async_mock import Mock, patch, sentinel
 from tests.common import (
     get_test_home_assistant,
     init_recorder_component,
     mock_state_change_event,
 )
-from tests.components.recorder.common import wait_recording_done
+from tests.components.recorder.common import trigger_db_commit, wait_recording_done
 
 
 class TestComponentHistory(unittest.TestCase):
@@ -759,6 +761,28 @@ class TestComponentHistory(unittest.TestCase):
         return zero, four, states
 
 
+def test_lazy_state_as_json():
+    """Test the JSON of a state read from the database."""
+    now = dt_util.utcnow()
+    row = Mock(
+        entity_id="light.kitchen",
+        state="on",
+        attributes='{"brightness": 100}',
+        last_changed=now,
+        last_updated=now,
+    )
+    state = history.LazyState(row)
+
+    assert json.loads(state.as_json()) == {
+        "entity_id": "light.kitchen",
+        "state": "on",
+        "attributes": {"brightness": 100},
+        "last_changed": now.isoformat(),
+        "last_updated": now.isoformat(),
+    }
+    assert json.loads(_json_dumps([state, state])) == [json.loads(state.as_json())] * 2
+
+
 async def test_fetch_period_api(hass, hass_client):
     """Test the fetch period view for history."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -793,6 +817,122 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == 200
 
 
+async def test_fetch_period_api_with_stream(hass, hass_client):
+    """Test the streamed fetch period view returns the same history."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_job(instance.block_till_done)
+
+    hass.states.async_set("light.unchanged", "on")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(instance.block_till_done)
+
+    start = dt_util.utcnow()
+    for state in ("1", "2", "2", "3", "4"):
+        hass.states.async_set("sensor.power", state, {"unit": "W"})
+        hass.states.async_set("climate.living_room", "heat", {"temp": state})
+    hass.states.async_set("sensor.empty", "")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(instance.block_till_done)
+
+    client = await hass_client()
+    for query in ("", "&minimal_response", "&minimal_response&skip_initial_state"):
+        response = await client.get(f"/api/history/period/{start.isoformat()}?{query}")
+        assert response.status == 200
+        expected = await response.json()
+
+        response = await client.get(
+            f"/api/history/period/{start.isoformat()}?stream{query}"
+        )
+        assert response.status == 200
+        assert response.content_type == "application/json"
+        streamed = await response.json()
+
+        assert len(streamed) == len(expected)
+        assert sorted(streamed, key=lambda states: states[0]["entity_id"]) == sorted(
+            expected, key=lambda states: states[0]["entity_id"]
+        )
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?stream&minimal_response"
+    )
+    power = next(
+        states
+        for states in await response.json()
+        if states[0]["entity_id"] == "sensor.power"
+    )
+    assert [state["state"] for state in power] == ["1", "2", "3", "4"]
+    assert "attributes" not in power[1]
+    assert power[-1]["attributes"] == {"unit": "W"}
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}"
+        "?stream&filter_entity_id=sensor.missing"
+    )
+    assert response.status == 200
+    assert await response.json() == []
+
+
+async def test_fetch_statistics_api(hass, hass_client):
+    """Test the statistics view of history."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_job(instance.block_till_done)
+
+    start = dt_util.utcnow().replace(second=0, microsecond=0) - timedelta(hours=1)
+    start = start.replace(minute=start.minute - start.minute % 5)
+    with patch(
+        "homeassistant.core.dt_util.utcnow", return_value=start + timedelta(minutes=1)
+    ):
+        hass.states.async_set("sensor.power", "10")
+        hass.states.async_set("sensor.other", "on")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(instance.block_till_done)
+    await hass.async_add_executor_job(compile_statistics, instance, start)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/statistics/{start.isoformat()}"
+        "?filter_entity_id=sensor.power,sensor.other"
+    )
+    assert response.status == 200
+    assert await response.json() == {
+        "sensor.power": [
+            {
+                "entity_id": "sensor.power",
+                "start": start.isoformat(),
+                "mean": 10.0,
+                "min": 10.0,
+                "max": 10.0,
+            }
+        ]
+    }
+
+    response = await client.get(
+        f"/api/history/statistics/{start.isoformat()}"
+        "?filter_entity_id=sensor.power&period=hour"
+    )
+    assert response.status == 200
+    assert await response.json() == {}
+
+    response = await client.get(
+        f"/api/history/statistics/{start.isoformat()}"
+        "?filter_entity_id=sensor.power&period=year"
+    )
+    assert response.status == 400
+
+    response = await client.get(f"/api/history/statistics/{start.isoformat()}")
+    assert response.status == 400
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
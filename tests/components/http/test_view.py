@@ -1,4 +1,6 @@
 """Tests for Home Assistant View."""
+import json
+
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
     HTTPInternalServerError,
@@ -11,7 +13,9 @@ from homeassistant.components.http.view import (
     HomeAssistantView,
     request_handler_factory,
 )
+from homeassistant.core import State
 from homeassistant.exceptions import ServiceNotFound, Unauthorized
+from homeassistant.helpers.json import json_dumps
 
 from tests.async_mock import AsyncMock, Mock
 
@@ -38,6 +42,20 @@ async def test_invalid_json(caplog):
     assert str(float("NaN")) in caplog.text
 
 
+async def test_json_of_states():
+    """Test the JSON of states is reused for the response."""
+    view = HomeAssistantView()
+    states = [State("light.kitchen", "on"), State("light.bed", "off", {"a": 1})]
+
+    response = view.json(states)
+    assert json.loads(response.body) == json.loads(json_dumps(states))
+    assert response.body == f"[{states[0].as_json()}, {states[1].as_json()}]".encode()
+    assert view.json(states[1]).body == states[1].as_json().encode()
+
+    with pytest.raises(HTTPInternalServerError):
+        view.json([State("light.kitchen", "on", {"value": float("NaN")})])
+
+
 async def test_handling_unauthorized(mock_request):
     """Test handling unauth exceptions."""
     with pytest.raises(HTTPUnauthorized):
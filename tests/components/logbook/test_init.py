@@ -1363,6 +1363,68 @@ async def test_logbook_view(hass, hass_client):
     assert response.status == 200
 
 
+async def test_logbook_view_pagination(hass, hass_client):
+    """Test the logbook view in pages with context from a previous page."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    base = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    base -= timedelta(hours=1)
+    context = ha.Context(id="ac5bd62de45711eaaeb351041eec8dd9")
+
+    for minute, entity_id, state, state_context in (
+        (0, "switch.origin", STATE_OFF, None),
+        (0, "switch.a", STATE_OFF, None),
+        (0, "switch.b", STATE_OFF, None),
+        (1, "switch.origin", STATE_ON, context),
+        (2, "switch.a", STATE_ON, None),
+        (20, "switch.b", STATE_ON, context),
+        (40, "switch.a", STATE_OFF, None),
+    ):
+        with patch(
+            "homeassistant.core.dt_util.utcnow",
+            return_value=base + timedelta(minutes=minute),
+        ):
+            hass.states.async_set(entity_id, state, context=state_context)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    url = f"/api/logbook/{base.isoformat()}"
+    response = await client.get(url)
+    assert response.status == 200
+    assert "Link" not in response.headers
+    expected = await response.json()
+    assert [entry["entity_id"] for entry in expected] == [
+        "switch.origin",
+        "switch.a",
+        "switch.b",
+        "switch.a",
+    ]
+    assert expected[2]["context_entity_id"] == "switch.origin"
+
+    pages = []
+    response = await client.get(f"{url}?limit=1")
+    while True:
+        assert response.status == 200
+        pages.append(await response.json())
+        if "next" not in response.links:
+            break
+        response = await client.get(response.links["next"]["url"].relative())
+
+    # Pages end at the 15 minute groups of sensor updates
+    assert [len(page) for page in pages] == [2, 1, 1]
+    assert [entry for page in pages for entry in page] == expected
+
+    response = await client.get(f"{url}?limit=0")
+    assert response.status == 400
+    response = await client.get(f"{url}?after=invalid")
+    assert response.status == 400
+
+
 async def test_logbook_view_period_entity(hass, hass_client):
     """Test the logbook view with period and entity."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -0,0 +1,93 @@
+"""The tests for the MQTT topic router."""
+from paho.mqtt.matcher import MQTTMatcher
+import pytest
+
+from homeassistant.components.mqtt.router import TopicRouter
+
+TOPIC_FILTERS = [
+    "#",
+    "+",
+    "sport/#",
+    "sport/+",
+    "sport/tennis/#",
+    "sport/tennis/player1",
+    "sport/+/player1",
+    "+/tennis/#",
+    "+/+/+",
+    "/+",
+    "$SYS/#",
+    "$SYS/+/load",
+]
+
+TOPICS = [
+    "sport",
+    "sport/",
+    "sport/tennis",
+    "sport/tennis/player1",
+    "sport/tennis/player1/ranking",
+    "sport/golf/player1",
+    "/finance",
+    "finance",
+    "$SYS/broker/load",
+    "$SYS",
+]
+
+
+@pytest.mark.parametrize("topic", TOPICS)
+def test_match_as_paho(topic):
+    """Test the router matches the same topic filters as paho."""
+    router = TopicRouter()
+    for topic_filter in TOPIC_FILTERS:
+        router.add(topic_filter, topic_filter)
+
+    expected = []
+    for topic_filter in TOPIC_FILTERS:
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = True
+        if next(matcher.iter_match(topic), False):
+            expected.append(topic_filter)
+
+    assert router.match(topic) == expected
+
+
+def test_match_in_order_added():
+    """Test the items are matched in the order they were added."""
+    router = TopicRouter()
+    first, second, third = object(), object(), object()
+    router.add("a/#", first)
+    router.add("a/b", second)
+    router.add("a/#", third)
+
+    assert router.match("a/b") == [first, second, third]
+
+
+def test_remove():
+    """Test removing items clears the cached matches and prunes the trie."""
+    router = TopicRouter()
+    item, other = object(), object()
+    router.add("a/+/c", item)
+    router.add("a/+/c", other)
+    assert router.match("a/b/c") == [item, other]
+
+    router.remove("a/+/c", item)
+    assert router.match("a/b/c") == [other]
+
+    router.remove("a/+/c", other)
+    assert router.match("a/b/c") == []
+    assert router._root.children == {}
+
+    with pytest.raises(ValueError):
+        router.remove("a/+/c", other)
+
+
+def test_match_cached():
+    """Test the matches of a topic are cached until the trie changes."""
+    router = TopicRouter()
+    item = object()
+    router.add("a/#", item)
+
+    matches = router.match("a/b")
+    assert router.match("a/b") is matches
+
+    router.add("a/b", object())
+    assert router.match("a/b") is not matches
@@ -14,7 +14,12 @@ from homeassistant.components.recorder import (
     run_information_with_session,
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import MATCH_ALL, STATE_LOCKED, STATE_UNLOCKED
 from homeassistant.core import Context, callback
@@ -383,6 +388,88 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_batch_links_event_and_old_state(hass_recorder):
+    """Test states written in one batch are linked to their event and old state."""
+    hass = hass_recorder()
+
+    for idx in range(5):
+        hass.states.set("test.one", str(idx), {})
+    hass.states.async_remove("test.one")
+    hass.states.set("test.one", "back", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 7
+        assert all(state.event_id for state in states)
+        assert len({state.event_id for state in states}) == 7
+
+        assert states[0].old_state_id is None
+        for idx in range(1, 6):
+            assert states[idx].old_state_id == states[idx - 1].state_id
+        assert states[5].state is None
+        assert states[6].old_state_id is None
+
+    status = hass.data[DATA_INSTANCE].status
+    assert status["queue_depth"] == 0
+    assert status["max_batch_size"] >= status["last_batch_size"] >= 1
+
+
+def test_saving_states_shares_attributes(hass_recorder):
+    """Test states with the same attributes share one state_attributes row."""
+    hass = hass_recorder()
+    attributes = {"friendly_name": "Outside", "unit_of_measurement": "°C"}
+
+    for temperature in (20, 21):
+        hass.states.set("sensor.outside", temperature, attributes)
+    wait_recording_done(hass)
+    hass.states.set("sensor.outside", 22, attributes)
+    hass.states.set("sensor.outside", 22, {"friendly_name": "Changed"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 4
+        assert all(state.attributes is None for state in states)
+        assert len({state.attributes_id for state in states[:3]}) == 1
+        assert states[3].attributes_id != states[0].attributes_id
+        assert session.query(StateAttributes).count() == 2
+        assert states[0].to_native().attributes == attributes
+        assert states[3].to_native().attributes == {"friendly_name": "Changed"}
+
+    # A restarted recorder has an empty cache and must find the existing row
+    hass.data[DATA_INSTANCE]._state_attributes_ids.clear()
+    hass.states.set("sensor.outside", 23, attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 2
+
+
+def test_saving_after_rolled_back_commit(hass_recorder):
+    """Test states written after a failed commit don't link to rolled back rows."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    attributes = {"friendly_name": "Outside"}
+
+    with patch.object(instance.event_session, "commit", side_effect=Exception("Boom")):
+        hass.states.set("sensor.outside", 20, attributes)
+        wait_recording_done(hass)
+
+    assert instance._old_state_ids == {}
+    assert not instance._state_attributes_ids
+
+    hass.states.set("sensor.outside", 21, attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 1
+        assert states[0].old_state_id is None
+        assert session.query(StateAttributes).count() == 1
+        assert states[0].to_native().attributes == attributes
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -4,13 +4,14 @@ import unittest
 
 import pytest
 import pytz
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from homeassistant.components.recorder.models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -166,6 +167,38 @@ class TestRecorderRuns(unittest.TestCase):
         assert run.entity_ids(in_run2) == ["sensor.humidity"]
 
 
+def test_states_load_attributes_in_one_query():
+    """Test the shared attributes of queried states are loaded together."""
+    session = SESSION()
+    session.query(States).delete()
+    for idx in range(5):
+        attributes = StateAttributes(shared_attrs=f'{{"idx": {idx}}}')
+        session.add(
+            States(
+                entity_id=f"sensor.test_{idx}",
+                state="on",
+                state_attributes=attributes,
+            )
+        )
+    session.commit()
+    session.expire_all()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(ENGINE, "before_cursor_execute", before_cursor_execute)
+    try:
+        states = [state.to_native() for state in session.query(States)]
+    finally:
+        event.remove(ENGINE, "before_cursor_execute", before_cursor_execute)
+        session.rollback()
+
+    assert [state.attributes["idx"] for state in states] == list(range(5))
+    assert len(statements) == 2
+
+
 def test_states_from_native_invalid_entity_id():
     """Test loading a state from an invalid entity ID."""
     state = States()
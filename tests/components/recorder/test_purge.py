@@ -3,16 +3,18 @@ from datetime import datetime, timedelta
 import json
 import unittest
 
+from sqlalchemy import create_engine
+
 from homeassistant.components import recorder
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import Events, RecorderRuns, States
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import _repack, purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.util import dt as dt_util
 
 from .common import wait_recording_done
 
-from tests.async_mock import patch
+from tests.async_mock import Mock, patch
 from tests.common import get_test_home_assistant, init_recorder_component
 
 
@@ -126,6 +128,7 @@ class TestRecorderPurge(unittest.TestCase):
                     )
                 )
 
+    @patch("homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 2)
     def test_purge_old_states(self):
         """Test deleting old states."""
         self._add_test_states()
@@ -147,6 +150,30 @@ class TestRecorderPurge(unittest.TestCase):
             assert finished
             assert states.count() == 2
 
+    @patch("homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 2)
+    def test_purge_progress(self):
+        """Test the progress of a purge is reported in the recorder status."""
+        instance = self.hass.data[DATA_INSTANCE]
+        self._add_test_states()
+        assert instance.status["purge"] is None
+
+        assert not purge_old_data(instance, 4, repack=False)
+        progress = instance.status["purge"]
+        assert progress["batches"] == 1
+        assert progress["states_deleted"] == 2
+        assert progress["finished"] is None
+
+        while not purge_old_data(instance, 4, repack=False):
+            pass
+        progress = instance.status["purge"]
+        assert progress["states_deleted"] == 4
+        assert progress["finished"] is not None
+
+        # A new purge starts with new progress
+        purge_old_data(instance, 4, repack=False)
+        assert instance.status["purge"]["batches"] == 1
+
+    @patch("homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 2)
     def test_purge_old_events(self):
         """Test deleting old events."""
         self._add_test_events()
@@ -233,6 +260,35 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.data[DATA_INSTANCE].block_till_done()
                 wait_recording_done(self.hass)
                 assert (
-                    mock_logger.debug.mock_calls[5][1][0]
+                    mock_logger.debug.mock_calls[-1][1][0]
                     == "Vacuuming SQL DB to free space"
                 )
+
+
+def test_repack_sqlite_incremental_vacuum(tmp_path):
+    """Test repacking sqlite enables and then uses incremental vacuum."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    engine.execute("CREATE TABLE test (data TEXT)")
+    for _ in range(100):
+        engine.execute("INSERT INTO test VALUES (?)", "x" * 4096)
+    engine.execute("DELETE FROM test")
+    instance = Mock(engine=engine)
+
+    # The first repack is a full vacuum that enables incremental auto vacuum
+    assert engine.execute("PRAGMA auto_vacuum").scalar() == 0
+    assert _repack(instance)
+    assert engine.execute("PRAGMA auto_vacuum").scalar() == 2
+
+    for _ in range(100):
+        engine.execute("INSERT INTO test VALUES (?)", "x" * 4096)
+    engine.execute("DELETE FROM test")
+    assert engine.execute("PRAGMA freelist_count").scalar() > 10
+
+    with patch(
+        "homeassistant.components.recorder.purge.SQLITE_INCREMENTAL_VACUUM_PAGES", 10
+    ):
+        assert not _repack(instance)
+        while not _repack(instance):
+            pass
+    assert engine.execute("PRAGMA freelist_count").scalar() == 0
+    engine.dispose()
@@ -0,0 +1,194 @@
+"""The tests for the recorder statistics."""
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.models import Statistics, StatisticsShortTerm
+from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
+    compile_missing_statistics,
+    compile_statistics,
+    statistics_during_period,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.util import dt as dt_util
+
+from .common import wait_recording_done
+
+from tests.async_mock import patch
+from tests.common import get_test_home_assistant, init_recorder_component
+
+
+@pytest.fixture
+def hass_recorder():
+    """Home Assistant fixture with in-memory recorder."""
+    hass = get_test_home_assistant()
+
+    def setup_recorder(config=None):
+        """Set up with params."""
+        init_recorder_component(hass, config)
+        hass.start()
+        hass.block_till_done()
+        hass.data[DATA_INSTANCE].block_till_done()
+        return hass
+
+    yield setup_recorder
+    hass.stop()
+
+
+def _set_states_at(hass, point_in_time, states):
+    """Set states with last_updated at point_in_time."""
+    with patch("homeassistant.core.dt_util.utcnow", return_value=point_in_time):
+        for entity_id, state in states:
+            hass.states.set(entity_id, state, force_update=True)
+        wait_recording_done(hass)
+
+
+def test_compile_short_term_statistics(hass_recorder):
+    """Test compiling statistics of numeric sensors over 5 minutes."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    start = dt_util.utcnow().replace(minute=20, second=0, microsecond=0)
+
+    _set_states_at(
+        hass,
+        start + timedelta(minutes=1),
+        [("sensor.temperature", "10"), ("sensor.text", "on"), ("light.kitchen", "1")],
+    )
+    _set_states_at(
+        hass,
+        start + timedelta(minutes=2),
+        [("sensor.temperature", "unavailable"), ("sensor.text", "off")],
+    )
+    _set_states_at(hass, start + timedelta(minutes=3), [("sensor.temperature", "20")])
+    # Outside of the period
+    _set_states_at(hass, start + timedelta(minutes=5), [("sensor.temperature", "50")])
+
+    compile_statistics(instance, start)
+    # Compiling the same period again does nothing
+    compile_statistics(instance, start)
+
+    stats = statistics_during_period(hass, start, period=PERIOD_5MINUTE)
+    assert stats == {
+        "sensor.temperature": [
+            {
+                "entity_id": "sensor.temperature",
+                "start": start.isoformat(),
+                "mean": pytest.approx((10 * 60 + 20 * 120) / 180),
+                "min": 10.0,
+                "max": 20.0,
+            }
+        ]
+    }
+
+    with session_scope(hass=hass) as session:
+        assert session.query(Statistics).count() == 0
+
+
+def test_compile_statistics_of_unchanged_state(hass_recorder):
+    """Test the state before a period is held during it."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    start = dt_util.utcnow().replace(minute=20, second=0, microsecond=0)
+
+    _set_states_at(
+        hass,
+        start - timedelta(minutes=10),
+        [
+            ("sensor.constant", "5"),
+            ("sensor.changing", "0"),
+            ("sensor.unavailable", "3"),
+        ],
+    )
+    _set_states_at(
+        hass,
+        start - timedelta(minutes=1),
+        [("sensor.changing", "2"), ("sensor.unavailable", "unavailable")],
+    )
+    _set_states_at(hass, start + timedelta(minutes=4), [("sensor.changing", "7")])
+
+    # The start state is the value held at the end of the previous period
+    compile_statistics(instance, start - timedelta(minutes=10))
+    compile_statistics(instance, start - timedelta(minutes=5))
+    compile_statistics(instance, start)
+
+    stats = statistics_during_period(hass, start, period=PERIOD_5MINUTE)
+    assert stats == {
+        "sensor.changing": [
+            {
+                "entity_id": "sensor.changing",
+                "start": start.isoformat(),
+                "mean": pytest.approx((2 * 240 + 7 * 60) / 300),
+                "min": 2.0,
+                "max": 7.0,
+            }
+        ],
+        "sensor.constant": [
+            {
+                "entity_id": "sensor.constant",
+                "start": start.isoformat(),
+                "mean": 5.0,
+                "min": 5.0,
+                "max": 5.0,
+            }
+        ],
+    }
+
+
+def test_compile_missing_statistics(hass_recorder):
+    """Test the periods missed since the last compiled one are compiled."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    start = dt_util.utcnow().replace(minute=20, second=0, microsecond=0)
+
+    _set_states_at(hass, start + timedelta(minutes=1), [("sensor.power", "3")])
+    compile_missing_statistics(instance, start)
+    compile_missing_statistics(instance, start + timedelta(minutes=15))
+
+    stats = statistics_during_period(hass, start, period=PERIOD_5MINUTE)
+    assert [stat["start"] for stat in stats["sensor.power"]] == [
+        (start + timedelta(minutes=minutes)).isoformat() for minutes in (0, 5, 10, 15)
+    ]
+    assert [stat["mean"] for stat in stats["sensor.power"]] == [3.0] * 4
+
+
+def test_compile_hourly_statistics(hass_recorder):
+    """Test hourly statistics are compiled at the end of an hour."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    hour_start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    hour_start -= timedelta(hours=1)
+
+    for minute, state in ((1, "1"), (31, "3"), (56, "8")):
+        period_start = hour_start + timedelta(minutes=minute - 1)
+        _set_states_at(
+            hass, period_start + timedelta(seconds=30), [("sensor.power", state)]
+        )
+        compile_statistics(instance, period_start)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsShortTerm).count() == 3
+
+    stats = statistics_during_period(
+        hass, hour_start, hour_start + timedelta(hours=1), ["sensor.power"]
+    )
+    assert stats == {
+        "sensor.power": [
+            {
+                "entity_id": "sensor.power",
+                "start": hour_start.isoformat(),
+                "mean": pytest.approx((1 * 30 + 3 * 25 + 8 * 4.5) / 59.5),
+                "min": 1.0,
+                "max": 8.0,
+            }
+        ]
+    }
+    assert statistics_during_period(hass, hour_start, period=PERIOD_HOUR) == stats
+    assert (
+        statistics_during_period(
+            hass, hour_start, entity_ids=["sensor.other"], period=PERIOD_HOUR
+        )
+        == {}
+    )
@@ -8,7 +8,12 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import DOMAIN, StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    DOMAIN,
+    SampleWindow,
+    StatisticsSensor,
+    _get_recorded_samples,
+)
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     SERVICE_RELOAD,
@@ -376,6 +381,56 @@ class TestStatisticsSensor(unittest.TestCase):
         state = self.hass.states.get("sensor.test")
         assert str(self.mean) == state.state
 
+    def test_initialize_multiple_sensors_from_database(self):
+        """Test the sensors are initialized by a single database query."""
+        # enable the recorder
+        init_recorder_component(self.hass)
+        self.hass.block_till_done()
+        self.hass.data[recorder.DATA_INSTANCE].block_till_done()
+        # store some values
+        for value in self.values:
+            self.hass.states.set("sensor.test_monitored", value)
+            self.hass.states.set("sensor.test_monitored_2", value * 2)
+            self.hass.block_till_done()
+        # wait for the recorder to really store the data
+        wait_recording_done(self.hass)
+        assert setup_component(
+            self.hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "statistics",
+                        "name": "test",
+                        "entity_id": "sensor.test_monitored",
+                        "sampling_size": 100,
+                    },
+                    {
+                        "platform": "statistics",
+                        "name": "test_2",
+                        "entity_id": "sensor.test_monitored_2",
+                        "sampling_size": 3,
+                    },
+                ]
+            },
+        )
+
+        self.hass.block_till_done()
+        with patch(
+            "homeassistant.components.statistics.sensor._get_recorded_samples",
+            wraps=_get_recorded_samples,
+        ) as get_samples:
+            self.hass.start()
+            self.hass.block_till_done()
+
+        assert get_samples.call_count == 1
+        state = self.hass.states.get("sensor.test")
+        assert str(self.mean) == state.state
+        state = self.hass.states.get("sensor.test_2")
+        assert state.attributes.get("count") == 3
+        assert state.attributes.get("min_value") == min(self.values[-3:]) * 2
+        assert state.attributes.get("max_value") == max(self.values[-3:]) * 2
+
     def test_initialize_from_database_with_maxage(self):
         """Test initializing the statistics from the database."""
         now = dt_util.utcnow()
@@ -498,5 +553,19 @@ async def test_reload(hass):
     assert hass.states.get("sensor.cputest")
 
 
+def test_sample_window_median():
+    """Test the median of the window as samples are added and removed."""
+    window = SampleWindow(5)
+    samples = []
+    for age, value in enumerate([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9]):
+        window.append(value, age)
+        samples = samples[-4:] + [value]
+        assert window.median == statistics.median(samples)
+        if age % 4 == 3:
+            window.popleft()
+            samples.pop(0)
+            assert window.median == statistics.median(samples)
+
+
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
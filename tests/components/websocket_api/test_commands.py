@@ -8,9 +8,10 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import URL
-from homeassistant.core import Context, callback
+from homeassistant.core import POOL_IO, Context, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
+from homeassistant.helpers.event import async_call_later
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 
@@ -187,6 +188,95 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_entities(hass, hass_admin_user, websocket_client):
+    """Test subscribe entities command."""
+    hass_admin_user.mock_policy({"entities": {"domains": {"light": True}}})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "icon": "a"})
+    hass.states.async_set("light.hidden", "on")
+    hass.states.async_set("switch.other", "on")
+    kitchen = hass.states.get("light.kitchen")
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.kitchen", "switch.other"],
+            "attributes": ["brightness"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    # The switch is not visible to the user
+    assert msg["event"] == {
+        "a": {
+            "light.kitchen": {
+                "s": "on",
+                "a": {"brightness": 100},
+                "lc": kitchen.last_changed.timestamp(),
+                "lu": kitchen.last_updated.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.hidden", "off")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "icon": "b"})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 50})
+    kitchen = hass.states.get("light.kitchen")
+
+    with timeout(3):
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.kitchen": {
+                "+": {"a": {"brightness": 50}, "lu": kitchen.last_updated.timestamp()}
+            }
+        }
+    }
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+
+
+async def test_subscribe_entities_domains(hass, websocket_client):
+    """Test subscribe entities command with domains."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.other", "on")
+
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_entities", "domains": ["switch"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["switch.other"]
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_remove("switch.other")
+
+    with timeout(3):
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["event"] == {"r": ["switch.other"]}
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -747,3 +837,80 @@ async def test_test_condition(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"]["result"] is True
+
+
+async def test_timer_stats(hass, websocket_client):
+    """Test getting the pending timers by owner."""
+    async_call_later(hass, 10, lambda _: None)
+
+    await websocket_client.send_json({"id": 5, "type": "timers/stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["owners"][__name__] == 1
+    assert msg["result"]["timers"] >= 1
+
+
+async def test_timer_stats_requires_admin(websocket_client, hass_admin_user):
+    """Test getting the timer stats without being admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 5, "type": "timers/stats"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_executor_stats(hass, websocket_client):
+    """Test getting the load of the executor pools."""
+    await hass.async_add_executor_job(lambda: None, pool=POOL_IO)
+
+    await websocket_client.send_json({"id": 5, "type": "executor/stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"][POOL_IO]["completed"] == 1
+    assert __name__ in msg["result"][POOL_IO]["run_time"]
+
+
+async def test_polling_stats(hass, websocket_client):
+    """Test getting the polling statistics of the platforms."""
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities([MockEntity(name="Polled", should_poll=True)])
+
+    await websocket_client.send_json({"id": 5, "type": "polling/stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "test_domain",
+            "platform": "test_platform",
+            "config_entry_id": None,
+            "scan_interval": 15,
+            "polls": 0,
+            "overruns": 0,
+            "failures": 0,
+            "skipped": 0,
+            "last_duration": 0.0,
+            "mean_duration": 0.0,
+            "max_duration": 0.0,
+        }
+    ]
+
+
+async def test_template_stats(hass, websocket_client):
+    """Test getting the statistics of the compiled templates cache."""
+    await websocket_client.send_json({"id": 5, "type": "templates/stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert set(msg["result"]) == {"hits", "misses", "stored", "used"}
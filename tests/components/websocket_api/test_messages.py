@@ -1,11 +1,17 @@
 """Test Websocket API messages module."""
+import json
+from unittest.mock import patch
 
 from homeassistant.components.websocket_api.messages import (
     cached_event_message,
+    entity_event_message,
+    event_message,
     message_to_json,
+    result_message,
+    states_result_message,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
-from homeassistant.core import callback
+from homeassistant.core import Event, callback
 
 
 async def test_cached_event_message(hass):
@@ -33,16 +39,104 @@ async def test_cached_event_message(hass):
 
     assert msg0 != msg1
 
-    cache_info = cached_event_message.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+    # The JSON of the event is serialized once for all subscriptions
+    with patch(
+        "homeassistant.core.json_dumps", side_effect=AssertionError
+    ) as mock_dumps:
+        msg2 = cached_event_message(3, events[0])
+    assert not mock_dumps.called
+    assert json.loads(msg2) == {**json.loads(msg0), "id": 3}
+    assert json.loads(msg0) == json.loads(message_to_json(event_message(2, events[0])))
+
+
+async def test_cached_event_message_unserializable(hass, caplog):
+    """Test an event that can't be serialized is replaced by an error."""
+    event = Event("test_event", {"value": float("nan")})
+
+    assert json.loads(cached_event_message(2, event)) == {
+        "id": 2,
+        "type": "result",
+        "success": False,
+        "error": {"code": "unknown_error", "message": "Invalid JSON in response"},
+    }
+    assert "Unable to serialize to JSON" in caplog.text
+
+
+async def test_states_result_message(hass):
+    """Test the result message of states splices the JSON of the states."""
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.door", "off")
+    states = hass.states.async_all()
+
+    msg = states_result_message(5, states)
+    assert json.loads(msg) == json.loads(message_to_json(result_message(5, states)))
+
+    assert json.loads(states_result_message(6, [])) == json.loads(
+        message_to_json(result_message(6, []))
+    )
+
+
+async def test_entity_event_message(hass):
+    """Test the compressed messages of state changes."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100, "icon": "a"})
+    hass.states.async_set("light.window", "on", {"brightness": 200})
+    hass.states.async_set("light.window", "off", {"brightness": 200})
+    hass.states.async_set("light.window", "off", {"brightness": 200, "icon": "b"})
+    hass.states.async_remove("light.window")
+    await hass.async_block_till_done()
 
-    cached_event_message(2, events[1])
-    cache_info = cached_event_message.cache_info()
-    assert cache_info.hits == 3
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+    assert len(events) == 5
+    added = events[0].data["new_state"]
+    assert entity_event_message(2, events[0], ["brightness"]) == {
+        "id": 2,
+        "type": "event",
+        "event": {
+            "a": {
+                "light.window": {
+                    "s": "on",
+                    "a": {"brightness": 100},
+                    "lc": added.last_changed.timestamp(),
+                    "lu": added.last_updated.timestamp(),
+                }
+            }
+        },
+    }
+
+    changed = events[1].data["new_state"]
+    assert entity_event_message(2, events[1])["event"] == {
+        "c": {
+            "light.window": {
+                "+": {"a": {"brightness": 200}, "lu": changed.last_updated.timestamp()},
+                "-": {"a": ["icon"]},
+            }
+        }
+    }
+
+    changed = events[2].data["new_state"]
+    assert entity_event_message(2, events[2])["event"] == {
+        "c": {
+            "light.window": {
+                "+": {
+                    "s": "off",
+                    "lc": changed.last_changed.timestamp(),
+                    "lu": changed.last_updated.timestamp(),
+                }
+            }
+        }
+    }
+
+    # Changes of attributes not projected are not sent
+    assert entity_event_message(2, events[3], ["brightness"]) is None
+
+    assert entity_event_message(2, events[4])["event"] == {"r": ["light.window"]}
 
 
 async def test_message_to_json(caplog):
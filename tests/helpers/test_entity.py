@@ -6,9 +6,11 @@ import threading
 
 import pytest
 
+from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE
 from homeassistant.core import Context
 from homeassistant.helpers import entity, entity_registry
+from homeassistant.helpers.entity_values import EntityValues
 
 from tests.async_mock import MagicMock, PropertyMock, patch
 from tests.common import (
@@ -657,6 +659,56 @@ async def test_capability_attrs(hass):
     assert state.attributes["always"] == "there"
 
 
+async def test_cache_static_attributes(hass):
+    """Test the static attributes are cached until invalidated."""
+    entry = entity_registry.RegistryEntry(
+        entity_id="hello.world",
+        unique_id="test-unique-id",
+        platform="test-platform",
+        name="Registry name",
+    )
+    registry = mock_registry(hass, {"hello.world": entry})
+
+    ent = MockEntity(
+        entity_id="hello.world",
+        device_class="test_class",
+        state="first",
+        unique_id="test-unique-id",
+        should_poll=False,
+    )
+    ent.cache_static_attributes = True
+    ent.add_to_platform_start(hass, MagicMock(platform_name="test-platform"), None)
+    ent.registry_entry = entry
+    await ent.add_to_platform_finish()
+
+    state = hass.states.get("hello.world")
+    assert state.state == "first"
+    assert state.attributes["friendly_name"] == "Registry name"
+    assert state.attributes[ATTR_DEVICE_CLASS] == "test_class"
+
+    ent._values["state"] = "second"
+    ent._values["device_class"] = "other_class"
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.state == "second"
+    assert state.attributes[ATTR_DEVICE_CLASS] == "test_class"
+
+    ent.async_invalidate_static_attributes()
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_DEVICE_CLASS] == "other_class"
+
+    registry.async_update_entity("hello.world", name="Renamed")
+    await hass.async_block_till_done()
+    state = hass.states.get("hello.world")
+    assert state.attributes["friendly_name"] == "Renamed"
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues({"hello.world": {"icon": "mdi:test"}})
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes["icon"] == "mdi:test"
+
+
 async def test_warn_slow_write_state(hass, caplog):
     """Check that we log a warning if reading properties takes too long."""
     mock_entity = entity.Entity()
@@ -10,7 +10,7 @@ import voluptuous as vol
 from homeassistant.const import ENTITY_MATCH_ALL, ENTITY_MATCH_NONE
 import homeassistant.core as ha
 from homeassistant.exceptions import PlatformNotReady
-from homeassistant.helpers import discovery
+from homeassistant.helpers import discovery, entity_platform
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -100,7 +100,7 @@ async def test_setup_does_discovery(mock_setup_component, mock_setup, hass):
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_track_point_in_utc_time")
 async def test_set_scan_interval_via_config(mock_track, hass):
     """Test the setting of the scan interval via configuration."""
 
@@ -118,7 +118,8 @@ async def test_set_scan_interval_via_config(mock_track, hass):
 
     await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    first_poll = mock_track.call_args[0][2] - dt_util.utcnow()
+    assert timedelta(0) < first_poll <= timedelta(seconds=30)
 
 
 async def test_set_entity_namespace_via_config(hass):
@@ -14,6 +14,7 @@ from homeassistant.helpers.entity_component import (
     DEFAULT_SCAN_INTERVAL,
     EntityComponent,
 )
+from homeassistant.helpers.event import async_get_timer_stats
 import homeassistant.util.dt as dt_util
 
 from tests.async_mock import Mock, patch
@@ -90,6 +91,103 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_backoff_failing_entity(hass):
+    """Test entities failing repeatedly are polled less often."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    ent = MockEntity(should_poll=True)
+    ent.update = Mock(side_effect=AssertionError("Fake error update"))
+
+    await component.async_add_entities([ent])
+    now = dt_util.utcnow()
+
+    for poll in range(1, 10):
+        async_fire_time_changed(hass, now + timedelta(seconds=20 * poll))
+        await hass.async_block_till_done()
+
+    # The updates after the third failure skip 1, 3 and then 7 polls
+    assert ent.update.call_count == 5
+    stats = entity_platform.async_get_polling_stats(hass)
+    assert len(stats) == 1
+    assert stats[0]["domain"] == DOMAIN
+    assert stats[0]["scan_interval"] == 20
+    assert stats[0]["failures"] == 5
+    assert stats[0]["skipped"] == 4
+
+    ent.update.side_effect = None
+    for poll in range(10, 20):
+        async_fire_time_changed(hass, now + timedelta(seconds=20 * poll))
+        await hass.async_block_till_done()
+
+    assert ent.update.call_count == 8
+
+
+async def test_polling_slow_entity(hass, caplog):
+    """Test entities slower than the scan interval skip the polls they overlap."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    event = asyncio.Event()
+    updates = []
+
+    async def update():
+        """Wait for the event."""
+        updates.append(None)
+        await event.wait()
+
+    slow = MockEntity(should_poll=True)
+    fast = MockEntity(should_poll=True)
+    fast.update = Mock()
+    await component.async_add_entities([slow, fast])
+    slow.async_update = update
+    now = dt_util.utcnow()
+
+    for poll in range(1, 4):
+        async_fire_time_changed(hass, now + timedelta(seconds=20 * poll))
+        await asyncio.sleep(0)
+    event.set()
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, now + timedelta(seconds=80))
+    await hass.async_block_till_done()
+
+    assert len(updates) == 2
+    assert fast.update.call_count == 4
+    stats = entity_platform.async_get_polling_stats(hass)[0]
+    assert stats["polls"] == 6
+    assert stats["overruns"] == 2
+    assert stats["skipped"] == 2
+    assert f"Updating {slow.entity_id} took longer" in caplog.text
+
+
+async def test_polling_staggers_entities(hass):
+    """Test the entities of a platform are polled in phases sharing a timer."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    with patch(
+        "homeassistant.helpers.entity_platform.async_track_point_in_utc_time"
+    ) as mock_track:
+        await component.async_add_entities(
+            [MockEntity(should_poll=True, name=f"ent {idx}") for idx in range(100)]
+        )
+
+    first_polls = {call[0][2] for call in mock_track.call_args_list}
+    assert mock_track.call_count == len(first_polls) == entity_platform.POLLING_PHASES
+
+
+async def test_polling_phase_timer_cancelled(hass):
+    """Test the timer of a phase is cancelled when its entities are removed."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    entities = [MockEntity(should_poll=True, name=f"ent {idx}") for idx in range(3)]
+    await component.async_add_entities(entities)
+    platform = component._platforms[DOMAIN]  # pylint: disable=protected-access
+    assert platform.polling
+
+    for ent in entities:
+        await ent.async_remove()
+
+    assert not platform.polling
+    assert async_get_timer_stats(hass)["timers"] == 0
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -135,7 +233,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_track_point_in_utc_time")
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -154,7 +252,8 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
 
     await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    first_poll = mock_track.call_args[0][2] - dt_util.utcnow()
+    assert timedelta(0) < first_poll <= timedelta(seconds=30)
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
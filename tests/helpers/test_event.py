@@ -14,14 +14,17 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_STATE_CHANGE_DOMAIN_LISTENER,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_timer_stats,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
     async_track_state_added_domain,
     async_track_state_change,
+    async_track_state_change_domain,
     async_track_state_change_event,
     async_track_state_removed_domain,
     async_track_sunrise,
@@ -348,6 +351,59 @@ async def test_async_track_state_change_event(hass):
     unsub_throws()
 
 
+async def test_async_track_state_change_domain(hass):
+    """Test async_track_state_change_domain."""
+    domain_tracker = []
+    all_tracker = []
+
+    @ha.callback
+    def domain_callback(event):
+        domain_tracker.append(event.data["entity_id"])
+
+    @ha.callback
+    def all_callback(event):
+        all_tracker.append(event.data["entity_id"])
+
+    @ha.callback
+    def callback_that_throws(event):
+        raise ValueError
+
+    unsub_domain = async_track_state_change_domain(
+        hass, ["light", "switch"], domain_callback
+    )
+    unsub_all = async_track_state_change_domain(hass, MATCH_ALL, all_callback)
+    unsub_throws = async_track_state_change_domain(hass, "light", callback_that_throws)
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("switch.kitchen", "on")
+    hass.states.async_set("sensor.outside", "20")
+    hass.states.async_remove("light.bowl")
+    await hass.async_block_till_done()
+    assert domain_tracker == [
+        "light.bowl",
+        "light.bowl",
+        "switch.kitchen",
+        "light.bowl",
+    ]
+    assert all_tracker == [
+        "light.bowl",
+        "light.bowl",
+        "switch.kitchen",
+        "sensor.outside",
+        "light.bowl",
+    ]
+
+    unsub_all()
+    hass.states.async_set("sensor.outside", "21")
+    await hass.async_block_till_done()
+    assert len(all_tracker) == 5
+
+    unsub_domain()
+    unsub_throws()
+    assert TRACK_STATE_CHANGE_DOMAIN_LISTENER not in hass.data
+
+
 async def test_async_track_state_added_domain(hass):
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
@@ -1043,16 +1099,21 @@ async def test_track_template_result_and_conditional(hass):
         hass, [TrackTemplate(template, None)], specific_run_callback
     )
     await hass.async_block_till_done()
-    assert info.listeners == {"all": False, "domains": set(), "entities": {"light.a"}}
+    # Both branches of the conditional are tracked
+    assert info.listeners == {
+        "all": False,
+        "domains": set(),
+        "entities": {"light.a", "light.b"},
+    }
 
     hass.states.async_set("light.b", "on")
     await hass.async_block_till_done()
-    assert len(specific_runs) == 0
+    assert specific_runs == ["off"]
 
     hass.states.async_set("light.a", "on")
     await hass.async_block_till_done()
-    assert len(specific_runs) == 1
-    assert specific_runs[0] == "on"
+    assert len(specific_runs) == 2
+    assert specific_runs[1] == "on"
     assert info.listeners == {
         "all": False,
         "domains": set(),
@@ -1061,8 +1122,8 @@ async def test_track_template_result_and_conditional(hass):
 
     hass.states.async_set("light.b", "off")
     await hass.async_block_till_done()
-    assert len(specific_runs) == 2
-    assert specific_runs[1] == "off"
+    assert len(specific_runs) == 3
+    assert specific_runs[2] == "off"
     assert info.listeners == {
         "all": False,
         "domains": set(),
@@ -1071,16 +1132,16 @@ async def test_track_template_result_and_conditional(hass):
 
     hass.states.async_set("light.a", "off")
     await hass.async_block_till_done()
-    assert len(specific_runs) == 2
+    assert len(specific_runs) == 3
 
     hass.states.async_set("light.b", "on")
     await hass.async_block_till_done()
-    assert len(specific_runs) == 2
+    assert len(specific_runs) == 3
 
     hass.states.async_set("light.a", "on")
     await hass.async_block_till_done()
-    assert len(specific_runs) == 3
-    assert specific_runs[2] == "on"
+    assert len(specific_runs) == 4
+    assert specific_runs[3] == "on"
 
 
 async def test_track_template_result_iterator(hass):
@@ -1141,7 +1202,7 @@ async def test_track_template_result_iterator(hass):
     assert info.listeners == {
         "all": False,
         "domains": {"sensor"},
-        "entities": {"sensor.test"},
+        "entities": set(),
     }
 
     hass.states.async_set("sensor.test", 6)
@@ -1156,6 +1217,54 @@ async def test_track_template_result_iterator(hass):
     assert filter_runs == ["", "sensor.new"]
 
 
+async def test_track_template_result_rate_limit(hass):
+    """Test rate limited renders of templates iterating a domain."""
+    runs = []
+
+    @ha.callback
+    def refresh_listener(event, updates):
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template(
+                    "{{ states.sensor | count }} {{ states.light.kitchen.state }}",
+                    hass,
+                ),
+                None,
+                timedelta(seconds=1),
+            )
+        ],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "any")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.two", "any")
+    await hass.async_block_till_done()
+    assert runs == []
+    assert info.rate_limit_stats == {"skipped": 2, "delayed": 1}
+
+    # Referenced entities are not rate limited
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert runs == ["2 on"]
+
+    hass.states.async_set("sensor.three", "any")
+    await hass.async_block_till_done()
+    assert runs == ["2 on"]
+    assert info.rate_limit_stats == {"skipped": 3, "delayed": 2}
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert runs == ["2 on", "3 on"]
+
+    info.async_remove()
+
+
 async def test_track_template_result_errors(hass, caplog):
     """Test tracking template with errors in the template."""
     template_syntax_error = Template("{{states.switch", hass)
@@ -1460,6 +1569,35 @@ async def test_async_track_template_result_multiple_templates_mixing_domain(hass
     ]
 
 
+async def test_async_track_template_result_domain_mixed_with_variables(hass):
+    """Test entities added to a domain are tracked next to templates with variables."""
+    template_1 = Template("{{ states.sensor | map(attribute='state') | list }}")
+    template_2 = Template("{{ states(entity) }}")
+
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(event, updates):
+        refresh_runs.append([update.result for update in updates])
+
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_1, None),
+            TrackTemplate(template_2, {"entity": "switch.test"}),
+        ],
+        refresh_listener,
+    )
+
+    hass.states.async_set("sensor.new", "1")
+    await hass.async_block_till_done()
+    assert refresh_runs == [["['1']"]]
+
+    hass.states.async_set("sensor.new", "2")
+    await hass.async_block_till_done()
+    assert refresh_runs == [["['1']"], ["['2']"]]
+
+
 async def test_track_same_state_simple_no_trigger(hass):
     """Test track_same_change with no trigger."""
     callback_runs = []
@@ -1560,6 +1698,112 @@ async def test_track_time_interval(hass):
     assert len(specific_runs) == 2
 
 
+async def test_time_patterns_share_timer(hass):
+    """Test the time patterns matching the same second share a timer."""
+    runs = []
+    now = dt_util.utcnow()
+    start = datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC)
+
+    with patch("homeassistant.util.dt.utcnow", return_value=start):
+        unsubs = [
+            async_track_utc_time_change(
+                hass, callback(lambda x, idx=idx: runs.append(idx)), second=0
+            )
+            for idx in range(100)
+        ]
+
+    stats = async_get_timer_stats(hass)
+    assert stats["timers"] == 100
+    assert stats["slots"] == 1
+    assert stats["owners"] == {__name__: 100}
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert runs == list(range(100))
+    assert async_get_timer_stats(hass)["slots"] == 1
+
+    for unsub in unsubs:
+        unsub()
+    assert async_get_timer_stats(hass) == {"timers": 0, "slots": 0, "owners": {}}
+
+
+async def test_timer_error_does_not_skip_others(hass, caplog):
+    """Test an error running a timer does not prevent the others of its second."""
+    runs = []
+    point = dt_util.utcnow() + timedelta(seconds=10)
+
+    @callback
+    def failing(now):
+        raise ValueError("Boom")
+
+    async_track_point_in_utc_time(hass, failing, point)
+    async_track_point_in_utc_time(hass, callback(lambda now: runs.append(now)), point)
+    assert async_get_timer_stats(hass)["slots"] == 1
+
+    async_fire_time_changed(hass, point + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [point]
+    assert f"Error running timer of {__name__}" in caplog.text
+
+
+async def test_timer_cancels_timer_of_same_second(hass):
+    """Test a timer cancelling a timer of the same second prevents it running."""
+    runs = []
+    point = dt_util.utcnow() + timedelta(seconds=10)
+
+    @callback
+    def cancel_other(now):
+        runs.append("first")
+        unsub_other()
+
+    async_track_point_in_utc_time(hass, cancel_other, point)
+    unsub_other = async_track_point_in_utc_time(
+        hass, callback(lambda now: runs.append("other")), point
+    )
+
+    async_fire_time_changed(hass, point + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+
+
+async def test_timers_share_one_handle(hass):
+    """Test the timers due at different times share one event loop handle."""
+    runs = []
+    now = dt_util.utcnow()
+    start = datetime(now.year + 1, 5, 24, 12, 0, 0, tzinfo=dt_util.UTC)
+
+    for delay in (2.5, 0.25, 1.75, 0.5):
+        async_track_point_in_utc_time(
+            hass,
+            callback(lambda now, delay=delay: runs.append(delay)),
+            start + timedelta(seconds=delay),
+        )
+
+    assert len([task for task in hass.loop._scheduled if not task.cancelled()]) == 1
+    assert async_get_timer_stats(hass)["slots"] == 3
+
+    async_fire_time_changed(hass, start + timedelta(seconds=0.6))
+    await hass.async_block_till_done()
+    assert runs == [0.25, 0.5]
+    assert async_get_timer_stats(hass)["slots"] == 2
+
+    async_fire_time_changed(hass, start + timedelta(seconds=3))
+    await hass.async_block_till_done()
+    assert runs == [0.25, 0.5, 1.75, 2.5]
+    assert async_get_timer_stats(hass) == {"timers": 0, "slots": 0, "owners": {}}
+
+
+async def test_timer_owner_of_wrapped_actions(hass):
+    """Test the timers of wrapped actions are owned by the module of the action."""
+    now = dt_util.utcnow()
+    async_track_time_interval(hass, lambda now: None, timedelta(seconds=10))
+    async_track_point_in_time(hass, lambda now: None, now + timedelta(seconds=10))
+
+    assert async_get_timer_stats(hass)["owners"] == {__name__: 2}
+
+
 async def test_track_sunrise(hass, legacy_patchable_time):
     """Test track the sunrise."""
     latitude = 32.87336
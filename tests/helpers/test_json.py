@@ -1,8 +1,16 @@
 """Test Home Assistant remote methods and classes."""
+import json
+
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import (
+    JSONEncoder,
+    json_dumps,
+    json_fragments_list,
+    orjson_dumps,
+    set_json_backend,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -19,3 +27,37 @@ def test_json_encoder(hass):
 
     now = dt_util.utcnow()
     assert ha_json_enc.default(now) == now.isoformat()
+
+
+def test_json_backend():
+    """Test replacing the backend of json_dumps."""
+    assert json_dumps({"a": {1, 2}}) == '{"a": [1, 2]}'
+
+    with pytest.raises(ValueError):
+        json_dumps(float("nan"))
+
+    set_json_backend(lambda data: "backend")
+    try:
+        assert json_dumps({"a": 1}) == "backend"
+    finally:
+        set_json_backend(None)
+
+    assert json_dumps({"a": 1}) == '{"a": 1}'
+
+
+def test_orjson_dumps():
+    """Test the orjson backend supports Home Assistant objects."""
+    pytest.importorskip("orjson")
+    state = core.State("test.test", "hello", {"list": {1}})
+
+    assert json.loads(orjson_dumps(state)) == json.loads(json_dumps(state))
+    assert orjson_dumps({1: float("nan")}) == '{"1":null}'
+
+    with pytest.raises(TypeError):
+        orjson_dumps(object())
+
+
+def test_json_fragments_list():
+    """Test building the JSON of a list from the JSON of its items."""
+    assert json_fragments_list([]) == "[]"
+    assert json.loads(json_fragments_list(['{"a": 1}', "2"])) == [{"a": 1}, 2]
@@ -1,5 +1,6 @@
 """The tests for the Restore component."""
-from datetime import datetime
+from datetime import datetime, timedelta
+import gc
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import CoreState, State
@@ -7,6 +8,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
+    FULL_DUMP_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -272,3 +274,151 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_dump_changed_states(hass, hass_storage):
+    """Test only the states changed since the last dump are journaled."""
+    data = await RestoreStateData.async_get_instance(hass)
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity_id, "on")
+
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 2
+    assert f"{STORAGE_KEY}.journal" not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_changed_states()
+    journal = hass_storage[f"{STORAGE_KEY}.journal"]
+    assert len(journal) == 2
+    assert journal[0]["state"]["entity_id"] == "input_boolean.b1"
+    assert journal[0]["state"]["state"] == "off"
+    assert "last_seen" not in journal[0]
+    assert journal[1].keys() == {"dumped"}
+
+    # Removed entities keep their last state
+    await entity.async_remove()
+    await data.async_dump_changed_states()
+    journal = hass_storage[f"{STORAGE_KEY}.journal"]
+    assert len(journal) == 4
+    assert journal[2]["state"]["entity_id"] == "input_boolean.b1"
+    assert "last_seen" in journal[2]
+
+    # Compacting the journal into a full dump removes it
+    with patch("homeassistant.helpers.restore_state.JOURNAL_COMPACT_MIN_ENTRIES", 0):
+        await data.async_dump_changed_states()
+    assert f"{STORAGE_KEY}.journal" not in hass_storage
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "on",
+        "off",
+    ]
+
+
+async def test_dump_changed_states_no_state_references(hass, hass_storage):
+    """Test the last dump doesn't keep the dumped states alive."""
+    data = await RestoreStateData.async_get_instance(hass)
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b0", "on")
+
+    await data.async_dump_states()
+    state = hass.states.get("input_boolean.b0")
+    assert not any(referrer is data._dumped for referrer in gc.get_referrers(state))
+
+    # The same state is not journaled again
+    await data.async_dump_changed_states()
+    journal = hass_storage[f"{STORAGE_KEY}.journal"]
+    assert journal[0].keys() == {"dumped"}
+
+
+async def test_dump_changed_states_full_dump_interval(hass, hass_storage):
+    """Test a full dump refreshes the last seen of unchanged states."""
+    data = await RestoreStateData.async_get_instance(hass)
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b0", "on")
+
+    await data.async_dump_states()
+    last_seen = hass_storage[STORAGE_KEY]["data"][0]["last_seen"]
+
+    await data.async_dump_changed_states()
+    assert f"{STORAGE_KEY}.journal" in hass_storage
+
+    later = dt_util.utcnow() + FULL_DUMP_INTERVAL
+    with patch("homeassistant.util.dt.utcnow", return_value=later):
+        await data.async_dump_changed_states()
+    assert f"{STORAGE_KEY}.journal" not in hass_storage
+    assert hass_storage[STORAGE_KEY]["data"][0]["last_seen"] == later.isoformat()
+    assert last_seen != later.isoformat()
+
+
+async def test_load_journal(hass, hass_storage):
+    """Test the journal is applied to the states of the full dump."""
+    dumped = dt_util.utcnow() - timedelta(minutes=15)
+    last_dumped = dt_util.utcnow()
+    old = dumped - timedelta(minutes=15)
+
+    def stored_state(entity_id, state, last_seen):
+        return {
+            "state": State(entity_id, state).as_dict(),
+            "last_seen": last_seen.isoformat(),
+        }
+
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            stored_state("input_boolean.b0", "on", old),
+            stored_state("input_boolean.b1", "on", old),
+            stored_state("input_boolean.b2", "on", old),
+            # Dumped after the journal, its entries are left from before
+            stored_state("input_boolean.b3", "on", last_dumped),
+        ],
+    }
+    hass_storage[f"{STORAGE_KEY}.journal"] = [
+        {
+            "state": State("input_boolean.b1", "off").as_dict(),
+            "dumped": dumped.isoformat(),
+        },
+        {"removed": "input_boolean.b2", "dumped": dumped.isoformat()},
+        {
+            "state": State("input_boolean.b3", "off").as_dict(),
+            "dumped": dumped.isoformat(),
+        },
+        {
+            **stored_state("input_boolean.b4", "on", dumped),
+            "dumped": dumped.isoformat(),
+        },
+        {"dumped": dumped.isoformat()},
+        {
+            "state": State("input_boolean.b1", "unknown").as_dict(),
+            "dumped": last_dumped.isoformat(),
+        },
+        {"dumped": last_dumped.isoformat()},
+    ]
+
+    with patch.object(State, "from_dict", wraps=State.from_dict) as mock_from_dict:
+        data = await RestoreStateData.async_get_instance(hass)
+        # The states are parsed on first access
+        assert not mock_from_dict.called
+
+    assert set(data.last_states) == {
+        "input_boolean.b0",
+        "input_boolean.b1",
+        "input_boolean.b3",
+        "input_boolean.b4",
+    }
+    assert data.last_states["input_boolean.b0"].state.state == "on"
+    assert data.last_states["input_boolean.b0"].last_seen == old
+    assert data.last_states["input_boolean.b1"].state.state == "unknown"
+    assert data.last_states["input_boolean.b1"].last_seen == last_dumped
+    assert data.last_states["input_boolean.b3"].state.state == "on"
+    assert data.last_states["input_boolean.b4"].state.state == "on"
+    assert data.last_states["input_boolean.b4"].last_seen == dumped
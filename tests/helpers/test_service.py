@@ -315,6 +315,32 @@ async def test_extract_entity_ids_from_area(hass, area_mock):
     )
 
 
+async def test_extract_entity_ids_from_area_cached(hass, area_mock):
+    """Test the entities of an area are cached until a registry is updated."""
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "test-area"})
+    registry = await dev_reg.async_get_registry(hass)
+
+    with patch(
+        "homeassistant.helpers.device_registry.async_entries_for_area",
+        wraps=dev_reg.async_entries_for_area,
+    ) as mock_entries_for_area:
+        assert {"light.in_area"} == await service.async_extract_entity_ids(hass, call)
+        assert {"light.in_area"} == await service.async_extract_entity_ids(hass, call)
+        assert len(mock_entries_for_area.mock_calls) == 1
+
+        device = next(
+            device for device in registry.devices.values() if device.area_id is None
+        )
+        registry.async_update_device(device.id, area_id="test-area")
+        await hass.async_block_till_done()
+
+        assert {
+            "light.in_area",
+            "light.no_area",
+        } == await service.async_extract_entity_ids(hass, call)
+        assert len(mock_entries_for_area.mock_calls) == 2
+
+
 async def test_async_get_all_descriptions(hass):
     """Test async_get_all_descriptions."""
     group = hass.components.group
@@ -408,6 +434,26 @@ async def test_call_with_sync_func(hass, mock_entities):
     assert test_service_mock.call_count == 1
 
 
+async def test_call_in_platform_order(hass, mock_entities):
+    """Test the targeted entities are called in the order of the platform."""
+    test_service_mock = Mock(return_value=None)
+    await service.entity_service_call(
+        hass,
+        [Mock(entities=mock_entities)],
+        test_service_mock,
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.bathroom", "light.kitchen", "light.bedroom"]},
+        ),
+    )
+    assert [call[0][0] for call in test_service_mock.call_args_list] == [
+        mock_entities["light.kitchen"],
+        mock_entities["light.bedroom"],
+        mock_entities["light.bathroom"],
+    ]
+
+
 async def test_call_with_sync_attr(hass, mock_entities):
     """Test invoking sync service calls."""
     mock_method = mock_entities["light.kitchen"].sync_method = Mock(return_value=None)
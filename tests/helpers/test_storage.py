@@ -11,7 +11,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import CoreState
 from homeassistant.helpers import storage
-from homeassistant.util import dt
+from homeassistant.util import dt, json as json_util
 
 from tests.async_mock import Mock, patch
 from tests.common import async_fire_time_changed
@@ -236,3 +236,70 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+async def test_coalescing_delayed_writes(hass, hass_storage):
+    """Test delayed writes due soon are written with an earlier write."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store2 = storage.Store(hass, MOCK_VERSION, "storage-test-2")
+    store3 = storage.Store(hass, MOCK_VERSION, "storage-test-3")
+    store.async_delay_save(lambda: MOCK_DATA, 1)
+    store2.async_delay_save(lambda: MOCK_DATA2, 1.5)
+    store3.async_delay_save(lambda: MOCK_DATA2, 10)
+
+    # Only the timers run at the mocked time, the window needs to cover it
+    with patch.object(storage, "WRITE_COALESCE_WINDOW", 2), patch.object(
+        storage.StoreWriter, "_write", wraps=storage.StoreWriter._write
+    ) as mock_write:
+        async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert len(mock_write.mock_calls) == 1
+    assert hass_storage[store.key]["data"] == MOCK_DATA
+    assert hass_storage[store2.key]["data"] == MOCK_DATA2
+    assert store3.key not in hass_storage
+
+    # The delayed write of the second store was consumed
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert store3.key not in hass_storage
+
+    metrics = storage.async_get_writer(hass).metrics
+    assert metrics[store.key]["writes"] == 1
+    assert metrics[store2.key]["writes"] == 1
+    assert store3.key not in metrics
+
+
+async def test_coalescing_final_write(hass, hass_storage):
+    """Test the final write writes all stores in a single job."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store2 = storage.Store(hass, MOCK_VERSION, "storage-test-2")
+    store.async_delay_save(lambda: MOCK_DATA, 5)
+    store2.async_delay_save(lambda: MOCK_DATA2, 10)
+
+    hass.state = CoreState.stopping
+    with patch.object(
+        storage.StoreWriter, "_write", wraps=storage.StoreWriter._write
+    ) as mock_write:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    assert len(mock_write.mock_calls) == 1
+    assert hass_storage[store.key]["data"] == MOCK_DATA
+    assert hass_storage[store2.key]["data"] == MOCK_DATA2
+
+
+async def test_write_error(hass, hass_storage, caplog):
+    """Test a write error is logged and doesn't fail the other writes."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store2 = storage.Store(hass, MOCK_VERSION, "storage-test-2")
+    store.async_delay_save(lambda: MOCK_DATA, 1)
+
+    with patch.object(
+        store, "_write_data", side_effect=json_util.WriteError("Disk full")
+    ):
+        await store2.async_save(MOCK_DATA2)
+
+    assert "Error writing config for storage-test: Disk full" in caplog.text
+    assert store.key not in hass_storage
+    assert hass_storage[store2.key]["data"] == MOCK_DATA2
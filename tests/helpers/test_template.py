@@ -1,5 +1,5 @@
 """Test Home Assistant template helper methods."""
-from datetime import datetime
+from datetime import datetime, timedelta
 import math
 import random
 
@@ -22,6 +22,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import UnitSystem
 
 from tests.async_mock import Mock, patch
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture()
@@ -2359,6 +2360,113 @@ async def test_cache_garbage_collection():
     )  # pylint: disable=protected-access
 
 
+async def test_bytecode_cache(hass, hass_storage):
+    """Test the compiled templates are stored across restarts."""
+    # The first template compiled loads the stored code
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == "2"
+    await hass.async_block_till_done()
+    tpl = template.Template("{{ 2 + 2 }}", hass)
+    assert tpl.async_render() == "4"
+    assert template.async_get_bytecode_cache_stats(hass) == {
+        "hits": 0,
+        "misses": 2,
+        "stored": 0,
+        "used": 2,
+    }
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_STORAGE_KEY]["data"]
+    assert stored["tag"] == template.BYTECODE_TAG
+    assert len(stored["templates"]) == 2
+
+    # Restart with the stored templates
+    hass.data.pop(template._ENVIRONMENT)  # pylint: disable=protected-access
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == "2"
+    await hass.async_block_till_done()
+    tpl = template.Template("{{ 2 + 2 }}", hass)
+    assert tpl.async_render() == "4"
+    assert template.async_get_bytecode_cache_stats(hass) == {
+        "hits": 1,
+        "misses": 1,
+        "stored": 2,
+        "used": 2,
+    }
+
+    # Templates compiled with other filters don't use the stored code
+    env = hass.data[template._ENVIRONMENT]  # pylint: disable=protected-access
+    env.filters["double"] = lambda value: value * 2
+    tpl = template.Template("{{ 2 + 2 }}", hass)
+    assert tpl.async_render() == "4"
+    assert template.async_get_bytecode_cache_stats(hass)["misses"] == 2
+
+
+async def test_bytecode_cache_saved_once(hass, hass_storage):
+    """Test the cache is saved once for the templates compiled in a batch."""
+    cache = template.TemplateBytecodeCache(hass)
+    await cache.async_load()
+    code = compile("1", "<template>", "eval")
+
+    with patch.object(hass, "add_job") as mock_add_job:
+        await hass.async_add_executor_job(cache.set, "one", code)
+        cache.set("two", code)
+
+    assert mock_add_job.call_count == 1
+    mock_add_job.call_args[0][0]()
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_STORAGE_KEY]["data"]
+    assert set(stored["templates"]) == {"one", "two"}
+
+
+async def test_bytecode_cache_other_version(hass, hass_storage):
+    """Test the templates compiled by another version are not used."""
+    hass_storage[template.BYTECODE_STORAGE_KEY] = {
+        "version": template.BYTECODE_STORAGE_VERSION,
+        "key": template.BYTECODE_STORAGE_KEY,
+        "data": {"tag": "other", "templates": {"key": "invalid"}},
+    }
+    cache = template.TemplateBytecodeCache(hass)
+    await cache.async_load()
+    assert cache.get("key") is None
+
+
+async def test_static_render_info(hass):
+    """Test finding the states a template reads without rendering it."""
+
+    def static_info(template_str):
+        info = template.Template(template_str, hass).async_static_render_info()
+        if info is None:
+            return None
+        return info.all_states, info.domains, info.entities
+
+    assert static_info(
+        "{% if is_state('switch.Test', 'on') %}{{ states.sensor.a.state }}"
+        "{% else %}{{ state_attr('sensor.b', 'unit') }}{% endif %}"
+    ) == (False, set(), {"switch.test", "sensor.a", "sensor.b"})
+    assert static_info(
+        "{{ states['light.a'].state }} {{ states('sensor.c') }}"
+        "{% for state in states.lock %}{{ state.state }}{% endfor %}"
+    ) == (False, {"lock"}, {"light.a", "sensor.c"})
+    assert static_info("{{ states | count }}") == (True, set(), set())
+    assert static_info("{{ states.sensor[name] }}") == (False, {"sensor"}, set())
+
+    # Reading states that depend on the render
+    assert static_info("{{ states(entity_id) }}") is None
+    assert static_info("{{ expand('group.all') | count }}") is None
+    assert static_info("{% set states = [] %}{{ states }}") is None
+    assert static_info("{{ is_state }}") is None
+    assert static_info("Static") is None
+
+
 def test_is_template_string():
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
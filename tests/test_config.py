@@ -459,6 +459,21 @@ async def test_loading_configuration(hass):
     assert hass.config.config_source == config_util.SOURCE_YAML
 
 
+async def test_loading_configuration_executor_pools(hass):
+    """Test sizing the executor pools from the core config."""
+    await config_util.async_process_ha_core_config(
+        hass, {"executor_pools": {"storage": 2}}
+    )
+
+    await hass.async_add_executor_job(lambda: None, pool="storage")
+    assert hass.async_get_executor_stats()["storage"]["max_workers"] == 2
+
+    with pytest.raises(vol.Invalid):
+        await config_util.async_process_ha_core_config(
+            hass, {"executor_pools": {"unknown": 2}}
+        )
+
+
 async def test_loading_configuration_temperature_unit(hass):
     """Test backward compatibility when loading core config."""
     await config_util.async_process_ha_core_config(
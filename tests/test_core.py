@@ -3,9 +3,11 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
+import threading
 import unittest
 
 import pytest
@@ -34,7 +36,10 @@ from homeassistant.const import (
 )
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError, InvalidStateError
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import InstrumentedThreadPoolExecutor
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from tests.async_mock import MagicMock, Mock, PropertyMock, patch
@@ -214,6 +219,46 @@ async def test_async_add_job_pending_tasks_coro(hass):
     assert len(call_count) == 2
 
 
+async def test_async_add_executor_job_pool(hass):
+    """Test running executor jobs in named executor pools."""
+    thread_name = await hass.async_add_executor_job(
+        lambda: threading.current_thread().name, pool=ha.POOL_STORAGE
+    )
+    assert thread_name.startswith("StorageWorker")
+    assert hass.async_get_executor_stats()[ha.POOL_STORAGE]["completed"] == 1
+
+    hass.async_set_executor_pool_size(ha.POOL_STORAGE, 8)
+    assert ha.POOL_STORAGE not in hass.async_get_executor_stats()
+    await hass.async_add_executor_job(lambda: None, pool=ha.POOL_STORAGE)
+    assert hass.async_get_executor_stats()[ha.POOL_STORAGE]["max_workers"] == 8
+
+    with pytest.raises(ValueError):
+        hass.async_add_executor_job(lambda: None, pool="unknown")
+
+
+async def test_default_executor_stats(hass):
+    """Test the load of the default executor instrumented by the runner."""
+    assert isinstance(hass.loop._default_executor, InstrumentedThreadPoolExecutor)
+    await hass.async_add_executor_job(lambda: None)
+    assert hass.async_get_executor_stats()[ha.POOL_DEFAULT]["completed"] >= 1
+
+
+def test_stop_executor_pool_timeout(caplog):
+    """Test stopping doesn't wait forever for the jobs of an executor pool."""
+    hass = get_test_home_assistant()
+    release = threading.Event()
+    run_callback_threadsafe(
+        hass.loop, hass._async_get_executor_pool, ha.POOL_IO
+    ).result().submit(release.wait)
+
+    with patch.object(ha, "EXECUTOR_SHUTDOWN_TIMEOUT", 0.1):
+        hass.stop()
+    release.set()
+
+    assert hass.state == ha.CoreState.stopped
+    assert "Timed out waiting for the executor pools to shut down" in caplog.text
+
+
 async def test_async_add_job_pending_tasks_executor(hass):
     """Run an executor in pending tasks."""
     call_count = []
@@ -268,6 +313,36 @@ async def test_add_job_with_none(hass):
         hass.async_add_job(None, "test_arg")
 
 
+def test_hassjob_job_type():
+    """Test the job type of a HassJob is determined in advance."""
+
+    @ha.callback
+    def callback_func():
+        """Test callback."""
+
+    async def coroutine_func():
+        """Test coroutine function."""
+
+    def executor_func():
+        """Test executor function."""
+
+    assert ha.HassJob(callback_func).job_type == ha.HassJobType.Callback
+    assert (
+        ha.HassJob(functools.partial(callback_func)).job_type == ha.HassJobType.Callback
+    )
+    assert ha.HassJob(coroutine_func).job_type == ha.HassJobType.Coroutinefunction
+    assert (
+        ha.HassJob(functools.partial(coroutine_func)).job_type
+        == ha.HassJobType.Coroutinefunction
+    )
+    assert ha.HassJob(executor_func).job_type == ha.HassJobType.Executor
+
+    coro = coroutine_func()
+    with pytest.raises(ValueError):
+        ha.HassJob(coro)
+    coro.close()
+
+
 class TestEvent(unittest.TestCase):
     """A Test Event class."""
 
@@ -312,6 +387,15 @@ class TestEvent(unittest.TestCase):
         }
         assert expected == event.as_dict()
 
+    def test_as_json(self):
+        """Test the JSON of the event is serialized once."""
+        event = ha.Event("some_type", {"some": "attr"})
+
+        assert json.loads(event.as_json()) == json.loads(json_dumps(event.as_dict()))
+        with patch("homeassistant.core.json_dumps") as mock_dumps:
+            assert event.as_json() is event.as_json()
+        assert not mock_dumps.called
+
 
 class TestEventBus(unittest.TestCase):
     """Test EventBus methods."""
@@ -456,6 +540,45 @@ class TestEventBus(unittest.TestCase):
         assert len(coroutine_calls) == 1
 
 
+async def test_merged_listeners_updated_on_subscribe(hass):
+    """Test the cached MATCH_ALL listeners follow (un)subscribes."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Record the listener and event type."""
+        calls.append(("listener", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Record the match all listener and event type."""
+        calls.append(("match_all", event.event_type))
+
+    unsub = hass.bus.async_listen("test_event", listener)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert calls == [("listener", "test_event")]
+
+    calls.clear()
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert calls == [("match_all", "test_event"), ("listener", "test_event")]
+
+    calls.clear()
+    unsub()
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert calls == [("match_all", "test_event")]
+
+    calls.clear()
+    unsub_match_all()
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert calls == []
+
+
 def test_state_init():
     """Test state.init."""
     with pytest.raises(InvalidEntityFormatError):
@@ -496,6 +619,13 @@ def test_state_dict_conversion():
     assert state == ha.State.from_dict(state.as_dict())
 
 
+def test_state_as_json():
+    """Test the JSON of the state."""
+    state = ha.State("domain.hello", "world", {"some": "attr"})
+
+    assert state == ha.State.from_dict(json.loads(state.as_json()))
+
+
 def test_state_dict_conversion_with_wrong_data():
     """Test conversion with wrong data."""
     assert ha.State.from_dict(None) is None
@@ -646,6 +776,19 @@ class TestStateMachine(unittest.TestCase):
         self.hass.block_till_done()
         assert len(events) == 1
 
+    def test_unchanged_attributes_are_shared(self):
+        """Test the attributes are shared with the old state when unchanged."""
+        self.states.set("light.bowl", "on", {"brightness": 100})
+        old_state = self.states.get("light.bowl")
+
+        self.states.set("light.bowl", "off", {"brightness": 100})
+        new_state = self.states.get("light.bowl")
+        assert new_state.state == "off"
+        assert new_state.attributes is old_state.attributes
+
+        self.states.set("light.bowl", "off", {"brightness": 50})
+        assert self.states.get("light.bowl").attributes == {"brightness": 50}
+
 
 def test_service_call_repr():
     """Test ServiceCall repr."""
@@ -375,3 +375,36 @@ async def test_get_custom_components_safe_mode(hass):
     """Test that we get empty custom components in safe mode."""
     hass.config.safe_mode = True
     assert await loader.async_get_custom_components(hass) == {}
+
+
+async def test_get_integration_from_manifest_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    index = {"hue": {"domain": "hue", "name": "Indexed Hue", "requirements": []}}
+    with patch(
+        "homeassistant.loader._load_manifest_index", return_value=(index, 2 ** 40)
+    ):
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert integration.name == "Indexed Hue"
+    assert integration.is_built_in
+    assert integration.get_component() is hue
+
+
+async def test_get_integration_stale_manifest_index(hass):
+    """Test the manifest file is read when modified after the index."""
+    index = {"hue": {"domain": "hue", "name": "Indexed Hue", "requirements": []}}
+    with patch("homeassistant.loader._load_manifest_index", return_value=(index, 0)):
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert integration.name == "Philips Hue"
+
+
+async def test_get_integrations_with_dependencies(hass):
+    """Test getting integrations resolves their dependencies too."""
+    integrations = await loader.async_get_integrations(hass, ["cloud", "non_existing"])
+
+    assert list(integrations) == ["cloud"]
+    cache = hass.data[loader.DATA_INTEGRATIONS]
+    assert "http" in cache
+    assert "webhook" in cache
+    assert "non_existing" not in cache
@@ -0,0 +1,68 @@
+"""Test the instrumented executor."""
+from functools import partial
+import threading
+
+from homeassistant.components.sun import async_setup
+from homeassistant.util.executor import (
+    InstrumentedThreadPoolExecutor,
+    job_owner,
+    shutdown_executor,
+)
+
+
+def test_job_owner():
+    """Test jobs are attributed to the integration or module of their code."""
+    assert job_owner(async_setup) == "sun"
+    assert job_owner(partial(partial(async_setup, None))) == "sun"
+    assert job_owner(test_job_owner) == __name__
+
+
+def test_stats():
+    """Test the queue depth and the time spent by owner are recorded."""
+    executor = InstrumentedThreadPoolExecutor(1)
+    release = threading.Event()
+    try:
+        running = executor.submit(release.wait)
+        queued = executor.submit(lambda: None)
+
+        stats = executor.stats()
+        assert stats["max_workers"] == 1
+        assert stats["queued"] + stats["running"] == 2
+    finally:
+        release.set()
+    running.result()
+    queued.result()
+    executor.shutdown()
+
+    stats = executor.stats()
+    assert stats["queued"] == 0
+    assert stats["running"] == 0
+    assert stats["completed"] == 2
+    assert stats["wait_time_max"] >= stats["wait_time_avg"] >= 0
+    assert set(stats["run_time"]) == {"threading", __name__}
+
+
+def test_failing_job_is_recorded():
+    """Test jobs raising are recorded as completed."""
+    executor = InstrumentedThreadPoolExecutor(1)
+
+    def fail():
+        raise ValueError
+
+    future = executor.submit(fail)
+    executor.shutdown()
+
+    assert isinstance(future.exception(), ValueError)
+    assert executor.stats()["completed"] == 1
+
+
+def test_shutdown_executor_timeout():
+    """Test shutting down an executor doesn't wait past the timeout."""
+    executor = InstrumentedThreadPoolExecutor(1)
+    release = threading.Event()
+    executor.submit(release.wait)
+    try:
+        assert not shutdown_executor(executor, 0.1)
+    finally:
+        release.set()
+    assert shutdown_executor(executor, 10)
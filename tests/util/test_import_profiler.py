@@ -0,0 +1,44 @@
+"""Test the import profiler."""
+import importlib
+import sys
+
+import pytest
+
+from homeassistant.util.import_profiler import ImportProfiler
+
+
+@pytest.fixture
+def modules_path(tmp_path):
+    """Create modules importing each other in a path added to sys.path."""
+    (tmp_path / "profiled_outer.py").write_text(
+        "import time\nimport profiled_inner\ntime.sleep(0.02)\n"
+    )
+    (tmp_path / "profiled_inner.py").write_text("import time\ntime.sleep(0.05)\n")
+    sys.path.insert(0, str(tmp_path))
+    yield tmp_path
+    sys.path.remove(str(tmp_path))
+    sys.modules.pop("profiled_outer", None)
+    sys.modules.pop("profiled_inner", None)
+
+
+def test_profile_imports(modules_path):
+    """Test the own and cumulative time of the modules imported are recorded."""
+    profiler = ImportProfiler()
+    profiler.start()
+    try:
+        importlib.import_module("profiled_outer")
+    finally:
+        profiler.stop()
+
+    assert profiler not in sys.meta_path
+    outer_cumulative, outer_own = profiler.timings["profiled_outer"]
+    inner_cumulative, inner_own = profiler.timings["profiled_inner"]
+    assert inner_cumulative == inner_own >= 0.05
+    assert outer_cumulative == pytest.approx(outer_own + inner_cumulative)
+    assert 0.02 <= outer_own < 0.05
+
+    report_path = modules_path / "report.txt"
+    profiler.write_report(str(report_path), limit=1)
+    lines = report_path.read_text().splitlines()
+    assert lines[0].startswith("Imported 2 modules in")
+    assert lines[-1].endswith("  profiled_inner")
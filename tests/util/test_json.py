@@ -1,6 +1,7 @@
 """Test Home Assistant json utility functions."""
 from datetime import datetime
 from functools import partial
+import gzip
 from json import JSONEncoder, dumps
 import math
 import os
@@ -19,7 +20,7 @@ from homeassistant.util.json import (
     save_json,
 )
 
-from tests.async_mock import Mock
+from tests.async_mock import Mock, patch
 
 # Test data that can be saved as JSON
 TEST_JSON_A = {"a": 1, "B": "two"}
@@ -77,6 +78,35 @@ def test_overwrite_and_reload():
     assert data == TEST_JSON_B
 
 
+def test_save_compact_and_compressed(tmp_path):
+    """Test saving minified and compressed JSON and loading it back."""
+    fname = str(tmp_path / "test.json")
+    indented = save_json(fname, TEST_JSON_A)
+    assert indented == os.path.getsize(fname)
+
+    compact = save_json(fname, TEST_JSON_A, compact=True)
+    with open(fname, encoding="utf-8") as fdesc:
+        assert fdesc.read() == '{"a":1,"B":"two"}'
+    assert compact == os.path.getsize(fname) < indented
+    assert load_json(fname) == TEST_JSON_A
+
+    save_json(fname, TEST_JSON_B, compress=True)
+    with open(fname, "rb") as fdesc:
+        assert gzip.decompress(fdesc.read()) == b'{"a":"one","B":2}'
+    assert load_json(fname) == TEST_JSON_B
+
+
+def test_save_syncs_to_disk(tmp_path):
+    """Test the new content is synced to disk before replacing the file."""
+    fname = str(tmp_path / "test.json")
+    with patch("os.fsync") as mock_fsync:
+        save_json(fname, TEST_JSON_A)
+
+    # The temporary file and the directory holding the renamed file
+    assert len(mock_fsync.mock_calls) == 2
+    assert load_json(fname) == TEST_JSON_A
+
+
 def test_save_bad_data():
     """Test error from trying to save unserialisable data."""
     with pytest.raises(SerializationError) as excinfo:
@@ -274,6 +274,83 @@ def test_load_yaml_encoding_error(mock_open):
         yaml_loader.load_yaml("test")
 
 
+def test_load_yaml_cached():
+    """Test files with the same content are parsed once."""
+    yaml_loader.clear_yaml_cache()
+    files = {"/test/cached.yaml": "key:\n  - one\n  - two"}
+    with patch_yaml_files(files):
+        first = yaml_loader.load_yaml("/test/cached.yaml")
+        with patch.object(
+            yaml_loader, "FastSafeLoader", wraps=yaml_loader.FastSafeLoader
+        ) as mock_loader:
+            second = yaml_loader.load_yaml("/test/cached.yaml")
+            second["key"].append("three")
+            third = yaml_loader.load_yaml("/test/cached.yaml")
+
+            assert not mock_loader.called
+
+            files["/test/cached.yaml"] = "key:\n  - four"
+            assert yaml_loader.load_yaml("/test/cached.yaml") == {"key": ["four"]}
+            assert mock_loader.called
+
+    assert first == third == {"key": ["one", "two"]}
+    assert second is not first
+    assert second["key"].__config_file__ == "/test/cached.yaml"
+    assert second["key"].__line__ == 1
+
+
+def test_load_yaml_cache_evicts_least_recently_used():
+    """Test the cache keeps the most recently used files."""
+    yaml_loader.clear_yaml_cache()
+    files = {f"/test/{name}.yaml": f"key: {name}" for name in ("one", "two", "three")}
+    with patch_yaml_files(files), patch.object(yaml_loader, "YAML_CACHE_SIZE", 2):
+        yaml_loader.load_yaml("/test/one.yaml")
+        yaml_loader.load_yaml("/test/two.yaml")
+        yaml_loader.load_yaml("/test/one.yaml")
+        yaml_loader.load_yaml("/test/three.yaml")
+        with patch.object(
+            yaml_loader, "FastSafeLoader", wraps=yaml_loader.FastSafeLoader
+        ) as mock_loader:
+            assert yaml_loader.load_yaml("/test/one.yaml") == {"key": "one"}
+            assert yaml_loader.load_yaml("/test/three.yaml") == {"key": "three"}
+            assert not mock_loader.called
+
+            assert yaml_loader.load_yaml("/test/two.yaml") == {"key": "two"}
+            assert mock_loader.called
+
+
+@patch("homeassistant.util.yaml.loader.os.walk")
+def test_include_dirs_share_pool(mock_walk):
+    """Test the include directories of a load share one pool of workers."""
+    mock_walk.side_effect = lambda path, topdown: [[path, [], ["one.yaml", "two.yaml"]]]
+    files = {
+        "/test/configuration.yaml": "a: !include_dir_list a\nb: !include_dir_list b",
+        "/test/a/one.yaml": "one",
+        "/test/a/two.yaml": "two",
+        "/test/b/one.yaml": "three",
+        "/test/b/two.yaml": "four",
+    }
+    with patch_yaml_files(files), patch.object(
+        yaml_loader, "ThreadPoolExecutor", wraps=yaml_loader.ThreadPoolExecutor
+    ) as mock_pool:
+        assert yaml_loader.load_yaml("/test/configuration.yaml") == {
+            "a": ["one", "two"],
+            "b": ["three", "four"],
+        }
+
+    assert mock_pool.call_count == 1
+    assert yaml_loader._LOAD.pool is None  # pylint: disable=protected-access
+
+
+def test_load_yaml_not_cached_with_tags():
+    """Test files with tags depending on more than their content are not cached."""
+    yaml_loader.clear_yaml_cache()
+    with patch_yaml_files({"/test/env.yaml": "key: !env_var TEST_VAR default"}):
+        assert yaml_loader.load_yaml("/test/env.yaml") == {"key": "default"}
+        with patch.dict(os.environ, {"TEST_VAR": "value"}):
+            assert yaml_loader.load_yaml("/test/env.yaml") == {"key": "value"}
+
+
 def test_dump():
     """The that the dump method returns empty None values."""
     assert yaml.dump({"a": None, "b": "b"}) == "a:\nb: b\n"